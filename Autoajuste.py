@@ -0,0 +1,285 @@
+import hashlib
+import itertools
+import json
+import math
+import os
+import statistics
+
+from Resultados import machine_id
+
+# Autoajuste por máquina de los parámetros de los algoritmos (min_run, cutoff,
+# pivote, aridad del heap, ...). `python Autoajuste.py` busca la mejor
+# configuración para cada (algoritmo, dtype, banda de tamaños) con
+# successive halving y la guarda en PROFILE_PATH. Al importar este módulo (lo
+# importan los propios algoritmos) se carga el perfil de esta máquina, y los
+# parámetros que el llamador deja en None se toman de él; sin perfil, o fuera
+# de las bandas ajustadas, se usan los valores por defecto de cada algoritmo.
+
+# Perfil junto al código: se carga al importar, sea cual sea el directorio actual
+PROFILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perfil_ajuste.json")
+
+# Bandas de tamaño: (límite superior exclusivo, nombre, tamaño representativo)
+BANDS = (
+    (1 << 10, "small", 256),
+    (1 << 16, "medium", 8192),
+    (math.inf, "large", 131072),
+)
+
+DTYPES = ("int64", "float64")
+
+# Distribuciones sobre las que se promedia (media geométrica de los tiempos)
+SHAPES = ("random", "nearly_sorted", "few_unique", "reversed")
+
+# Espacio de búsqueda de cada algoritmo
+_CUTOFFS = [1, 4, 8, 12, 16, 24, 32, 48, 64]
+SPACES = {
+    "tim_sort": {"min_run": [8, 16, 24, 32, 48, 64]},
+    "merge_sort": {"cutoff": _CUTOFFS},
+    "merge_sort_buffer": {"cutoff": _CUTOFFS},
+    "merge_sort_half_buffer": {"cutoff": _CUTOFFS},
+    "intro_sort": {"pivot": ["random", "middle", "last", "median3", "ninther"], "cutoff": _CUTOFFS},
+    "quick_sort": {"cutoff": _CUTOFFS, "final_pass": [False, True]},
+    "quick_sortmedio": {"cutoff": _CUTOFFS, "final_pass": [False, True]},
+    "quick_sortult": {"cutoff": _CUTOFFS, "final_pass": [False, True]},
+    "quick_sortdual": {"cutoff": _CUTOFFS},
+    "heap_sort": {"d": [2, 3, 4, 8], "cutoff": [1, 8, 16, 32]},
+}
+
+# Módulo de cada algoritmo (se importan al ajustar, no al cargar el perfil)
+MODULES = {
+    "tim_sort": "TimSort",
+    "merge_sort": "MergeSort",
+    "merge_sort_buffer": "MergeSort",
+    "merge_sort_half_buffer": "MergeSort",
+    "intro_sort": "IntroSort",
+    "quick_sort": "QuickSort",
+    "quick_sortmedio": "QuickSortmedio",
+    "quick_sortult": "QuickSortult",
+    "quick_sortdual": "QuickSortdual",
+    "heap_sort": "HeapSort",
+}
+
+# Reducción de candidatos por ronda de successive halving
+ETA = 3
+
+_EMPTY = {}
+_PROFILES = {}  # (algoritmo, dtype, banda) -> parámetros
+
+
+def size_band(n):
+    """Nombre de la banda de tamaños de una lista de n elementos."""
+    for limit, name, _ in BANDS:
+        if n < limit:
+            return name
+    return BANDS[-1][1]
+
+
+def _dtype(arr):
+    # dtype del perfil: el de NumPy o, en listas, el tipo del primer elemento
+    dtype = getattr(arr, "dtype", None)
+    if dtype is not None:
+        return dtype.name
+    first = type(arr[0])
+    if first is int:
+        return "int64"
+    if first is float:
+        return "float64"
+    return "object"
+
+
+def tuned(algorithm, arr, n=None):
+    """
+    Parámetros ajustados para ordenar arr (o un tramo de n elementos).
+
+    Args:
+        algorithm (str): Nombre de la función (clave de SPACES)
+        arr (list | numpy.ndarray): Datos a ordenar
+        n (int): Tamaño del tramo; None = len(arr)
+
+    Returns:
+        dict: Parámetros del perfil; vacío si no hay perfil para esa celda
+    """
+    if not _PROFILES:
+        return _EMPTY
+    n = len(arr) if n is None else n
+    if n < 1:
+        return _EMPTY
+    return _PROFILES.get((algorithm, _dtype(arr), size_band(n)), _EMPTY)
+
+
+def load_profile(path=PROFILE_PATH):
+    """
+    Carga el perfil de esta máquina (los de otras máquinas se ignoran).
+
+    Returns:
+        int: Número de configuraciones cargadas
+    """
+    _PROFILES.clear()
+    if not os.path.exists(path):
+        return 0
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("machine") != machine_id():
+        return 0
+    for entry in data.get("profiles", []):
+        _PROFILES[(entry["algorithm"], entry["dtype"], entry["band"])] = entry["params"]
+    return len(_PROFILES)
+
+
+def profile_hash():
+    """Hash del perfil cargado ("" sin perfil), para la clave del almacén de resultados."""
+    if not _PROFILES:
+        return ""
+    payload = json.dumps(sorted((list(k), v) for k, v in _PROFILES.items()), sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def candidates(space):
+    """Todas las combinaciones de un espacio de búsqueda, como dicts."""
+    names = sorted(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[k] for k in names))]
+
+
+def successive_halving(evaluate, configs, eta=ETA):
+    """
+    Successive halving: cada ronda mide a los supervivientes con `eta` veces
+    más repeticiones que la anterior y se queda con el mejor 1/eta.
+
+    Args:
+        evaluate (function): evaluate(config, repetitions) -> puntuación (menor es mejor)
+        configs (list): Configuraciones candidatas
+        eta (int): Factor de reducción
+
+    Returns:
+        tuple: (mejor configuración, su puntuación, repeticiones de la última ronda)
+    """
+    survivors = list(configs)
+    repetitions = 1
+    scores = [evaluate(c, repetitions) for c in survivors]
+    while len(survivors) > 1:
+        ranked = sorted(range(len(survivors)), key=scores.__getitem__)
+        survivors = [survivors[i] for i in ranked[:max(1, len(survivors) // eta)]]
+        if len(survivors) > 1:
+            repetitions *= eta
+            scores = [evaluate(c, repetitions) for c in survivors]
+        else:
+            scores = [scores[ranked[0]]]
+    return survivors[0], scores[0], repetitions
+
+
+def _evaluator(func, inputs, measure):
+    # Media geométrica, sobre las distribuciones, de la mediana de los tiempos
+    def evaluate(config, repetitions):
+        log_total = 0.0
+        for data in inputs:
+            times = [measure(lambda arr: func(arr, **config), data)[0] for _ in range(repetitions)]
+            log_total += math.log(max(statistics.median(times), 1e-9))
+        return math.exp(log_total / len(inputs))
+    return evaluate
+
+
+def tune(algorithms=None, dtypes=DTYPES, bands=None, shapes=SHAPES, seed=0, measure=None):
+    """
+    Busca la mejor configuración de cada (algoritmo, dtype, banda).
+
+    Se mide con la pasada de tiempo de measure_performance (Memoria.measure_time)
+    sobre listas de Generadores con el tamaño representativo de la banda, con
+    el perfil actual desactivado para que los valores por defecto sean los de
+    fábrica.
+
+    Args:
+        algorithms (list): Nombres de SPACES; None = todos
+        dtypes (tuple): dtypes de las listas
+        bands (list): Nombres de BANDS; None = todas
+        shapes (tuple): Formas de Generadores.GENERATORS
+        seed (int): Semilla de las entradas
+        measure (function): measure(func, data) -> (tiempo, ...); None = measure_time
+
+    Returns:
+        list: Entradas del perfil con algorithm, dtype, band, size, params,
+              time y default_time
+    """
+    import importlib
+    from Generadores import InputGenerator
+    from Memoria import measure_time
+
+    measure = measure or measure_time
+    algorithms = algorithms or list(SPACES)
+    bands = [b for b in BANDS if bands is None or b[1] in bands]
+    saved = dict(_PROFILES)
+    _PROFILES.clear()
+    entries = []
+    try:
+        for algorithm in algorithms:
+            func = getattr(importlib.import_module(MODULES[algorithm]), algorithm)
+            configs = candidates(SPACES[algorithm])
+            for dtype in dtypes:
+                for _, band, size in bands:
+                    print(f"Ajustando {algorithm} ({dtype}, {band}, n={size}): {len(configs)} candidatos...")
+                    inputs = [InputGenerator(shape)(size, seed, dtype) for shape in shapes]
+                    evaluate = _evaluator(func, inputs, measure)
+                    best, _, repetitions = successive_halving(evaluate, configs)
+                    # Mejor y valores por defecto medidos en igualdad de condiciones
+                    best_time = evaluate(best, repetitions)
+                    default_time = evaluate({}, repetitions)
+                    if default_time < best_time:
+                        best, best_time = {}, default_time
+                    entries.append({"algorithm": algorithm, "dtype": dtype, "band": band,
+                                    "size": size, "params": best, "time": best_time,
+                                    "default_time": default_time})
+    finally:
+        _PROFILES.update(saved)
+    return entries
+
+
+def save_profile(entries, path=PROFILE_PATH):
+    """
+    Guarda las entradas en el perfil de esta máquina, sustituyendo las de las
+    mismas celdas y conservando el resto, y lo recarga.
+    """
+    profiles = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("machine") == machine_id():
+            profiles = {(e["algorithm"], e["dtype"], e["band"]): e for e in data.get("profiles", [])}
+    for entry in entries:
+        profiles[(entry["algorithm"], entry["dtype"], entry["band"])] = entry
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"machine": machine_id(), "profiles": list(profiles.values())}, f, indent=1)
+    os.replace(tmp, path)
+    load_profile(path)
+
+
+def print_profile(entries):
+    """Tabla con la configuración elegida y la mejora frente a los valores por defecto."""
+    print(f"\n{'Algoritmo':24} {'dtype':8} {'banda':7} {'parámetros':36} {'tiempo (s)':>11} {'mejora':>7}")
+    print("-" * 98)
+    for e in entries:
+        params = ", ".join(f"{k}={v}" for k, v in sorted(e["params"].items())) or "(por defecto)"
+        speedup = e["default_time"] / e["time"] if e["time"] > 0 else float("nan")
+        print(f"{e['algorithm']:24} {e['dtype']:8} {e['band']:7} {params:36} {e['time']:11.6f} {speedup:6.2f}x")
+
+
+load_profile()
+
+
+# Uso: python Autoajuste.py [algoritmo ...] [--bands small,medium] [--dtypes int64]
+if __name__ == "__main__":
+    import sys
+
+    args = sys.argv[1:]
+    options = {}
+    for flag in ("--bands", "--dtypes"):
+        if flag in args:
+            i = args.index(flag)
+            options[flag] = args[i + 1].split(",")
+            del args[i:i + 2]
+    unknown = [a for a in args if a not in SPACES]
+    if unknown:
+        sys.exit(f"Algoritmos desconocidos: {', '.join(unknown)} (disponibles: {', '.join(SPACES)})")
+    entries = tune(args or None, dtypes=options.get("--dtypes", DTYPES), bands=options.get("--bands"))
+    save_profile(entries)
+    print_profile(entries)
+    print(f"\nPerfil guardado en {PROFILE_PATH}")
@@ -1,13 +1,19 @@
-def bubble_sort(arr):
+from Claves import sort_by_key
+
+def bubble_sort(arr, key=None, reverse=False):
     """
     Implementación clásica del algoritmo Bubble Sort.
     
     Args:
         arr (list): Lista de elementos a ordenar (enteros en este caso)
+        key (function): Función clave, calculada una vez por elemento (ver Claves.py)
+        reverse (bool): Orden descendente
         
     Returns:
         list: Lista ordenada
     """
+    if key is not None or reverse:
+        return sort_by_key(bubble_sort, arr, key, reverse)
     n = len(arr)
     # Realizamos n-1 pasadas
     for i in range(n-1):
@@ -18,16 +24,20 @@ def bubble_sort(arr):
                 arr[j], arr[j+1] = arr[j+1], arr[j]
     return arr
 
-def optimized_bubble_sort(arr):
+def optimized_bubble_sort(arr, key=None, reverse=False):
     """
     Versión optimizada de Bubble Sort que detecta si la lista ya está ordenada.
     
     Args:
         arr (list): Lista de elementos a ordenar
+        key (function): Función clave, calculada una vez por elemento (ver Claves.py)
+        reverse (bool): Orden descendente
         
     Returns:
         list: Lista ordenada
     """
+    if key is not None or reverse:
+        return sort_by_key(optimized_bubble_sort, arr, key, reverse)
     n = len(arr)
     for i in range(n-1):
         swapped = False
@@ -0,0 +1,144 @@
+import timeit
+from operator import itemgetter
+
+# Soporte de key= y reverse= para los algoritmos de listas del repo.
+# La clave se calcula una sola vez por elemento (decorar-ordenar-desdecorar):
+# se ordena una lista de tuplas (clave, índice) y al final se reconstruye la
+# lista original a partir de los índices. El índice desempata los iguales,
+# así que el resultado es estable con cualquier algoritmo (también con los
+# que no lo son, como quick_sort o heap_sort) y nunca se comparan los
+# elementos originales, que pueden no ser comparables (dicts).
+
+
+def decorate(arr, key=None, reverse=False):
+    """
+    Lista de tuplas (clave, índice) lista para ordenar.
+
+    Con reverse=True el índice va negado: al invertir el resultado ordenado
+    de forma ascendente, los iguales quedan en su orden original, igual que
+    sorted(..., reverse=True).
+    """
+    keys = map(key, arr) if key is not None else arr
+    if reverse:
+        return [(k, -i) for i, k in enumerate(keys)]
+    return [(k, i) for i, k in enumerate(keys)]
+
+
+def undecorate(arr, decorated, reverse=False):
+    # Reordena arr según los índices de la lista decorada ya ordenada
+    values = arr[:]
+    if reverse:
+        arr[:] = [values[-i] for _, i in reversed(decorated)]
+    else:
+        arr[:] = [values[i] for _, i in decorated]
+
+
+def sort_by_key(algorithm, arr, key=None, reverse=False, **options):
+    """
+    Ordena arr con `algorithm` comparando key(x) en lugar de x.
+
+    Es lo que hacen los algoritmos cuando reciben key= o reverse=; siempre
+    ordena la lista completa.
+
+    Args:
+        algorithm (function): Algoritmo de listas del repo
+        arr (list): Lista a ordenar (se modifica en el lugar)
+        key (function): Función clave; None = los propios elementos
+        reverse (bool): Orden descendente (estable)
+        **options: Parámetros propios del algoritmo (mode, pivot, d, ...)
+
+    Returns:
+        list: La misma lista, ordenada
+    """
+    decorated = decorate(arr, key, reverse)
+    algorithm(decorated, **options)
+    undecorate(arr, decorated, reverse)
+    return arr
+
+
+def _records_tuples(rng, size):
+    # (id, nombre, puntuación)
+    return [(i, f"n{rng.randint(0, 10**5):05d}", rng.random()) for i in range(size)]
+
+
+def _records_dicts(rng, size):
+    return [{"id": i, "name": f"n{rng.randint(0, 10**5):05d}", "score": rng.random()}
+            for i in range(size)]
+
+
+# Escenarios de registros: (generador, función clave)
+RECORD_SCENARIOS = {
+    "tuplas por puntuación": (_records_tuples, itemgetter(2)),
+    "tuplas por (nombre, id)": (_records_tuples, itemgetter(1, 0)),
+    "dicts por puntuación": (_records_dicts, itemgetter("score")),
+}
+
+
+def run_record_benchmark(algorithms, sizes, scenarios=None, repetitions=3, seed=0):
+    """
+    Mide la ordenación de registros con key= separando sus costos.
+
+    Para cada celda se mide por separado:
+      - key_time: solo la extracción de claves ([key(r) for r in registros])
+      - plain_time: ordenar la lista de claves sueltas con el mismo algoritmo
+      - avg_time: ordenar los registros con key= (extracción + decorar +
+        ordenar + desdecorar)
+
+    Returns:
+        dict: results[algo][escenario][size] = {'avg_time', 'key_time', 'plain_time'}
+    """
+    import random
+
+    scenarios = scenarios or RECORD_SCENARIOS
+    results = {}
+    for algo_name, algo_func in algorithms.items():
+        results[algo_name] = {}
+        for scenario, (generator, key) in scenarios.items():
+            results[algo_name][scenario] = {}
+            for size in sizes:
+                print(f"Ejecutando {algo_name} con registros '{scenario}' de tamaño {size}...")
+                records = generator(random.Random(seed), size)
+                keys = [key(r) for r in records]
+                key_times, plain_times, times = [], [], []
+                for _ in range(repetitions):
+                    start = timeit.default_timer()
+                    [key(r) for r in records]
+                    key_times.append(timeit.default_timer() - start)
+
+                    data = keys[:]
+                    start = timeit.default_timer()
+                    algo_func(data)
+                    plain_times.append(timeit.default_timer() - start)
+
+                    data = records[:]
+                    start = timeit.default_timer()
+                    algo_func(data, key=key)
+                    times.append(timeit.default_timer() - start)
+                results[algo_name][scenario][size] = {
+                    'avg_time': sum(times) / repetitions,
+                    'key_time': sum(key_times) / repetitions,
+                    'plain_time': sum(plain_times) / repetitions,
+                }
+    return results
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    from functools import partial
+
+    from HeapSort import heap_sort
+    from MergeSort import merge_sort
+    from QuickSort import quick_sort
+    from TimSort import tim_sort
+
+    results = run_record_benchmark(
+        {"Merge Sort": merge_sort, "Merge Sort (buffer)": partial(merge_sort, mode="buffer"),
+         "Quick Sort": quick_sort, "Heap Sort": heap_sort, "Tim Sort": tim_sort},
+        [1000, 10000, 100000],
+    )
+    for algo, algo_data in results.items():
+        print(f"\n{algo}:")
+        for scenario, type_data in algo_data.items():
+            for size, m in type_data.items():
+                print(f"  {scenario:24} n={size:<7} total {m['avg_time']:.4f} s | "
+                      f"claves {m['key_time']:.4f} s | solo claves {m['plain_time']:.4f} s")
@@ -0,0 +1,225 @@
+import timeit
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate
+
+from TimSort import merge, tim_sort
+
+# Tamaño objetivo de cada bloque: se parten al pasar de 2·LOAD elementos
+LOAD = 1000
+
+
+class SortedList:
+    """
+    Colección ordenada que admite inserciones y lotes sin reordenar todo.
+
+    Los datos se guardan en una lista de bloques ordenados de tamaño acotado
+    (como sortedcontainers.SortedList) junto con el máximo de cada bloque.
+    Un elemento se inserta solo en su bloque (O(log n + LOAD)); un lote se
+    ordena con tim_sort, se reparte entre los bloques con bisect y cada parte
+    se fusiona con su bloque usando TimSort.merge, así que ingerir un lote de
+    k elementos cuesta O(k log k + n) copias en el peor caso en lugar de
+    O((n + k) log(n + k)) comparaciones.
+
+    Args:
+        iterable: Datos iniciales
+        load (int): Tamaño objetivo de los bloques
+    """
+
+    __slots__ = ("_blocks", "_maxes", "_len", "_load", "_offsets")
+
+    def __init__(self, iterable=(), load=LOAD):
+        if load < 1:
+            raise ValueError("load debe ser al menos 1")
+        self._blocks = []
+        self._maxes = []
+        self._len = 0
+        self._load = load
+        self._offsets = None  # Suma de prefijos de las longitudes (perezosa)
+        self.update(iterable)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from block
+
+    def __repr__(self):
+        return f"SortedList({list(self)!r})"
+
+    def __contains__(self, value):
+        i = bisect_left(self._maxes, value)
+        if i == len(self._maxes):
+            return False
+        block = self._blocks[i]
+        j = bisect_left(block, value)
+        return j < len(block) and not value < block[j]
+
+    def _split(self, i):
+        # Parte el bloque i en bloques de LOAD elementos si se ha pasado de 2·LOAD
+        block = self._blocks[i]
+        if len(block) <= 2 * self._load:
+            self._maxes[i] = block[-1]
+            return
+        load = self._load
+        parts = [block[j:j + load] for j in range(0, len(block), load)]
+        self._blocks[i:i + 1] = parts
+        self._maxes[i:i + 1] = [part[-1] for part in parts]
+
+    def add(self, value):
+        """Inserta un elemento (después de sus iguales)."""
+        self._offsets = None
+        self._len += 1
+        if not self._blocks:
+            self._blocks.append([value])
+            self._maxes.append(value)
+            return
+        i = bisect_right(self._maxes, value)
+        if i == len(self._blocks):
+            i -= 1
+        insort(self._blocks[i], value)
+        self._split(i)
+
+    def update(self, iterable):
+        """
+        Añade un lote: lo ordena con tim_sort y lo fusiona bloque a bloque con
+        TimSort.merge (estable: los nuevos van detrás de sus iguales).
+        """
+        batch = list(iterable)
+        if not batch:
+            return
+        tim_sort(batch)
+        self._offsets = None
+        self._len += len(batch)
+        if not self._blocks:
+            load = self._load
+            self._blocks = [batch[j:j + load] for j in range(0, len(batch), load)]
+            self._maxes = [block[-1] for block in self._blocks]
+            return
+        # Repartir el lote: los elementos <= maxes[i] (y > maxes[i-1]) van al
+        # bloque i; los mayores que todo, al último
+        cuts = [bisect_right(batch, m) for m in self._maxes[:-1]] + [len(batch)]
+        # De derecha a izquierda, así partir un bloque no mueve los pendientes
+        for i in range(len(self._blocks) - 1, -1, -1):
+            start = cuts[i - 1] if i > 0 else 0
+            end = cuts[i]
+            if start == end:
+                continue
+            block = self._blocks[i]
+            m = len(block) - 1
+            block.extend(batch[start:end])
+            merge(block, 0, m, len(block) - 1)
+            self._split(i)
+
+    extend = update
+
+    def _index(self, block, pos):
+        # Posición global de block[pos]
+        if self._offsets is None:
+            self._offsets = [0, *accumulate(len(b) for b in self._blocks)]
+        return self._offsets[block] + pos
+
+    def bisect_left(self, value):
+        """Posición en la que value se insertaría antes de sus iguales."""
+        i = bisect_left(self._maxes, value)
+        if i == len(self._maxes):
+            return self._len
+        return self._index(i, bisect_left(self._blocks[i], value))
+
+    def bisect_right(self, value):
+        """Posición en la que value se insertaría después de sus iguales."""
+        i = bisect_right(self._maxes, value)
+        if i == len(self._maxes):
+            return self._len
+        return self._index(i, bisect_right(self._blocks[i], value))
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("índice fuera de rango")
+        if self._offsets is None:
+            self._index(0, 0)
+        i = bisect_right(self._offsets, index) - 1
+        return self._blocks[i][index - self._offsets[i]]
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """
+        Itera los elementos entre minimum y maximum (None = sin límite).
+
+        Args:
+            inclusive (tuple): Si cada extremo se incluye
+        """
+        blocks = self._blocks
+        if minimum is None:
+            i, j = 0, 0
+        elif inclusive[0]:
+            i = bisect_left(self._maxes, minimum)
+            j = bisect_left(blocks[i], minimum) if i < len(blocks) else 0
+        else:
+            i = bisect_right(self._maxes, minimum)
+            j = bisect_right(blocks[i], minimum) if i < len(blocks) else 0
+        for b in range(i, len(blocks)):
+            block = blocks[b]
+            for k in range(j if b == i else 0, len(block)):
+                value = block[k]
+                if maximum is not None and (maximum < value if inclusive[1] else not value < maximum):
+                    return
+                yield value
+
+
+def run_ingest_benchmark(batch_sizes, totals, seed=0, load=LOAD):
+    """
+    Costo de ingerir un lote según lo acumulado: SortedList.update frente a
+    añadir el lote a una lista y volver a ejecutar tim_sort sobre todo.
+
+    Para cada tamaño de lote se ingieren lotes aleatorios hasta llegar a cada
+    total de `totals` y se mide el lote que lo alcanza. La lista de la
+    re-ordenación parte del mismo contenido ya ordenado (list(container)),
+    así las dos alternativas ingieren el mismo lote sobre los mismos datos.
+
+    Returns:
+        dict: results[método][f"lote {b}"][total] = {'avg_time'}
+    """
+    from Generadores import InputGenerator
+
+    generator = InputGenerator("random")
+    results = {"SortedList": {}, "tim_sort (re-sort)": {}}
+    for batch_size in batch_sizes:
+        label = f"lote {batch_size}"
+        results["SortedList"][label] = {}
+        results["tim_sort (re-sort)"][label] = {}
+        container = SortedList(load=load)
+        batch_index = 0
+        for total in sorted(totals):
+            print(f"Ingiriendo lotes de {batch_size} hasta {total} elementos...")
+            while len(container) + batch_size < total:
+                container.update(generator(batch_size, seed + batch_index))
+                batch_index += 1
+            accumulated = list(container)
+            batch = generator(batch_size, seed + batch_index)
+            batch_index += 1
+            start = timeit.default_timer()
+            container.update(batch)
+            middle = timeit.default_timer()
+            accumulated.extend(batch)
+            tim_sort(accumulated)
+            end = timeit.default_timer()
+            results["SortedList"][label][total] = {'avg_time': middle - start}
+            results["tim_sort (re-sort)"][label][total] = {'avg_time': end - middle}
+    return results
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    coleccion = SortedList([5, 1, 4])
+    coleccion.update([3, 9, 2])
+    coleccion.add(7)
+    print(coleccion, coleccion.bisect_left(4), list(coleccion.irange(2, 5)))
+
+    results = run_ingest_benchmark([100, 10000], [10**4, 10**5, 10**6])
+    for method, method_data in results.items():
+        print(f"\n{method}:")
+        for label, type_data in method_data.items():
+            line = "  ".join(f"N={total}: {m['avg_time']:.5f} s" for total, m in type_data.items())
+            print(f"  {label:12} {line}")
@@ -0,0 +1,224 @@
+import array
+import timeit
+from operator import itemgetter
+
+import numpy as np
+
+from RadixSort import _keys_np
+from TimSort import tim_sort
+
+# Ordenación de tablas en columnas (struct-of-arrays). Cada columna es un
+# array.array o un numpy.ndarray compacto; argsort devuelve la permutación que
+# las ordena sin crear un objeto por fila, y gather la aplica a cualquier
+# columna con un solo acceso vectorizado de NumPy.
+#
+# Los algoritmos del repo ordenan listas, así que cada fila se representa con
+# un único entero de Python: las claves de las columnas (enteros sin signo con
+# el mismo orden que los valores, ver RadixSort._keys_np) empaquetadas una
+# detrás de otra y, en los bits bajos, el índice de la fila. Las claves son
+# todas distintas, por lo que el resultado es estable con cualquier algoritmo,
+# y el índice se recupera con una máscara.
+
+METHODS = ("packed", "passes")
+
+
+def _as_numpy(column):
+    # Vista sin copia de un array.array (protocolo de buffer) o el propio ndarray
+    return np.asarray(column)
+
+
+def _column_keys(column, reverse):
+    # Claves uint64 de la columna, complementadas para orden descendente
+    keys = _keys_np(_as_numpy(column))
+    if reverse:
+        keys = keys.max() - keys
+    return keys, int(keys.max()).bit_length() if len(keys) else 0
+
+
+def _pack(parts, index_bits, n):
+    # parts: [(claves uint64, bits)]; devuelve la lista de enteros empaquetados
+    total_bits = sum(bits for _, bits in parts) + index_bits
+    if total_bits <= 64:
+        packed = np.zeros(n, dtype=np.uint64)
+        for keys, bits in parts:
+            packed = (packed << np.uint64(bits)) | keys
+        packed = (packed << np.uint64(index_bits)) | np.arange(n, dtype=np.uint64)
+        return packed.tolist(), True
+    # Más de 64 bits: enteros de Python de precisión arbitraria
+    packed = [0] * n
+    for keys, bits in parts:
+        packed = [(p << bits) | k for p, k in zip(packed, keys.tolist())]
+    return [(p << index_bits) | i for i, p in enumerate(packed)], False
+
+
+def _unpack(packed, index_bits, fits):
+    # Índices (bits bajos) de la lista empaquetada ya ordenada
+    mask = (1 << index_bits) - 1
+    if fits:
+        return (np.array(packed, dtype=np.uint64) & np.uint64(mask)).astype(np.intp)
+    return np.array([p & mask for p in packed], dtype=np.intp)
+
+
+def _sort_packed(algorithm, parts, n):
+    index_bits = max(n - 1, 0).bit_length()
+    packed, fits = _pack(parts, index_bits, n)
+    algorithm(packed)
+    return _unpack(packed, index_bits, fits)
+
+
+def argsort(columns, algorithm=tim_sort, reverse=False, method="packed"):
+    """
+    Permutación que ordena una tabla por una o varias columnas.
+
+    Con varias columnas el orden es lexicográfico (la primera manda, las
+    siguientes desempatan) y los empates completos conservan el orden de las
+    filas. Métodos:
+      - "packed": una sola ordenación de claves compuestas (columnas e índice
+        en un entero).
+      - "passes": una ordenación por columna, de la última a la primera; cada
+        pasada es estable porque la posición actual va en los bits bajos.
+
+    Args:
+        columns (array.array | numpy.ndarray | list): Columna o lista de
+            columnas de enteros o reales, todas de la misma longitud
+        algorithm (function): Algoritmo de listas del repo (merge_sort,
+            tim_sort, heap_sort, quick_sort, radix_sort, ...)
+        reverse (bool | list): Orden descendente, para todas las columnas o
+            una por columna
+        method (str): "packed" o "passes"
+
+    Returns:
+        numpy.ndarray: Índices (intp) de las filas en orden
+    """
+    if isinstance(columns, (array.array, np.ndarray)):
+        columns = [columns]
+    if not columns:
+        raise ValueError("Se necesita al menos una columna")
+    n = len(columns[0])
+    if any(len(c) != n for c in columns):
+        raise ValueError("Todas las columnas deben tener la misma longitud")
+    if isinstance(reverse, bool):
+        reverse = [reverse] * len(columns)
+    if len(reverse) != len(columns):
+        raise ValueError("reverse debe tener un valor por columna")
+    if n < 2:
+        return np.arange(n, dtype=np.intp)
+
+    if method == "packed":
+        parts = [_column_keys(c, r) for c, r in zip(columns, reverse)]
+        return _sort_packed(algorithm, parts, n)
+    if method == "passes":
+        perm = np.arange(n, dtype=np.intp)
+        for column, rev in reversed(list(zip(columns, reverse))):
+            keys, bits = _column_keys(column, rev)
+            perm = perm[_sort_packed(algorithm, [(keys[perm], bits)], n)]
+        return perm
+    raise ValueError(f"Método desconocido: {method}")
+
+
+def gather(column, perm):
+    """
+    Aplica una permutación a una columna con un solo acceso vectorizado.
+
+    Returns:
+        array.array | numpy.ndarray: Columna nueva del mismo tipo que la original
+    """
+    values = _as_numpy(column)[perm]
+    if isinstance(column, array.array):
+        return array.array(column.typecode, values.tobytes())
+    return values
+
+
+def sort_table(table, by, algorithm=tim_sort, reverse=False, method="packed"):
+    """
+    Ordena una tabla {nombre: columna} por las columnas `by`.
+
+    Returns:
+        dict: Tabla nueva con todas las columnas reordenadas
+    """
+    perm = argsort([table[name] for name in by], algorithm, reverse, method)
+    return {name: gather(column, perm) for name, column in table.items()}
+
+
+def make_table(size, seed=0):
+    """Tabla de prueba: id (int64), grupo con 16 valores (int32) y puntuación (float64)."""
+    rng = np.random.default_rng(seed)
+    return {
+        "id": array.array("q", np.arange(size, dtype=np.int64).tobytes()),
+        "group": array.array("i", rng.integers(0, 16, size, dtype=np.int32).tobytes()),
+        "score": array.array("d", rng.random(size).tobytes()),
+    }
+
+
+def run_columnar_benchmark(algorithms, sizes, by=("group", "score"), repetitions=3, seed=0):
+    """
+    Compara ordenar una tabla en columnas con ordenar una lista de tuplas.
+
+    Escenarios (todos con el mismo algoritmo y el mismo orden final):
+      - "argsort (packed)" / "argsort (passes)": argsort más gather de todas
+        las columnas
+      - "tuplas": lista de tuplas (una por fila) ordenada con key=itemgetter
+        (ver Claves.py); la lista se construye fuera del tiempo medido
+
+    Returns:
+        dict: results[algo][escenario][size] = {'avg_time', 'gather_time'}
+    """
+    results = {}
+    for algo_name, algo_func in algorithms.items():
+        results[algo_name] = {"argsort (packed)": {}, "argsort (passes)": {}, "tuplas": {}}
+        for size in sizes:
+            print(f"Ejecutando {algo_name} con una tabla de {size} filas...")
+            table = make_table(size, seed)
+            names = list(table)
+            rows = list(zip(*(table[name].tolist() for name in names)))
+            key = itemgetter(*(names.index(name) for name in by))
+            for method in METHODS:
+                times, gather_times = [], []
+                for _ in range(repetitions):
+                    start = timeit.default_timer()
+                    perm = argsort([table[name] for name in by], algo_func, method=method)
+                    middle = timeit.default_timer()
+                    {name: gather(column, perm) for name, column in table.items()}
+                    end = timeit.default_timer()
+                    times.append(end - start)
+                    gather_times.append(end - middle)
+                results[algo_name][f"argsort ({method})"][size] = {
+                    'avg_time': sum(times) / repetitions,
+                    'gather_time': sum(gather_times) / repetitions,
+                }
+            times = []
+            for _ in range(repetitions):
+                data = rows[:]
+                start = timeit.default_timer()
+                algo_func(data, key=key)
+                times.append(timeit.default_timer() - start)
+            results[algo_name]["tuplas"][size] = {'avg_time': sum(times) / repetitions}
+    return results
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    from HeapSort import heap_sort
+    from MergeSort import merge_sort
+    from QuickSort import quick_sort
+
+    # Empates completos con ceros de distinto signo: mismo orden que np.lexsort
+    # (estable) para todos los algoritmos y métodos
+    group = np.array([1, 0, 1, 0, 1, 0], dtype=np.int64)
+    score = np.array([0.0, -0.0, -0.0, 0.0, 1.5, -0.0])
+    expected = np.lexsort((score, group))
+    for algo_func in (tim_sort, merge_sort, quick_sort, heap_sort):
+        for method in METHODS:
+            perm = argsort([group, score], algo_func, method=method)
+            if not np.array_equal(perm, expected):
+                raise AssertionError(f"{algo_func.__name__} ({method}) no conserva el orden de los empates")
+
+    results = run_columnar_benchmark(
+        {"Tim Sort": tim_sort, "Merge Sort": merge_sort, "Quick Sort": quick_sort, "Heap Sort": heap_sort},
+        [1000, 10000, 100000],
+    )
+    for algo, algo_data in results.items():
+        print(f"\n{algo}:")
+        for scenario, type_data in algo_data.items():
+            line = "  ".join(f"n={size}: {m['avg_time']:.4f} s" for size, m in type_data.items())
+            print(f"  {scenario:18} {line}")
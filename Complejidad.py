@@ -0,0 +1,263 @@
+import math
+
+# Modelos de un parámetro t = c·f(n)
+MODELS = {
+    "n": lambda n: n,
+    "n log n": lambda n: n * math.log2(max(n, 2)),
+    "n^1.5": lambda n: n ** 1.5,
+    "n^2": lambda n: n ** 2,
+}
+
+# Complejidad esperada por algoritmo (nombre normalizado, ver _normalize) y,
+# si difiere, por tipo de lista
+EXPECTED = {
+    "bubblesort": {"default": "n^2"},
+    "optimizedbubblesort": {"default": "n^2", "sorted": "n"},
+    "insertionsort": {"default": "n^2", "sorted": "n"},
+    "mergesort": {"default": "n log n"},
+    "quicksort": {"default": "n log n"},
+    "quicksortmedio": {"default": "n log n"},
+    "quicksortult": {"default": "n log n"},
+    "quicksortdual": {"default": "n log n"},
+    "introsort": {"default": "n log n"},
+    "heapsort": {"default": "n log n"},
+    "timsort": {"default": "n log n", "sorted": "n", "reversed": "n"},
+    "radixsort": {"default": "n"},
+    "countingsort": {"default": "n"},
+}
+
+# Error relativo mínimo que se asume en cada punto (las desviaciones de 0 de
+# las celdas con una sola repetición darían peso infinito)
+MIN_REL_STD = 0.05
+
+# Diferencia de exponente a partir de la cual se marca una desviación, para
+# la serie completa y entre dos tamaños consecutivos (más ruidosa)
+EXPONENT_TOLERANCE = 0.25
+LOCAL_TOLERANCE = 0.75
+
+
+def _normalize(algo_name):
+    # "Quick Sort (ndarray)", "QuickSort" y "quick_sort" -> "quicksort"
+    name = algo_name.split(" (")[0]
+    return "".join(ch for ch in name.lower() if ch.isalnum())
+
+
+def expected_model(algo_name, list_type):
+    """Modelo teórico de EXPECTED para la serie, o None si no se conoce."""
+    expected = EXPECTED.get(_normalize(algo_name))
+    if expected is None:
+        return None
+    return expected.get(list_type, expected["default"])
+
+
+def _weights(times, stds):
+    # Pesos 1/σ² con un σ mínimo relativo a cada tiempo
+    weights = []
+    for i, t in enumerate(times):
+        std = stds[i] if stds is not None and stds[i] is not None else 0.0
+        if std != std:  # NaN
+            std = 0.0
+        weights.append(1.0 / max(std, MIN_REL_STD * t) ** 2)
+    return weights
+
+
+def _fit_model(sizes, times, weights, f):
+    """
+    Mínimos cuadrados ponderados de t = c·f(n).
+
+    Returns:
+        tuple: (c, chi², R² ponderado)
+    """
+    fs = [f(n) for n in sizes]
+    c = sum(w * x * t for w, x, t in zip(weights, fs, times)) / sum(w * x * x for w, x in zip(weights, fs))
+    chi2 = sum(w * (t - c * x) ** 2 for w, x, t in zip(weights, fs, times))
+    mean = sum(w * t for w, t in zip(weights, times)) / sum(weights)
+    total = sum(w * (t - mean) ** 2 for w, t in zip(weights, times))
+    return c, chi2, 1 - chi2 / total if total > 0 else 1.0
+
+
+def _fit_power(sizes, times, weights):
+    """
+    Ley de potencias t = c·n^b ajustada en escala log-log. El error de log t
+    es σ/t, así que el peso de cada punto pasa a ser w·t².
+
+    Returns:
+        tuple: (c, b, chi² en la escala original, R² ponderado)
+    """
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(t) for t in times]
+    ws = [w * t * t for w, t in zip(weights, times)]
+    total_w = sum(ws)
+    mean_x = sum(w * x for w, x in zip(ws, xs)) / total_w
+    mean_y = sum(w * y for w, y in zip(ws, ys)) / total_w
+    sxx = sum(w * (x - mean_x) ** 2 for w, x in zip(ws, xs))
+    b = sum(w * (x - mean_x) * (y - mean_y) for w, x, y in zip(ws, xs, ys)) / sxx
+    c = math.exp(mean_y - b * mean_x)
+    chi2 = sum(w * (t - c * n ** b) ** 2 for w, n, t in zip(weights, sizes, times))
+    mean = sum(w * t for w, t in zip(weights, times)) / sum(weights)
+    total = sum(w * (t - mean) ** 2 for w, t in zip(weights, times))
+    return c, b, chi2, 1 - chi2 / total if total > 0 else 1.0
+
+
+def model_exponent(model, sizes):
+    """
+    Exponente efectivo de un modelo en el rango medido: la pendiente log-log de
+    f(n) entre el menor y el mayor tamaño (n log n entre 100 y 100000 da ~1.1).
+    """
+    if model == "power":
+        raise ValueError("La ley de potencias no tiene exponente fijo")
+    lo, hi = min(sizes), max(sizes)
+    f = MODELS[model]
+    return math.log(f(hi) / f(lo)) / math.log(hi / lo)
+
+
+def fit_series(sizes, times, stds=None, expected=None):
+    """
+    Ajusta una serie (tamaños, tiempos) a los modelos de MODELS y a una ley de
+    potencias libre, por mínimos cuadrados ponderados con las desviaciones.
+
+    El mejor modelo es el de menor chi² reducido (chi² / grados de libertad),
+    de modo que la ley de potencias, con un parámetro más, solo gana si mejora
+    el ajuste de verdad.
+
+    Args:
+        sizes (list): Tamaños medidos
+        times (list): Tiempo medio de cada tamaño
+        stds (list): Desviación estándar de cada tiempo (None = sin pesos)
+        expected (str): Modelo teórico para comparar (ver EXPECTED)
+
+    Returns:
+        dict: {'best', 'constant', 'exponent', 'r2', 'power_exponent',
+               'models', 'expected', 'departs', 'local', 'sizes'}; 'models'
+               tiene {c, chi2, r2, reduced} por modelo (y b para 'power'),
+               'local' el exponente entre cada par de tamaños consecutivos y
+               'departs' las desviaciones (tamaño o "series", medido, teórico)
+    """
+    points = sorted((n, t, stds[i] if stds is not None else None)
+                    for i, (n, t) in enumerate(zip(sizes, times))
+                    if n > 0 and t is not None and t == t and t > 0)
+    if len(points) < 2:
+        raise ValueError("Se necesitan al menos dos tamaños medidos")
+    sizes = [p[0] for p in points]
+    times = [p[1] for p in points]
+    weights = _weights(times, [p[2] for p in points])
+    k = len(points)
+
+    models = {}
+    for name, f in MODELS.items():
+        c, chi2, r2 = _fit_model(sizes, times, weights, f)
+        models[name] = {'c': c, 'chi2': chi2, 'r2': r2, 'reduced': chi2 / max(k - 1, 1)}
+    c, b, chi2, r2 = _fit_power(sizes, times, weights)
+    models["power"] = {'c': c, 'b': b, 'chi2': chi2, 'r2': r2,
+                       'reduced': chi2 / (k - 2) if k > 2 else math.inf}
+    best = min(models, key=lambda name: models[name]['reduced'])
+
+    local = [(sizes[i + 1], math.log(times[i + 1] / times[i]) / math.log(sizes[i + 1] / sizes[i]))
+             for i in range(k - 1)]
+
+    departs = []
+    if expected is not None:
+        theory = model_exponent(expected, sizes)
+        if abs(b - theory) > EXPONENT_TOLERANCE:
+            departs.append(("series", b, theory))
+        # Celdas concretas donde la pendiente local se sale de la teoría
+        for i, (n, slope) in enumerate(local):
+            theory_local = model_exponent(expected, [sizes[i], n])
+            if abs(slope - theory_local) > LOCAL_TOLERANCE:
+                departs.append((n, slope, theory_local))
+
+    return {
+        'best': best,
+        'constant': models[best]['c'],
+        'exponent': models[best]['b'] if best == "power" else model_exponent(best, sizes),
+        'r2': models[best]['r2'],
+        'power_exponent': b,
+        'models': models,
+        'expected': expected,
+        'departs': departs,
+        'local': local,
+        'sizes': sizes,
+    }
+
+
+def predict(fit, size, model=None):
+    """
+    Tiempo predicho por un ajuste de fit_series para un tamaño cualquiera.
+
+    Args:
+        fit (dict): Resultado de fit_series
+        size (int): Tamaño a predecir
+        model (str): Modelo a usar; None = el mejor
+    """
+    model = model or fit['best']
+    params = fit['models'][model]
+    if model == "power":
+        return params['c'] * size ** params['b']
+    return params['c'] * MODELS[model](size)
+
+
+def fit_results(results, metric='avg_time', std_metric='std_time'):
+    """
+    Ajusta todas las series de results[algo][list_type][size].
+
+    Las celdas sin medir, extrapoladas (Presupuesto) o canceladas se ignoran;
+    las series con menos de dos tamaños se omiten.
+
+    Returns:
+        dict: fits[algo][list_type] = resultado de fit_series
+    """
+    fits = {}
+    for algo, algo_data in results.items():
+        for list_type, type_data in algo_data.items():
+            sizes, times, stds = [], [], []
+            for size, metrics in type_data.items():
+                if (metrics is None or metrics.get('extrapolated') or metrics.get('timed_out')
+                        or metrics.get('failed') or metric not in metrics):
+                    continue
+                sizes.append(int(size))
+                times.append(metrics[metric])
+                stds.append(metrics.get(std_metric))
+            try:
+                fit = fit_series(sizes, times, stds, expected_model(algo, list_type))
+            except ValueError:
+                continue
+            fits.setdefault(algo, {})[list_type] = fit
+    return fits
+
+
+def print_scaling_report(fits, predict_sizes=()):
+    """
+    Imprime el mejor modelo de cada serie, su constante, el R² y las
+    desviaciones respecto a la teoría; opcionalmente, la predicción para
+    tamaños no medidos.
+    """
+    for algo, algo_data in fits.items():
+        print(f"\n{'=' * 50}")
+        print(f"COMPLEJIDAD EMPÍRICA DE {algo.upper()}")
+        print(f"{'=' * 50}")
+        for list_type, fit in algo_data.items():
+            model = fit['best'] if fit['best'] != "power" else f"n^{fit['power_exponent']:.2f}"
+            print(f"\nTipo de lista: {list_type.upper()}")
+            print(f"  Mejor modelo: {model}  (c = {fit['constant']:.3e}, R² = {fit['r2']:.4f})")
+            print(f"  Exponente ley de potencias: {fit['power_exponent']:.2f}"
+                  + (f"  | teórico: {fit['expected']}" if fit['expected'] else ""))
+            for where, measured, theory in fit['departs']:
+                cell = "toda la serie" if where == "series" else f"tamaño {where}"
+                print(f"  ¡Desviación! {cell}: exponente {measured:.2f} frente a {theory:.2f}")
+            for size in predict_sizes:
+                print(f"  Predicción para {size}: {predict(fit, size):.6f} s")
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    import os
+    from Resultados import ResultStore, DEFAULT_STORE
+
+    if os.path.exists(DEFAULT_STORE):
+        store = ResultStore(DEFAULT_STORE)
+        benchmark_results = store.load_results()
+        store.close()
+    else:
+        from Probar2 import run_benchmark
+        benchmark_results = run_benchmark()
+    print_scaling_report(fit_results(benchmark_results), predict_sizes=[1000000])
@@ -0,0 +1,294 @@
+import math
+import os
+import sys
+from array import array
+
+# Los algoritmos no se tocan: el recuento sale de ejecutarlos sobre una
+# CountedList, así que sin instrumentar no tienen ningún costo añadido.
+
+_REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Algoritmos cuyos intercambios son explícitos (arr[i], arr[j] = arr[j], arr[i])
+# y tienen un recuento de "swaps" con sentido. Los que mueven un hueco (el
+# hundimiento de HeapSort, el insertion sort binario, los buffers de
+# MergeSort y TimSort) solo hacen lecturas y escrituras: para ellos el
+# heurístico daría intercambios que no existen, así que no se informa.
+# Cada intercambio ejecutado cuenta, también arr[i], arr[i] = arr[i], arr[i]
+# (frecuente en la partición de Lomuto), como en los recuentos de los libros
+SWAP_ALGORITHMS = {
+    "bubble_sort", "optimized_bubble_sort", "intro_sort",
+    "quick_sort", "quick_sortmedio", "quick_sortult", "quick_sortdual",
+}
+
+# Ordenamientos por distribución (RadixSort.py): no comparan, sino que leen
+# el valor de cada elemento para calcular su clave. Corren sobre una
+# CountedList con plain=True, que cuenta las lecturas pero devuelve los
+# valores sin envolver
+DISTRIBUTION_ALGORITHMS = {"radix_sort", "counting_sort"}
+
+
+class OpCounter:
+    """Contadores de una ejecución instrumentada."""
+
+    __slots__ = ("reads", "writes", "comparisons", "swaps", "depth", "max_depth", "_last_move")
+
+    def __init__(self):
+        self.reads = 0
+        self.writes = 0
+        self.comparisons = 0
+        self.swaps = 0
+        self.depth = 0
+        self.max_depth = 0
+        self._last_move = None
+
+    def as_dict(self):
+        return {
+            'reads': self.reads,
+            'writes': self.writes,
+            'comparisons': self.comparisons,
+            'swaps': self.swaps,
+            'max_depth': self.max_depth,
+        }
+
+
+class CountedKey:
+    """
+    Valor envuelto que cuenta cada comparación. Recuerda el índice del que se
+    leyó (origin) para reconocer los intercambios arr[i], arr[j] = arr[j], arr[i].
+    """
+
+    __slots__ = ("value", "origin", "counter")
+
+    def __init__(self, value, origin, counter):
+        self.value = value
+        self.origin = origin
+        self.counter = counter
+
+    def __lt__(self, other):
+        self.counter.comparisons += 1
+        return self.value < (other.value if type(other) is CountedKey else other)
+
+    def __le__(self, other):
+        self.counter.comparisons += 1
+        return self.value <= (other.value if type(other) is CountedKey else other)
+
+    def __gt__(self, other):
+        self.counter.comparisons += 1
+        return self.value > (other.value if type(other) is CountedKey else other)
+
+    def __ge__(self, other):
+        self.counter.comparisons += 1
+        return self.value >= (other.value if type(other) is CountedKey else other)
+
+    def __eq__(self, other):
+        self.counter.comparisons += 1
+        return self.value == (other.value if type(other) is CountedKey else other)
+
+    def __ne__(self, other):
+        self.counter.comparisons += 1
+        return self.value != (other.value if type(other) is CountedKey else other)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+def _unwrap(item):
+    return item.value if type(item) is CountedKey else item
+
+
+class CountedList:
+    """
+    Secuencia instrumentada sobre un array.array ('q' para enteros, 'd' para
+    reales; lista para el resto). Cada lectura devuelve un CountedKey y cada
+    escritura guarda el valor desenvuelto. Los slices cuentan un acceso por
+    elemento y devuelven otra CountedList con el mismo contador, de modo que
+    las sublistas de MergeSort también se cuentan. Con plain=True las
+    lecturas se cuentan igual pero devuelven el valor sin envolver (ver
+    DISTRIBUTION_ALGORITHMS).
+    """
+
+    __slots__ = ("_data", "counter", "plain")
+
+    def __init__(self, data, counter=None, plain=False):
+        if isinstance(data, array):
+            self._data = data  # Slices de otra CountedList
+        else:
+            values = list(data)
+            if all(type(v) is int for v in values):
+                try:
+                    self._data = array("q", values)
+                except OverflowError:
+                    self._data = values
+            elif all(type(v) is float for v in values):
+                self._data = array("d", values)
+            else:
+                self._data = values
+        self.counter = counter if counter is not None else OpCounter()
+        self.plain = plain
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        counter = self.counter
+        if type(index) is slice:
+            part = self._data[index]
+            counter.reads += len(part)
+            return CountedList(part, counter, self.plain)
+        counter.reads += 1
+        if self.plain:
+            return self._data[index]
+        if index < 0:
+            index += len(self._data)
+        return CountedKey(self._data[index], index, counter)
+
+    def __setitem__(self, index, item):
+        counter = self.counter
+        if type(index) is slice:
+            counter._last_move = None
+            values = item._data if type(item) is CountedList else [_unwrap(v) for v in item]
+            if type(self._data) is array and type(values) is not array:
+                values = array(self._data.typecode, values)
+            elif type(self._data) is list and type(values) is not list:
+                values = list(values)
+            counter.writes += len(values)
+            self._data[index] = values
+            return
+        counter.writes += 1
+        if index < 0:
+            index += len(self._data)
+        if type(item) is CountedKey:
+            # Segunda mitad de arr[i], arr[j] = arr[j], arr[i]
+            move = (index, item.origin)
+            if counter._last_move == (item.origin, index):
+                counter.swaps += 1
+                move = None
+            counter._last_move = move
+            self._data[index] = item.value
+        else:
+            counter._last_move = None
+            self._data[index] = item
+
+    def __iter__(self):
+        counter = self.counter
+        for i, value in enumerate(self._data):
+            counter.reads += 1
+            yield value if self.plain else CountedKey(value, i, counter)
+
+    def append(self, item):
+        self.counter.writes += 1
+        self.counter._last_move = None
+        self._data.append(_unwrap(item))
+
+    def pop(self, index=-1):
+        self.counter.reads += 1
+        value = self._data.pop(index)
+        return value if self.plain else CountedKey(value, None, self.counter)
+
+    def copy(self):
+        return CountedList(self._data[:], self.counter, self.plain)
+
+    def tolist(self):
+        # Valores sin envolver y sin contar
+        return list(self._data)
+
+
+def _depth_profiler(counter):
+    # sys.setprofile: profundidad de llamadas anidadas a código del repo
+    in_repo = {}
+
+    def tracked(code):
+        if code not in in_repo:
+            path = os.path.abspath(code.co_filename)
+            in_repo[code] = os.path.dirname(path) == _REPO_DIR and path != os.path.abspath(__file__)
+        return in_repo[code]
+
+    def profile(frame, event, arg):
+        if event == "call":
+            if tracked(frame.f_code):
+                counter.depth += 1
+                if counter.depth > counter.max_depth:
+                    counter.max_depth = counter.depth
+        elif event == "return":
+            if tracked(frame.f_code):
+                counter.depth -= 1
+    return profile
+
+
+def count_operations(sort_function, data, depth=True):
+    """
+    Ejecuta sort_function una vez sobre una CountedList con una copia de data.
+
+    Args:
+        sort_function (function): Algoritmo del repo que trabaje con listas
+        data (list): Datos de entrada (no se modifican)
+        depth (bool): Medir la profundidad máxima de llamadas con sys.setprofile
+                      (los algoritmos iterativos, como intro_sort, dan una
+                      profundidad casi constante)
+
+    Returns:
+        dict: {'reads', 'writes', 'comparisons', 'swaps', 'max_depth',
+               'comparisons_per_nlogn'}; 'swaps' solo para SWAP_ALGORITHMS
+    """
+    # Las funciones de Planificador.cell_algorithm pueden ser un partial
+    name = getattr(getattr(sort_function, "func", sort_function), "__name__", None)
+    counted = CountedList(list(data), plain=name in DISTRIBUTION_ALGORITHMS)
+    counter = counted.counter
+    if depth:
+        previous = sys.getprofile()
+        sys.setprofile(_depth_profiler(counter))
+    try:
+        sort_function(counted)
+    finally:
+        if depth:
+            sys.setprofile(previous)
+    if counted.tolist() != sorted(data):
+        name = getattr(sort_function, "__name__", repr(sort_function))
+        raise AssertionError(f"{name} no ordenó la CountedList")
+
+    ops = counter.as_dict()
+    if name not in SWAP_ALGORITHMS:
+        del ops['swaps']
+    n = len(data)
+    ops['comparisons_per_nlogn'] = ops['comparisons'] / (n * math.log2(n)) if n > 1 else 0.0
+    return ops
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    import random
+    from HeapSort import heap_sort
+    from MergeSort import merge_sort
+    from QuickSort import quick_sort
+    from TimSort import tim_sort
+
+    random.seed(0)
+    inputs = {
+        "random": [random.randint(0, 10**5) for _ in range(10000)],
+        "sorted": list(range(10000)),
+        "reversed": list(range(10000, 0, -1)),
+    }
+    for name, func in [("Quick Sort", quick_sort), ("Heap Sort", heap_sort),
+                       ("Merge Sort", merge_sort), ("Tim Sort", tim_sort)]:
+        for list_type, data in inputs.items():
+            ops = count_operations(func, data)
+            print(f"{name:10} {list_type:8}: {ops['comparisons']:>8} comparaciones "
+                  f"({ops['comparisons_per_nlogn']:.2f}·n log n), {ops['reads']:>8} lecturas, "
+                  f"{ops['writes']:>8} escrituras, {ops.get('swaps', '-'):>7} intercambios, "
+                  f"profundidad {ops['max_depth']}")
+
+    # Algoritmos por defecto de Probar2 (con radix y counting sort, que no
+    # comparan) por el mismo camino que run_benchmark(count_ops=True)
+    from Generadores import InputGenerator
+    from Planificador import run_cell
+    from Probar2 import ALGORITHMS, measure_performance
+
+    for name, func in ALGORITHMS.items():
+        cell = {"algo_name": name, "algo_func": func, "list_type": "random",
+                "generator": InputGenerator("random"), "size": 2000, "backend": "list",
+                "dtype": "int64", "seed": 0}
+        _, _, _, ops = run_cell(cell, measure_performance, 1, count_ops=True)
+        print(f"{name:14} random  : {ops['comparisons']:>8} comparaciones, "
+              f"{ops['reads']:>8} lecturas, {ops['writes']:>8} escrituras")
@@ -0,0 +1,249 @@
+import os
+import tempfile
+import timeit
+
+import numpy as np
+
+from HeapSort import push, pop
+from NumpySort import NUMPY_ALGORITHMS
+from TimSort import tim_sort
+
+# Valores por defecto: 64 MB de memoria para los tramos, hasta 16 tramos por
+# fusión y lecturas/escrituras de 64 K elementos
+MEMORY_BUDGET = 64 * 1024 * 1024
+FAN_IN = 16
+BUFFER_ITEMS = 64 * 1024
+
+
+class _Counter:
+    """Acumula los bytes leídos y escritos durante una ordenación externa."""
+
+    def __init__(self):
+        self.bytes_read = 0
+        self.bytes_written = 0
+
+
+def _read_chunks(path, fmt, dtype, chunk_items, counter):
+    # Genera arreglos de como mucho chunk_items elementos leídos del archivo
+    if fmt == "binary":
+        itemsize = np.dtype(dtype).itemsize
+        with open(path, "rb") as f:
+            while True:
+                raw = f.read(chunk_items * itemsize)
+                if not raw:
+                    break
+                counter.bytes_read += len(raw)
+                yield np.frombuffer(raw, dtype=dtype)
+    elif fmt == "text":
+        with open(path, "r") as f:
+            while True:
+                lines = f.readlines(chunk_items * np.dtype(dtype).itemsize)
+                if not lines:
+                    break
+                counter.bytes_read += sum(len(line) for line in lines)
+                parse = np.dtype(dtype).type
+                yield np.array([parse(line) for line in lines if line.strip()], dtype=dtype)
+    else:
+        raise ValueError(f"Formato desconocido: {fmt}")
+
+
+def _sort_in_memory(chunk, algorithm):
+    # Ordena un trozo con un algoritmo del repo (de listas o de ndarray)
+    if algorithm in NUMPY_ALGORITHMS.values():
+        chunk = chunk.copy()
+        algorithm(chunk)
+        return chunk
+    data = chunk.tolist()
+    algorithm(data)
+    return np.array(data, dtype=chunk.dtype)
+
+
+def _write_run(values, tmp_dir, counter):
+    # Vuelca un tramo ordenado a un archivo temporal binario
+    fd, path = tempfile.mkstemp(suffix=".run", dir=tmp_dir)
+    with os.fdopen(fd, "wb") as f:
+        f.write(values.tobytes())
+    counter.bytes_written += values.nbytes
+    return path
+
+
+def _merge_runs(run_paths, out, dtype, buffer_items, counter, fmt="binary"):
+    """
+    Fusión k-vías de tramos mapeados en memoria usando el heap de HeapSort.
+
+    HeapSort es un max-heap, así que se guardan claves (-valor, -tramo): se
+    extrae el menor valor y, a igualdad, el tramo más antiguo (fusión estable).
+    Cada tramo se lee por bloques de buffer_items elementos y la salida se
+    escribe en bloques del mismo tamaño.
+    """
+    maps = []
+    buffers = []
+    positions = []
+    for path in run_paths:
+        mm = np.memmap(path, dtype=dtype, mode="r") if os.path.getsize(path) else np.empty(0, dtype)
+        maps.append(mm)
+        buffers.append([])
+        positions.append(0)
+
+    def refill(r):
+        # Carga el siguiente bloque del tramo r; devuelve False si se agotó
+        start = positions[r]
+        block = maps[r][start:start + buffer_items]
+        positions[r] = start + len(block)
+        counter.bytes_read += block.nbytes
+        buffers[r] = block.tolist()[::-1]  # Invertido para usar pop() en O(1)
+        return bool(buffers[r])
+
+    heap = []
+    for r in range(len(maps)):
+        if refill(r):
+            push(heap, (-buffers[r].pop(), -r))
+
+    pending = []
+    while heap:
+        neg_value, neg_run = pop(heap)
+        pending.append(-neg_value)
+        r = -neg_run
+        if buffers[r] or refill(r):
+            push(heap, (-buffers[r].pop(), -r))
+        if len(pending) >= buffer_items:
+            _flush(out, pending, dtype, counter, fmt)
+            pending = []
+    _flush(out, pending, dtype, counter, fmt)
+    del maps
+
+
+def _flush(out, values, dtype, counter, fmt):
+    # Escribe un bloque de la salida en binario o en texto (un valor por línea)
+    if not values:
+        return
+    if fmt == "text":
+        text = "".join(f"{v}\n" for v in values).encode()
+        out.write(text)
+        counter.bytes_written += len(text)
+    else:
+        raw = np.array(values, dtype=dtype).tobytes()
+        out.write(raw)
+        counter.bytes_written += len(raw)
+
+
+def external_sort(input_path, output_path, algorithm=tim_sort, fmt="binary", dtype="int64",
+                  memory_budget=MEMORY_BUDGET, fan_in=FAN_IN, buffer_items=BUFFER_ITEMS,
+                  tmp_dir=None):
+    """
+    Ordenación externa (fuera de memoria) de un archivo de números.
+
+    1. Lee la entrada en trozos de memory_budget bytes, ordena cada trozo con
+       `algorithm` y lo vuelca a un tramo temporal binario.
+    2. Fusiona los tramos de fan_in en fan_in (k-vías con heap sobre archivos
+       mapeados en memoria) hasta que queda uno, que se escribe en output_path.
+
+    Args:
+        input_path (str): Archivo de entrada
+        output_path (str): Archivo de salida (mismo formato que la entrada)
+        algorithm (function): Algoritmo en memoria del repo (tim_sort, merge_sort, ...)
+        fmt (str): "binary" (valores de ancho fijo de tipo dtype) o "text" (uno por línea)
+        dtype (str): Tipo de los valores
+        memory_budget (int): Bytes de datos por trozo en memoria
+        fan_in (int): Máximo de tramos por fusión
+        buffer_items (int): Elementos por lectura/escritura durante la fusión
+        tmp_dir (str): Directorio donde crear el directorio temporal de los tramos
+
+    Returns:
+        dict: {'time', 'bytes_read', 'bytes_written', 'merge_passes', 'runs'}
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in debe ser al menos 2")
+    counter = _Counter()
+    chunk_items = max(1, memory_budget // np.dtype(dtype).itemsize)
+    start_time = timeit.default_timer()
+
+    # Todos los tramos, también los de las pasadas intermedias, viven en un
+    # directorio temporal propio que se borra entero aunque falle una fusión
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as work_dir:
+        # Fase 1: tramos ordenados
+        runs = []
+        for chunk in _read_chunks(input_path, fmt, dtype, chunk_items, counter):
+            runs.append(_write_run(_sort_in_memory(chunk, algorithm), work_dir, counter))
+        initial_runs = len(runs)
+
+        # Fase 2: pasadas de fusión intermedias hasta que quepan en una sola
+        merge_passes = 0
+        while len(runs) > fan_in:
+            merged = []
+            for k in range(0, len(runs), fan_in):
+                group = runs[k:k + fan_in]
+                fd, path = tempfile.mkstemp(suffix=".run", dir=work_dir)
+                merged.append(path)
+                with os.fdopen(fd, "wb") as out:
+                    _merge_runs(group, out, dtype, buffer_items, counter)
+                for old in group:
+                    os.remove(old)  # Libera disco sin esperar al final
+            runs = merged
+            merge_passes += 1
+
+        # Pasada final directamente al archivo de salida
+        with open(output_path, "wb") as out:
+            _merge_runs(runs, out, dtype, buffer_items, counter, fmt)
+        merge_passes += 1
+
+    return {
+        'time': timeit.default_timer() - start_time,
+        'bytes_read': counter.bytes_read,
+        'bytes_written': counter.bytes_written,
+        'merge_passes': merge_passes,
+        'runs': initial_runs,
+    }
+
+
+def run_external_benchmark(algorithms, list_types, sizes, memory_budget=MEMORY_BUDGET,
+                           fan_in=FAN_IN, dtype="int64", tmp_dir=None):
+    """
+    Ejecuta external_sort para cada algoritmo, tipo de lista y tamaño.
+
+    Returns:
+        dict: results[algo][list_type][size] = {'avg_time', 'bytes_read',
+              'bytes_written', 'merge_passes', 'runs'}
+    """
+    results = {}
+    for algo_name, algo_func in algorithms.items():
+        results[algo_name] = {}
+        for list_type, generator in list_types.items():
+            results[algo_name][list_type] = {}
+            for size in sizes:
+                print(f"Ejecutando {algo_name} externo con lista {list_type} de tamaño {size}...")
+                fd, input_path = tempfile.mkstemp(suffix=".bin", dir=tmp_dir)
+                with os.fdopen(fd, "wb") as f:
+                    f.write(np.array(generator(size), dtype=dtype).tobytes())
+                output_path = input_path + ".sorted"
+                try:
+                    stats = external_sort(input_path, output_path, algo_func, "binary", dtype,
+                                          memory_budget, fan_in, tmp_dir=tmp_dir)
+                finally:
+                    for path in (input_path, output_path):
+                        if os.path.exists(path):
+                            os.remove(path)
+                stats['avg_time'] = stats.pop('time')
+                results[algo_name][list_type][size] = stats
+    return results
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    from Probar2 import generate_random_list, generate_sorted_list, generate_reversed_list
+    from MergeSort import merge_sort
+
+    results = run_external_benchmark(
+        {"Tim Sort": tim_sort, "Merge Sort": merge_sort},
+        {"random": generate_random_list, "sorted": generate_sorted_list,
+         "reversed": generate_reversed_list},
+        [100000],
+        memory_budget=64 * 1024,
+        fan_in=4,
+    )
+    for algo, algo_data in results.items():
+        for list_type, type_data in algo_data.items():
+            for size, stats in type_data.items():
+                print(f"{algo} {list_type} {size}: {stats['avg_time']:.3f} s, "
+                      f"{stats['bytes_read']} B leídos, {stats['bytes_written']} B escritos, "
+                      f"{stats['merge_passes']} pasadas")
@@ -0,0 +1,171 @@
+import hashlib
+import os
+
+import numpy as np
+
+# Directorio por defecto de las entradas cacheadas (.npy)
+CACHE_DIR = "input_cache"
+
+# Cambiar si cambia la forma de generar alguna entrada, para invalidar la caché
+VERSION = 1
+
+# Rango de valores de las entradas aleatorias (el mismo que generate_random_list)
+MAX_VALUE = 10**5
+
+
+def _random(rng, size):
+    return rng.integers(0, MAX_VALUE + 1, size, dtype=np.int64)
+
+
+def _sorted(rng, size):
+    return np.arange(size, dtype=np.int64)
+
+
+def _reversed(rng, size):
+    return np.arange(size, 0, -1, dtype=np.int64)
+
+
+def _nearly_sorted(rng, size, k=None):
+    # Lista ordenada con k intercambios de pares al azar (1 % de n por defecto)
+    arr = np.arange(size, dtype=np.int64)
+    if size < 2:
+        return arr
+    k = max(1, size // 100) if k is None else k
+    i = rng.integers(0, size, k)
+    j = rng.integers(0, size, k)
+    for a, b in zip(i.tolist(), j.tolist()):
+        arr[a], arr[b] = arr[b], arr[a]
+    return arr
+
+
+def _few_unique(rng, size, k=10):
+    # Solo k valores distintos
+    return rng.integers(0, k, size, dtype=np.int64)
+
+
+def _organ_pipe(rng, size):
+    # Creciente hasta la mitad y luego decreciente: 0 1 2 ... 2 1 0
+    half = np.arange((size + 1) // 2, dtype=np.int64)
+    return np.concatenate([half, half[:size // 2][::-1]])
+
+
+def _sawtooth(rng, size, period=None):
+    # Rampas crecientes de longitud period (n/10 por defecto)
+    period = max(1, size // 10) if period is None else period
+    return np.arange(size, dtype=np.int64) % period
+
+
+def _zipf(rng, size, a=1.5):
+    # Valores con distribución de Zipf: muy pocos valores acaparan casi todo
+    return np.minimum(rng.zipf(a, size), MAX_VALUE).astype(np.int64)
+
+
+def _runs(rng, size, k=100):
+    # Tramos ordenados de longitud k con valores aleatorios
+    arr = _random(rng, size)
+    full = size - size % k
+    if full:
+        arr[:full] = np.sort(arr[:full].reshape(-1, k), axis=1).ravel()
+    arr[full:] = np.sort(arr[full:])
+    return arr
+
+
+GENERATORS = {
+    "random": _random,
+    "sorted": _sorted,
+    "reversed": _reversed,
+    "nearly_sorted": _nearly_sorted,
+    "few_unique": _few_unique,
+    "organ_pipe": _organ_pipe,
+    "sawtooth": _sawtooth,
+    "zipf": _zipf,
+    "runs": _runs,
+}
+
+
+def _cache_path(shape, size, seed, dtype, params, cache_dir):
+    # Nombre legible más un hash de los parámetros
+    spec = f"{VERSION}|{shape}|{size}|{seed}|{np.dtype(dtype).name}|{sorted(params.items())}"
+    digest = hashlib.sha256(spec.encode()).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{shape}_{size}_{seed}_{np.dtype(dtype).name}_{digest}.npy")
+
+
+def generate(shape, size, seed=0, dtype="int64", cache=True, cache_dir=CACHE_DIR, **params):
+    """
+    Genera una entrada de prueba con un numpy.random.Generator sembrado.
+
+    Con cache=True la primera llamada guarda el arreglo en cache_dir como .npy
+    y las siguientes lo cargan con mmap_mode="r", así una entrada de 10^7
+    elementos se construye una sola vez para todos los algoritmos y
+    repeticiones. El arreglo devuelto es de solo lectura; los algoritmos
+    trabajan sobre copias (ver Memoria.measure_time).
+
+    Args:
+        shape (str): Una de las claves de GENERATORS
+        size (int): Número de elementos
+        seed (int): Semilla del generador
+        dtype (str): Tipo del arreglo
+        cache (bool): Usar la caché en disco
+        cache_dir (str): Directorio de la caché
+        **params: Parámetros de la forma (k, period, a, ...)
+
+    Returns:
+        numpy.ndarray: Arreglo (numpy.memmap si viene de la caché)
+    """
+    if shape not in GENERATORS:
+        raise ValueError(f"Forma de entrada desconocida: {shape}")
+    if not cache:
+        return GENERATORS[shape](np.random.default_rng(seed), size, **params).astype(dtype)
+
+    path = _cache_path(shape, size, seed, dtype, params, cache_dir)
+    if not os.path.exists(path):
+        os.makedirs(cache_dir, exist_ok=True)
+        arr = GENERATORS[shape](np.random.default_rng(seed), size, **params).astype(dtype)
+        # Escribir a un temporal y renombrar: otro proceso nunca ve un .npy a medias
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, arr)
+        os.replace(tmp, path)
+    return np.load(path, mmap_mode="r")
+
+
+class InputGenerator:
+    """
+    Generador de entradas para las celdas de Planificador.run_cells.
+
+    Se llama como los generadores antiguos (generator(size)) pero recibe la
+    semilla de la celda, y se puede serializar para el pool de procesos.
+
+    Args:
+        shape (str): Una de las claves de GENERATORS
+        **params: Parámetros de la forma
+    """
+
+    __slots__ = ("shape", "params")
+
+    def __init__(self, shape, **params):
+        if shape not in GENERATORS:
+            raise ValueError(f"Forma de entrada desconocida: {shape}")
+        self.shape = shape
+        self.params = params
+
+    def __getstate__(self):
+        return self.shape, self.params
+
+    def __setstate__(self, state):
+        self.shape, self.params = state
+
+    def __call__(self, size, seed=0, dtype="int64", as_array=False):
+        arr = generate(self.shape, size, seed, dtype, **self.params)
+        return arr if as_array else arr.tolist()
+
+    def __repr__(self):
+        params = "".join(f", {k}={v!r}" for k, v in sorted(self.params.items()))
+        # También identifica la entrada en la clave del almacén de resultados
+        return f"InputGenerator({self.shape!r}{params}, v{VERSION})"
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    for shape in GENERATORS:
+        print(f"{shape:14}: {generate(shape, 20, seed=1, cache=False).tolist()}")
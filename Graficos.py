@@ -215,6 +215,18 @@ def load_results_from_file(filename):
         results = json.load(f)
     return results
 
+def load_results_from_store(path=None, machine=None):
+    """
+    Carga los resultados guardados por run_benchmark en el almacén SQLite
+    (ver Resultados.ResultStore), con la medición más reciente de cada celda.
+    """
+    from Resultados import ResultStore, DEFAULT_STORE
+    store = ResultStore(path or DEFAULT_STORE)
+    try:
+        return store.load_results(machine)
+    finally:
+        store.close()
+
 def plot_algorithms_by_size(results, sizes, list_types):
     import matplotlib.pyplot as plt
     import numpy as np
@@ -242,133 +254,31 @@ def plot_algorithms_by_size(results, sizes, list_types):
             plt.tight_layout()
             plt.show()
 
-if __name__ == "__main__":
-    # Ejemplo de uso:
-    # 1. Ejecutar el benchmark y guardar resultados
-    # benchmark_results = run_benchmark()
-    
-    # 2. Cargar resultados desde archivo (si ya los tienes guardados)
-    # benchmark_results = load_results_from_file('benchmark_results.json')
-    
-    # 3. Para este ejemplo, crearemos datos de prueba
-    benchmark_results = {
-        "BubbleSort": {
-            "random": {
-                100: {"avg_time": 0.000484, "std_time": 0.000026, "avg_memory_kb": 0.890625, "std_memory_kb": 0.0},
-                1000: {"avg_time": 0.642172, "std_time": 0.033457, "avg_memory_kb": 8.074219, "std_memory_kb": 0.0},
-                10000: {"avg_time": 83.775204, "std_time": 1.962586, "avg_memory_kb": 78.386719, "std_memory_kb": 0.0}
-            },
-            "sorted": {
-                100: {"avg_time": 0.000292, "std_time": 0.000015, "avg_memory_kb": 0.890625, "std_memory_kb": 0.0},
-                1000: {"avg_time": 0.300863, "std_time": 0.004979, "avg_memory_kb": 8.074219, "std_memory_kb": 0.0},
-                10000: {"avg_time": 50.554899, "std_time": 0.220369, "avg_memory_kb": 78.386719, "std_memory_kb": 0.0}
-            },
-            "reversed": {
-                100: {"avg_time": 0.000717, "std_time": 0.000177, "avg_memory_kb": 0.890625, "std_memory_kb": 0.0},
-                1000: {"avg_time": 0.668613, "std_time": 0.004676, "avg_memory_kb": 8.074219, "std_memory_kb": 0.0},
-                10000: {"avg_time": 112.233900, "std_time": 0.940154, "avg_memory_kb": 78.386719, "std_memory_kb": 0.0}
-            }
-        },
-        "InsertionSort": {
-           "random": {
-                100: {"avg_time": 0.000162, "std_time": 0.000009, "avg_memory_kb": 0.859375, "std_memory_kb": 0.0},
-                1000: {"avg_time": 0.237254, "std_time": 0.003641, "avg_memory_kb": 7.949219, "std_memory_kb": 0.0},
-                10000: {"avg_time": 29.798460, "std_time": 0.313564, "avg_memory_kb": 78.261719, "std_memory_kb": 0.0}
-            },
-            "sorted": {
-                100: {"avg_time": 0.000023,"std_time": 0.000003,"avg_memory_kb": 0.859375,"std_memory_kb": 0.0},
-                1000: {"avg_time": 0.001905,"std_time": 0.000478,"avg_memory_kb": 7.949219,"std_memory_kb": 0.0},
-                10000: {"avg_time": 0.021720,"std_time": 0.001732,"avg_memory_kb": 78.261719,"std_memory_kb": 0.0}
-            },
-            "reversed": {
-                100: {"avg_time": 0.001174,"std_time": 0.000348,"avg_memory_kb": 0.859375,"std_memory_kb": 0.0},
-                1000: {"avg_time": 0.369291,"std_time": 0.024555,"avg_memory_kb": 7.949219,"std_memory_kb": 0.0},
-                10000: {"avg_time": 56.562833,"std_time": 1.256957,"avg_memory_kb": 78.261719,"std_memory_kb": 0.0
-                }
-            }
-        },
-        "MergeSort": {
-            "random": {
-                100: {"avg_time": 0.000243, "std_time": 0.000002, "avg_memory_kb": 2.351562 , "std_memory_kb": 0},
-                1000: {"avg_time": 0.008943, "std_time": 0.002753, "avg_memory_kb": 23.468750 , "std_memory_kb": 0},
-                10000: {"avg_time": 0.191314 , "std_time": 0.004404, "avg_memory_kb": 234.562500, "std_memory_kb": 0},
-                100000: {"avg_time": 2.972735, "std_time": 0.035711 , "avg_memory_kb": 2344.039062, "std_memory_kb": 0}
-            },
-            "sorted": {
-                100: {"avg_time": 0.000315, "std_time": 0.000040, "avg_memory_kb": 2.351562 , "std_memory_kb": 0},
-                1000: {"avg_time": 0.006458, "std_time": 0.000398, "avg_memory_kb": 23.468750 , "std_memory_kb": 0},
-                10000: {"avg_time": 0.177929 , "std_time": 0.001913, "avg_memory_kb": 234.562500, "std_memory_kb": 0},
-                100000: {"avg_time": 2.902670, "std_time": 0.032817 , "avg_memory_kb": 2344.039062, "std_memory_kb": 0}
-            },
-            "reversed": {
-                100: {"avg_time": 0.000229, "std_time": 0.000026, "avg_memory_kb": 2.351562 , "std_memory_kb": 0},
-                1000: {"avg_time": 0.005984, "std_time": 0.000371, "avg_memory_kb": 23.468750 , "std_memory_kb": 0},
-                10000: {"avg_time": 0.168747  , "std_time": 0.001714, "avg_memory_kb": 234.562500, "std_memory_kb": 0},
-                100000: {"avg_time": 2.778870, "std_time": 0.032016 , "avg_memory_kb": 2344.039062, "std_memory_kb": 0}
-            }
-        },
-        "QuickSort": {
-            "random": {
-                100: {"avg_time": 0.000166, "std_time": 0.000029, "avg_memory_kb": 0.859375 , "std_memory_kb": 0},
-                1000: {"avg_time": 0.011089, "std_time": 0.000258, "avg_memory_kb": 9.140625 , "std_memory_kb": 0},
-                10000: {"avg_time": 0.155275 , "std_time": 0.001894, "avg_memory_kb": 80.031250, "std_memory_kb": 0},
-                100000: {"avg_time": 2.051004, "std_time": 0.028696 , "avg_memory_kb": 783.656250, "std_memory_kb": 0}
-            },
-            "sorted": {
-                100: {"avg_time": 0.000145, "std_time": 0.000003, "avg_memory_kb": 0.859375 , "std_memory_kb": 0},
-                1000: {"avg_time": 0.009682, "std_time": 0.000333, "avg_memory_kb": 8.500000 , "std_memory_kb": 0},
-                10000: {"avg_time": 0.143817 , "std_time": 0.000952, "avg_memory_kb": 79.046875, "std_memory_kb": 0},
-                100000: {"avg_time": 1.896959, "std_time": 0.003120 , "avg_memory_kb": 782.375000, "std_memory_kb": 0}
-            },
-            "reversed": {
-                100: {"avg_time": 0.000140, "std_time": 0.000001, "avg_memory_kb": 0.859375 , "std_memory_kb": 0},
-                1000: {"avg_time": 0.010890, "std_time": 0.000246, "avg_memory_kb": 8.687500 , "std_memory_kb": 0},
-                10000: {"avg_time": 0.158395  , "std_time": 0.003626, "avg_memory_kb": 79.250000, "std_memory_kb": 0},
-                100000: {"avg_time": 1.926926, "std_time": 0.012671 , "avg_memory_kb": 782.671875, "std_memory_kb": 0}
-            }
-        },
-        "HeapSort": {
-            "random": {
-                100: {"avg_time": 0.000145,"std_time": 0.000002,"avg_memory_kb": 0.859375,"std_memory_kb": 0.0},
-                1000: {"avg_time": 0.008012,"std_time": 0.000262,"avg_memory_kb": 8.121094,"std_memory_kb": 0.0},
-                10000: {"avg_time": 0.155017,"std_time": 0.001521,"avg_memory_kb": 78.683594,"std_memory_kb": 0.0},
-                100000: {"avg_time": 2.496411,"std_time": 0.035682,"avg_memory_kb": 781.996094,"std_memory_kb": 0.0}
-            },
-            "sorted": {
-                100: {"avg_time": 0.000162,"std_time": 0.000001,"avg_memory_kb": 0.859375,"std_memory_kb": 0.0},
-                1000: {"avg_time": 0.009225,"std_time": 0.000218,"avg_memory_kb": 8.121094,"std_memory_kb": 0.0},
-                10000: {"avg_time": 0.173144,"std_time": 0.001246,"avg_memory_kb": 78.683594,"std_memory_kb": 0.0},
-                100000: {"avg_time": 2.599946,"std_time": 0.025884,"avg_memory_kb": 781.996094,"std_memory_kb": 0.0}
-            },
-            "reversed": {
-                100: {"avg_time": 0.000153,"std_time": 0.000022,"avg_memory_kb": 0.859375,"std_memory_kb": 0.0},
-                1000: {"avg_time": 0.006719,"std_time": 0.000268,"avg_memory_kb": 8.121094,"std_memory_kb": 0.0},
-                10000: {"avg_time": 0.144183,"std_time": 0.000820,"avg_memory_kb": 78.683594,"std_memory_kb": 0.0},
-                100000: {"avg_time": 2.264706,"std_time": 0.018742,"avg_memory_kb": 781.996094,"std_memory_kb": 0.0}
-            }
-        },
-        "TimSort": {
-            "random": {
-                100: {"avg_time": 0.000103,"std_time": 0.000002,"avg_memory_kb": 1.593750,"std_memory_kb": 0.0},
-                1000: {"avg_time": 0.013615,"std_time": 0.000316,"avg_memory_kb": 15.996094,"std_memory_kb": 0.0},
-                10000: {"avg_time": 0.230496,"std_time": 0.007972,"avg_memory_kb": 156.621094,"std_memory_kb": 0.0},
-                100000: {"avg_time": 2.811472,"std_time": 0.086046,"avg_memory_kb": 1562.871094,"std_memory_kb": 0.0}
-            },
-            "sorted": {
-                100: {"avg_time": 0.000062,"std_time": 0.000011,"avg_memory_kb": 1.593750,"std_memory_kb": 0.0},
-                1000: {"avg_time": 0.006122,"std_time": 0.000249,"avg_memory_kb": 15.996094,"std_memory_kb": 0.0},
-                10000: {"avg_time": 0.133620,"std_time": 0.000659,"avg_memory_kb": 156.621094,"std_memory_kb": 0.0},
-                100000: {"avg_time": 1.890065,"std_time": 0.028225,"avg_memory_kb": 1562.871094,"std_memory_kb": 0.0}
-            },
-            "reversed": {
-                100: {"avg_time": 0.000154,"std_time": 0.000001,"avg_memory_kb": 1.593750,"std_memory_kb": 0.0},
-                1000: {"avg_time": 0.021831,"std_time": 0.000547,"avg_memory_kb": 15.996094,"std_memory_kb": 0.0},
-                10000: {"avg_time": 0.326647,"std_time": 0.001399,"avg_memory_kb": 156.621094,"std_memory_kb": 0.0},
-                100000: {"avg_time": 3.883152,"std_time": 0.052388,"avg_memory_kb": 1562.871094,"std_memory_kb": 0.0}
-            }
-        }     
-    }
-
+def plot_comparisons_per_nlogn(results, list_types=('random', 'sorted', 'reversed')):
+    """
+    Comparaciones / (n·log2 n) frente al tamaño, un gráfico por tipo de lista.
+    Necesita resultados medidos con count_ops=True (ver Contadores.py); una
+    curva plana indica n log n, una creciente un orden mayor.
+    """
+    for list_type in list_types:
+        plt.figure(figsize=(10, 6))
+        for algo, algo_data in results.items():
+            type_data = algo_data.get(list_type, {})
+            sizes = sorted(int(size) for size, metrics in type_data.items()
+                           if metrics and 'comparisons_per_nlogn' in metrics)
+            if not sizes:
+                continue
+            values = [type_data.get(size, type_data.get(str(size)))['comparisons_per_nlogn']
+                      for size in sizes]
+            plt.plot(sizes, values, '-o', label=algo)
+        plt.xscale('log')
+        plt.xlabel('Tamaño de la lista (n)')
+        plt.ylabel('Comparaciones / (n log n)')
+        plt.title(f'Comparaciones por n log n ({list_type})')
+        plt.grid(True, linestyle='--')
+        plt.legend()
+        plt.tight_layout()
+        plt.show()
 
 def plot_comparison_by_size_and_type(results):
     # Configuración general de los gráficos
@@ -517,10 +427,150 @@ def plot_comparison_by_size_and_type(results):
         plt.show()
 
 
+if __name__ == "__main__":
+    # Ejemplo de uso:
+    # 1. Ejecutar el benchmark y guardar resultados
+    # benchmark_results = run_benchmark()
     
-# Generar los gráficos
-plot_comparison_by_size_and_type(benchmark_results)
+    # 2. Cargar resultados desde archivo (si ya los tienes guardados)
+    # benchmark_results = load_results_from_file('benchmark_results.json')
+    # o directamente desde el almacén de resultados (se usa más abajo si existe)
+    # benchmark_results = load_results_from_store()
     
-# Generar los gráficos
-plot_benchmark_results(benchmark_results)
-plot_algorithms_by_size(benchmark_results, [100, 1000, 10000, 100000], ['random', 'sorted', 'reversed'])
\ No newline at end of file
+    # 3. Para este ejemplo, crearemos datos de prueba
+    benchmark_results = {
+        "BubbleSort": {
+            "random": {
+                100: {"avg_time": 0.000484, "std_time": 0.000026, "avg_memory_kb": 0.890625, "std_memory_kb": 0.0},
+                1000: {"avg_time": 0.642172, "std_time": 0.033457, "avg_memory_kb": 8.074219, "std_memory_kb": 0.0},
+                10000: {"avg_time": 83.775204, "std_time": 1.962586, "avg_memory_kb": 78.386719, "std_memory_kb": 0.0}
+            },
+            "sorted": {
+                100: {"avg_time": 0.000292, "std_time": 0.000015, "avg_memory_kb": 0.890625, "std_memory_kb": 0.0},
+                1000: {"avg_time": 0.300863, "std_time": 0.004979, "avg_memory_kb": 8.074219, "std_memory_kb": 0.0},
+                10000: {"avg_time": 50.554899, "std_time": 0.220369, "avg_memory_kb": 78.386719, "std_memory_kb": 0.0}
+            },
+            "reversed": {
+                100: {"avg_time": 0.000717, "std_time": 0.000177, "avg_memory_kb": 0.890625, "std_memory_kb": 0.0},
+                1000: {"avg_time": 0.668613, "std_time": 0.004676, "avg_memory_kb": 8.074219, "std_memory_kb": 0.0},
+                10000: {"avg_time": 112.233900, "std_time": 0.940154, "avg_memory_kb": 78.386719, "std_memory_kb": 0.0}
+            }
+        },
+        "InsertionSort": {
+           "random": {
+                100: {"avg_time": 0.000162, "std_time": 0.000009, "avg_memory_kb": 0.859375, "std_memory_kb": 0.0},
+                1000: {"avg_time": 0.237254, "std_time": 0.003641, "avg_memory_kb": 7.949219, "std_memory_kb": 0.0},
+                10000: {"avg_time": 29.798460, "std_time": 0.313564, "avg_memory_kb": 78.261719, "std_memory_kb": 0.0}
+            },
+            "sorted": {
+                100: {"avg_time": 0.000023,"std_time": 0.000003,"avg_memory_kb": 0.859375,"std_memory_kb": 0.0},
+                1000: {"avg_time": 0.001905,"std_time": 0.000478,"avg_memory_kb": 7.949219,"std_memory_kb": 0.0},
+                10000: {"avg_time": 0.021720,"std_time": 0.001732,"avg_memory_kb": 78.261719,"std_memory_kb": 0.0}
+            },
+            "reversed": {
+                100: {"avg_time": 0.001174,"std_time": 0.000348,"avg_memory_kb": 0.859375,"std_memory_kb": 0.0},
+                1000: {"avg_time": 0.369291,"std_time": 0.024555,"avg_memory_kb": 7.949219,"std_memory_kb": 0.0},
+                10000: {"avg_time": 56.562833,"std_time": 1.256957,"avg_memory_kb": 78.261719,"std_memory_kb": 0.0
+                }
+            }
+        },
+        "MergeSort": {
+            "random": {
+                100: {"avg_time": 0.000243, "std_time": 0.000002, "avg_memory_kb": 2.351562 , "std_memory_kb": 0},
+                1000: {"avg_time": 0.008943, "std_time": 0.002753, "avg_memory_kb": 23.468750 , "std_memory_kb": 0},
+                10000: {"avg_time": 0.191314 , "std_time": 0.004404, "avg_memory_kb": 234.562500, "std_memory_kb": 0},
+                100000: {"avg_time": 2.972735, "std_time": 0.035711 , "avg_memory_kb": 2344.039062, "std_memory_kb": 0}
+            },
+            "sorted": {
+                100: {"avg_time": 0.000315, "std_time": 0.000040, "avg_memory_kb": 2.351562 , "std_memory_kb": 0},
+                1000: {"avg_time": 0.006458, "std_time": 0.000398, "avg_memory_kb": 23.468750 , "std_memory_kb": 0},
+                10000: {"avg_time": 0.177929 , "std_time": 0.001913, "avg_memory_kb": 234.562500, "std_memory_kb": 0},
+                100000: {"avg_time": 2.902670, "std_time": 0.032817 , "avg_memory_kb": 2344.039062, "std_memory_kb": 0}
+            },
+            "reversed": {
+                100: {"avg_time": 0.000229, "std_time": 0.000026, "avg_memory_kb": 2.351562 , "std_memory_kb": 0},
+                1000: {"avg_time": 0.005984, "std_time": 0.000371, "avg_memory_kb": 23.468750 , "std_memory_kb": 0},
+                10000: {"avg_time": 0.168747  , "std_time": 0.001714, "avg_memory_kb": 234.562500, "std_memory_kb": 0},
+                100000: {"avg_time": 2.778870, "std_time": 0.032016 , "avg_memory_kb": 2344.039062, "std_memory_kb": 0}
+            }
+        },
+        "QuickSort": {
+            "random": {
+                100: {"avg_time": 0.000166, "std_time": 0.000029, "avg_memory_kb": 0.859375 , "std_memory_kb": 0},
+                1000: {"avg_time": 0.011089, "std_time": 0.000258, "avg_memory_kb": 9.140625 , "std_memory_kb": 0},
+                10000: {"avg_time": 0.155275 , "std_time": 0.001894, "avg_memory_kb": 80.031250, "std_memory_kb": 0},
+                100000: {"avg_time": 2.051004, "std_time": 0.028696 , "avg_memory_kb": 783.656250, "std_memory_kb": 0}
+            },
+            "sorted": {
+                100: {"avg_time": 0.000145, "std_time": 0.000003, "avg_memory_kb": 0.859375 , "std_memory_kb": 0},
+                1000: {"avg_time": 0.009682, "std_time": 0.000333, "avg_memory_kb": 8.500000 , "std_memory_kb": 0},
+                10000: {"avg_time": 0.143817 , "std_time": 0.000952, "avg_memory_kb": 79.046875, "std_memory_kb": 0},
+                100000: {"avg_time": 1.896959, "std_time": 0.003120 , "avg_memory_kb": 782.375000, "std_memory_kb": 0}
+            },
+            "reversed": {
+                100: {"avg_time": 0.000140, "std_time": 0.000001, "avg_memory_kb": 0.859375 , "std_memory_kb": 0},
+                1000: {"avg_time": 0.010890, "std_time": 0.000246, "avg_memory_kb": 8.687500 , "std_memory_kb": 0},
+                10000: {"avg_time": 0.158395  , "std_time": 0.003626, "avg_memory_kb": 79.250000, "std_memory_kb": 0},
+                100000: {"avg_time": 1.926926, "std_time": 0.012671 , "avg_memory_kb": 782.671875, "std_memory_kb": 0}
+            }
+        },
+        "HeapSort": {
+            "random": {
+                100: {"avg_time": 0.000145,"std_time": 0.000002,"avg_memory_kb": 0.859375,"std_memory_kb": 0.0},
+                1000: {"avg_time": 0.008012,"std_time": 0.000262,"avg_memory_kb": 8.121094,"std_memory_kb": 0.0},
+                10000: {"avg_time": 0.155017,"std_time": 0.001521,"avg_memory_kb": 78.683594,"std_memory_kb": 0.0},
+                100000: {"avg_time": 2.496411,"std_time": 0.035682,"avg_memory_kb": 781.996094,"std_memory_kb": 0.0}
+            },
+            "sorted": {
+                100: {"avg_time": 0.000162,"std_time": 0.000001,"avg_memory_kb": 0.859375,"std_memory_kb": 0.0},
+                1000: {"avg_time": 0.009225,"std_time": 0.000218,"avg_memory_kb": 8.121094,"std_memory_kb": 0.0},
+                10000: {"avg_time": 0.173144,"std_time": 0.001246,"avg_memory_kb": 78.683594,"std_memory_kb": 0.0},
+                100000: {"avg_time": 2.599946,"std_time": 0.025884,"avg_memory_kb": 781.996094,"std_memory_kb": 0.0}
+            },
+            "reversed": {
+                100: {"avg_time": 0.000153,"std_time": 0.000022,"avg_memory_kb": 0.859375,"std_memory_kb": 0.0},
+                1000: {"avg_time": 0.006719,"std_time": 0.000268,"avg_memory_kb": 8.121094,"std_memory_kb": 0.0},
+                10000: {"avg_time": 0.144183,"std_time": 0.000820,"avg_memory_kb": 78.683594,"std_memory_kb": 0.0},
+                100000: {"avg_time": 2.264706,"std_time": 0.018742,"avg_memory_kb": 781.996094,"std_memory_kb": 0.0}
+            }
+        },
+        "TimSort": {
+            "random": {
+                100: {"avg_time": 0.000103,"std_time": 0.000002,"avg_memory_kb": 1.593750,"std_memory_kb": 0.0},
+                1000: {"avg_time": 0.013615,"std_time": 0.000316,"avg_memory_kb": 15.996094,"std_memory_kb": 0.0},
+                10000: {"avg_time": 0.230496,"std_time": 0.007972,"avg_memory_kb": 156.621094,"std_memory_kb": 0.0},
+                100000: {"avg_time": 2.811472,"std_time": 0.086046,"avg_memory_kb": 1562.871094,"std_memory_kb": 0.0}
+            },
+            "sorted": {
+                100: {"avg_time": 0.000062,"std_time": 0.000011,"avg_memory_kb": 1.593750,"std_memory_kb": 0.0},
+                1000: {"avg_time": 0.006122,"std_time": 0.000249,"avg_memory_kb": 15.996094,"std_memory_kb": 0.0},
+                10000: {"avg_time": 0.133620,"std_time": 0.000659,"avg_memory_kb": 156.621094,"std_memory_kb": 0.0},
+                100000: {"avg_time": 1.890065,"std_time": 0.028225,"avg_memory_kb": 1562.871094,"std_memory_kb": 0.0}
+            },
+            "reversed": {
+                100: {"avg_time": 0.000154,"std_time": 0.000001,"avg_memory_kb": 1.593750,"std_memory_kb": 0.0},
+                1000: {"avg_time": 0.021831,"std_time": 0.000547,"avg_memory_kb": 15.996094,"std_memory_kb": 0.0},
+                10000: {"avg_time": 0.326647,"std_time": 0.001399,"avg_memory_kb": 156.621094,"std_memory_kb": 0.0},
+                100000: {"avg_time": 3.883152,"std_time": 0.052388,"avg_memory_kb": 1562.871094,"std_memory_kb": 0.0}
+            }
+        }     
+    }
+
+    # Si hay resultados medidos en el almacén, usarlos en lugar de los de ejemplo
+    import os
+    from Resultados import DEFAULT_STORE
+    if os.path.exists(DEFAULT_STORE):
+        benchmark_results = load_results_from_store(DEFAULT_STORE)
+
+    # Con --headless las figuras se guardan en archivos (ver Renderizado.py)
+    # en lugar de abrir una ventana por gráfico
+    import sys
+    if "--headless" in sys.argv:
+        from Renderizado import render_figures
+        summary = render_figures(benchmark_results, "figuras", formats=("png", "svg"))
+        print(f"{len(summary['rendered'])} figuras dibujadas, {len(summary['skipped'])} sin cambios")
+    else:
+        # Generar los gráficos
+        plot_comparison_by_size_and_type(benchmark_results)
+        plot_benchmark_results(benchmark_results)
+        plot_algorithms_by_size(benchmark_results, [100, 1000, 10000, 100000], ['random', 'sorted', 'reversed'])
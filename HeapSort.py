@@ -1,35 +1,129 @@
-def heap_sort(arr):
-    n = len(arr)
+# Motor de heaps máximos iterativo. Todas las primitivas aceptan la aridad d
+# (2 = binario, 4 u 8 mejoran la localidad en arreglos grandes) y un
+# desplazamiento low para trabajar sobre un tramo arr[low:low + n].
+# Los hijos del nodo i son d*i + 1 .. d*i + d y su padre es (i - 1) // d.
+
+from Autoajuste import tuned
+from Claves import sort_by_key
+from TimSort import CUTOFF, insertion_sort
+
+def sift_down(arr, n, i, low=0, d=2):
+    # Hunde el nodo i moviendo un "hueco" en lugar de intercambiar: cada
+    # nivel es una sola escritura y el elemento se coloca una vez al final
+    item = arr[low + i]
+    while True:
+        first = d * i + 1
+        if first >= n:
+            break
+        # Buscar el hijo mayor
+        best = first
+        best_val = arr[low + first]
+        if d == 2:
+            if first + 1 < n and arr[low + first + 1] > best_val:
+                best = first + 1
+                best_val = arr[low + best]
+        else:
+            for c in range(first + 1, min(first + d, n)):
+                if arr[low + c] > best_val:
+                    best = c
+                    best_val = arr[low + c]
+        if best_val <= item:
+            break
+        arr[low + i] = best_val
+        i = best
+    arr[low + i] = item
+
+def sift_up(arr, i, low=0, d=2):
+    # Sube el nodo i mientras sea mayor que su padre (también con hueco)
+    item = arr[low + i]
+    while i > 0:
+        parent = (i - 1) // d
+        if arr[low + parent] >= item:
+            break
+        arr[low + i] = arr[low + parent]
+        i = parent
+    arr[low + i] = item
+
+def heapify(arr, n=None, low=0, d=2):
+    # Construye un max-heap sobre arr[low:low + n] hundiendo los nodos
+    # internos desde el último hasta la raíz
+    if n is None:
+        n = len(arr) - low
+    for i in range((n - 2) // d, -1, -1):
+        sift_down(arr, n, i, low, d)
+
+def push(heap, item, d=2):
+    # Inserta item en el heap (lista) y restablece el orden
+    heap.append(item)
+    sift_up(heap, len(heap) - 1, 0, d)
+
+def pop(heap, d=2):
+    # Extrae y devuelve el máximo del heap (lista)
+    last = heap.pop()
+    if not heap:
+        return last
+    top = heap[0]
+    heap[0] = last
+    sift_down(heap, len(heap), 0, 0, d)
+    return top
+
+def _floyd_sift(arr, n, item, low=0, d=2):
+    # Truco de Floyd para la extracción: el elemento que sube desde el final
+    # casi siempre acaba cerca de una hoja, así que primero se baja el hueco
+    # hasta una hoja sin comparar con item y luego se sube item desde ahí.
+    # Con d = 2 ahorra casi la mitad de las comparaciones
+    i = 0
+    while True:
+        first = d * i + 1
+        if first >= n:
+            break
+        best = first
+        if d == 2:
+            if first + 1 < n and arr[low + first + 1] > arr[low + first]:
+                best = first + 1
+        else:
+            best_val = arr[low + first]
+            for c in range(first + 1, min(first + d, n)):
+                if arr[low + c] > best_val:
+                    best = c
+                    best_val = arr[low + c]
+        arr[low + i] = arr[low + best]
+        i = best
+    arr[low + i] = item
+    sift_up(arr, i, low, d)
+
+def heap_sort(arr, low=0, high=None, d=None, cutoff=None, key=None, reverse=False):
+    # Por defecto se ordena todo el arreglo; low/high (inclusivos) permiten
+    # ordenar solo un tramo, como hace IntroSort en su caso de respaldo.
+    # Cuando al heap le quedan cutoff elementos (los menores) se terminan con
+    # el insertion sort binario de TimSort; cutoff=1 extrae hasta el final.
+    # d y cutoff en None se toman del perfil de Autoajuste.py (o 2 y
+    # TimSort.CUTOFF). key=/reverse= ordenan la lista completa (ver Claves.py)
+    if key is not None or reverse:
+        return sort_by_key(heap_sort, arr, key, reverse, d=d, cutoff=cutoff)
+    if high is None:
+        high = len(arr) - 1
+    n = high - low + 1
+    if d is None or cutoff is None:
+        profile = tuned("heap_sort", arr, n)
+        d = profile.get("d", 2) if d is None else d
+        cutoff = profile.get("cutoff", CUTOFF) if cutoff is None else cutoff
+    cutoff = max(cutoff, 1)
+    if n <= cutoff:
+        insertion_sort(arr, low, high)
+        return arr
     
     # Construir un max-heap
-    for i in range(n // 2 - 1, -1, -1):
-        heapify(arr, n, i)
+    heapify(arr, n, low, d)
     
     # Extraer elementos uno por uno
-    for i in range(n - 1, 0, -1):
-        # Mover la raíz actual al final
-        arr[i], arr[0] = arr[0], arr[i]
-        # Llamar heapify en el heap reducido
-        heapify(arr, i, 0)
-
-def heapify(arr, n, i):
-    largest = i  # Inicializar el más grande como raíz
-    left = 2 * i + 1
-    right = 2 * i + 2
-    
-    # Verificar si el hijo izquierdo existe y es mayor que la raíz
-    if left < n and arr[left] > arr[largest]:
-        largest = left
-    
-    # Verificar si el hijo derecho existe y es mayor que el mayor actual
-    if right < n and arr[right] > arr[largest]:
-        largest = right
-    
-    # Cambiar la raíz si es necesario
-    if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]  # Swap
-        # Heapify el subárbol afectado
-        heapify(arr, n, largest)
+    for end in range(n - 1, cutoff - 1, -1):
+        # Mover la raíz actual al final y reubicar el elemento desplazado
+        item = arr[low + end]
+        arr[low + end] = arr[low]
+        _floyd_sift(arr, end, item, low, d)
+    insertion_sort(arr, low, low + cutoff - 1)
+    return arr
 
 # Ejemplo de uso
 if __name__ == "__main__":
@@ -1,15 +1,19 @@
-def insertion_sort(arr):
+from Claves import sort_by_key
+
+def insertion_sort(arr, key=None, reverse=False):
+    if key is not None or reverse:
+        return sort_by_key(insertion_sort, arr, key, reverse)
     # Recorremos desde el segundo elemento hasta el final
     for i in range(1, len(arr)):
-        key = arr[i]  # Elemento actual a insertar en su posición correcta
+        current = arr[i]  # Elemento actual a insertar en su posición correcta
         
-        # Movemos los elementos de arr[0..i-1] que son mayores que key
+        # Movemos los elementos de arr[0..i-1] que son mayores que current
         # a una posición adelante de su posición actual
         j = i - 1
-        while j >= 0 and key < arr[j]:
+        while j >= 0 and current < arr[j]:
             arr[j + 1] = arr[j]
             j -= 1
-        arr[j + 1] = key  # Insertamos key en su posición correcta
+        arr[j + 1] = current  # Insertamos current en su posición correcta
 
 # Ejemplo de uso
 if __name__ == "__main__":
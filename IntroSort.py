@@ -0,0 +1,188 @@
+import random
+
+from Autoajuste import tuned
+from Claves import sort_by_key
+from HeapSort import heap_sort
+from TimSort import CUTOFF, insertion_sort
+
+PIVOT_STRATEGIES = ("random", "middle", "last", "median3", "ninther")
+
+
+def _median3(arr, a, b, c):
+    """Devuelve el índice (a, b o c) cuyo valor es la mediana de los tres."""
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b
+        return c if arr[a] < arr[c] else a
+    if arr[a] < arr[c]:
+        return a
+    return c if arr[b] < arr[c] else b
+
+
+def choose_pivot(arr, low, high, strategy="random"):
+    """
+    Elige el índice del pivote dentro de arr[low..high] (inclusivo).
+
+    Args:
+        arr (list): Lista a ordenar
+        low (int): Primer índice del tramo
+        high (int): Último índice del tramo
+        strategy (str): "random", "middle", "last", "median3" o "ninther"
+
+    Returns:
+        int: Índice del pivote
+    """
+    if strategy == "random":
+        return random.randint(low, high)
+    if strategy == "middle":
+        return (low + high) // 2
+    if strategy == "last":
+        return high
+    mid = (low + high) // 2
+    if strategy == "median3":
+        return _median3(arr, low, mid, high)
+    if strategy == "ninther":
+        # Mediana de las medianas de tres ternas (Tukey); en tramos cortos
+        # basta con la mediana de tres
+        if high - low < 40:
+            return _median3(arr, low, mid, high)
+        step = (high - low + 1) // 8
+        return _median3(
+            arr,
+            _median3(arr, low, low + step, low + 2 * step),
+            _median3(arr, mid - step, mid, mid + step),
+            _median3(arr, high - 2 * step, high - step, high),
+        )
+    raise ValueError(f"Estrategia de pivote desconocida: {strategy}")
+
+
+def partition(arr, low, high, strategy="random"):
+    # Llevar el pivote elegido al final y particionar (Lomuto)
+    pivot_idx = choose_pivot(arr, low, high, strategy)
+    arr[pivot_idx], arr[high] = arr[high], arr[pivot_idx]
+    pivot = arr[high]
+    i = low - 1
+
+    for j in range(low, high):
+        # Si el elemento actual es menor o igual al pivote
+        if arr[j] <= pivot:
+            i += 1
+            arr[i], arr[j] = arr[j], arr[i]
+
+    # Intercambiamos el pivote con el elemento en i+1
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    return i + 1
+
+
+def partition3(arr, low, high, strategy="random"):
+    """
+    Partición de tres vías (bandera holandesa) de arr[low..high].
+
+    Deja arr[low..lt-1] < pivote, arr[lt..gt] == pivote y arr[gt+1..high] > pivote.
+    Con muchos duplicados el bloque central no vuelve a procesarse.
+
+    Returns:
+        tuple: (lt, gt)
+    """
+    pivot = arr[choose_pivot(arr, low, high, strategy)]
+    lt, i, gt = low, low, high
+    while i <= gt:
+        if arr[i] < pivot:
+            arr[lt], arr[i] = arr[i], arr[lt]
+            lt += 1
+            i += 1
+        elif arr[i] > pivot:
+            arr[i], arr[gt] = arr[gt], arr[i]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def intro_sort(arr, low=0, high=None, pivot=None, three_way=False, cutoff=None,
+               final_pass=False, key=None, reverse=False):
+    """
+    Introsort iterativo con pila explícita.
+
+    Sigue con el lado más pequeño de cada partición y guarda el más grande en
+    la pila, así la pila nunca pasa de log2(n) tramos. Cuando la profundidad
+    supera 2·log2(n) el tramo se termina con heap_sort, por lo que el peor
+    caso es O(n log n) aunque el pivote sea malo (por ejemplo "last" sobre
+    listas ordenadas).
+
+    Los tramos de cutoff elementos o menos no se parten: se ordenan con el
+    insertion sort binario de TimSort o, con final_pass=True, se dejan sin
+    ordenar y una sola pasada de insertion_sort sobre todo el rango los
+    termina al final (cada elemento está a menos de cutoff posiciones de su
+    sitio, así que la pasada es casi lineal).
+
+    Args:
+        arr (list): Lista a ordenar (se modifica en el lugar)
+        low (int): Primer índice a ordenar
+        high (int): Último índice a ordenar (inclusivo); None = len(arr) - 1
+        pivot (str): Estrategia de pivote (ver PIVOT_STRATEGIES); None = la del
+            perfil de Autoajuste.py o "random"
+        three_way (bool): Usar partición de tres vías (útil con muchos duplicados)
+        cutoff (int): Tamaño máximo de tramo para insertion sort; 1 = partir
+            hasta el final, como el quicksort clásico; None = perfil o CUTOFF
+        final_pass (bool): Dejar los tramos pequeños sin ordenar y terminar con
+            una única pasada de insertion sort
+        key (function): Función clave, calculada una vez por elemento; con key
+            o reverse se ordena la lista completa de forma estable (ver Claves.py)
+        reverse (bool): Orden descendente
+
+    Returns:
+        list: La misma lista, ordenada
+    """
+    if key is not None or reverse:
+        return sort_by_key(intro_sort, arr, key, reverse, pivot=pivot, three_way=three_way,
+                           cutoff=cutoff, final_pass=final_pass)
+    if high is None:
+        high = len(arr) - 1
+    if high <= low:
+        return arr
+    if pivot is None or cutoff is None:
+        profile = tuned("intro_sort", arr, high - low + 1)
+        pivot = profile.get("pivot", "random") if pivot is None else pivot
+        cutoff = profile.get("cutoff", CUTOFF) if cutoff is None else cutoff
+
+    cutoff = max(cutoff, 1)
+    max_depth = 2 * ((high - low + 1).bit_length() - 1)
+    stack = [(low, high, max_depth)]
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo >= cutoff:
+            if depth == 0:
+                heap_sort(arr, lo, hi)
+                break
+            depth -= 1
+            if three_way:
+                left_hi, right_lo = partition3(arr, lo, hi, pivot)
+                left_hi -= 1
+                right_lo += 1
+            else:
+                pi = partition(arr, lo, hi, pivot)
+                left_hi, right_lo = pi - 1, pi + 1
+            # Guardar el lado grande y continuar con el pequeño
+            if left_hi - lo < hi - right_lo:
+                stack.append((right_lo, hi, depth))
+                hi = left_hi
+            else:
+                stack.append((lo, left_hi, depth))
+                lo = right_lo
+        else:
+            # Tramo pequeño (el break de heap_sort no pasa por aquí)
+            if lo < hi and not final_pass:
+                insertion_sort(arr, lo, hi)
+    if final_pass:
+        insertion_sort(arr, low, high)
+    return arr
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    datos = [10, 7, 8, 9, 1, 5, 7, 7, 3]
+    print("Arreglo original:", datos)
+
+    intro_sort(datos, pivot="ninther", three_way=True)
+    print("Arreglo ordenado:", datos)
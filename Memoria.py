@@ -0,0 +1,232 @@
+import multiprocessing
+import os
+import sys
+import threading
+import timeit
+import tracemalloc
+
+try:
+    import resource  # Solo Unix
+except ImportError:
+    resource = None
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Motor de medición de memoria. El tiempo y la memoria se miden en pasadas
+# separadas: primero una ejecución cronometrada sin ningún instrumento y luego
+# otra, sobre una copia nueva de los datos, con el backend de memoria elegido.
+# Todos los backends devuelven KB (1024 bytes) e incluyen la copia de la
+# entrada que recibe el algoritmo, como hacía Probar2.
+#
+# Backends:
+#   "tracemalloc"  Pico de memoria reservada por Python (objetos y buffers de
+#                  NumPy) durante la ejecución. Exacto y determinista, pero
+#                  traza cada reserva: ralentiza 2-5 veces los algoritmos que
+#                  reservan mucho (merge_sort recursivo). No ve memoria
+#                  reservada fuera del intérprete.
+#   "rusage"       Marca de agua del RSS (resource.getrusage, ru_maxrss) en un
+#                  proceso nuevo, restando la marca tras recibir los datos. Ve
+#                  todo el proceso (también extensiones en C) con resolución
+#                  de página, pero la marca solo crece: memoria reutilizada
+#                  del propio intérprete no cuenta. Costo: un proceso "spawn"
+#                  por medición (~0.1 s) y la función debe poder serializarse.
+#   "poller"       Un hilo muestrea el RSS (psutil o /proc/self/statm) cada
+#                  `interval` segundos y se queda con el pico menos el RSS
+#                  inicial, como memory_profiler. Puede perder picos más
+#                  cortos que el intervalo y el hilo compite por el GIL, de
+#                  ahí que se mida en una pasada aparte.
+
+BACKENDS = ("tracemalloc", "rusage", "poller")
+DEFAULT_BACKEND = "tracemalloc"
+POLL_INTERVAL = 0.001
+
+# ru_maxrss está en KB en Linux y en bytes en macOS
+_MAXRSS_SCALE = 1024 if sys.platform == "darwin" else 1
+
+
+def measure_time(sort_function, data):
+    """
+    Pasada de tiempo sin instrumentar.
+
+    Returns:
+        tuple: (tiempo_ejecucion, lista_ordenada)
+    """
+    copy = data.copy()
+    start_time = timeit.default_timer()
+    sorted_data = sort_function(copy)
+    end_time = timeit.default_timer()
+    return end_time - start_time, sorted_data
+
+
+def _tracemalloc_peak(sort_function, data):
+    tracemalloc.start()
+    try:
+        sort_function(data.copy())
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def _maxrss_kb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / _MAXRSS_SCALE
+
+
+def _rusage_child(conn, sort_function, data):
+    # Proceso nuevo: la marca de agua solo refleja este proceso
+    try:
+        before = _maxrss_kb()
+        sort_function(data.copy())
+        conn.send((True, _maxrss_kb() - before))
+    except BaseException as error:
+        conn.send((False, error))
+    finally:
+        conn.close()
+
+
+def _rusage_peak(sort_function, data):
+    if resource is None:
+        raise RuntimeError("El backend 'rusage' necesita el módulo resource (Unix)")
+    ctx = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_rusage_child, args=(child_conn, sort_function, data))
+    process.start()
+    child_conn.close()
+    try:
+        ok, value = parent_conn.recv()
+    finally:
+        parent_conn.close()
+        process.join()
+    if not ok:
+        raise value
+    return value
+
+
+def _current_rss_kb():
+    # RSS actual del proceso en KB
+    if psutil is not None:
+        return psutil.Process(os.getpid()).memory_info().rss / 1024
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except OSError:
+        raise RuntimeError("El backend 'poller' necesita psutil o /proc/self/statm")
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1024
+
+
+def _poller_peak(sort_function, data, interval=POLL_INTERVAL):
+    baseline = _current_rss_kb()
+    peak = [baseline]
+    done = threading.Event()
+
+    def poll():
+        while not done.is_set():
+            rss = _current_rss_kb()
+            if rss > peak[0]:
+                peak[0] = rss
+            done.wait(interval)
+
+    thread = threading.Thread(target=poll, daemon=True)
+    thread.start()
+    try:
+        sort_function(data.copy())
+    finally:
+        done.set()
+        thread.join()
+    peak[0] = max(peak[0], _current_rss_kb())
+    return peak[0] - baseline
+
+
+def measure_memory(sort_function, data, backend=DEFAULT_BACKEND):
+    """
+    Pasada de memoria con el backend indicado (ver el comentario de BACKENDS).
+
+    Args:
+        sort_function (function): Función de ordenamiento
+        data (list | numpy.ndarray): Datos de entrada (no se modifican)
+        backend (str): "tracemalloc", "rusage" o "poller"
+
+    Returns:
+        float: Memoria en KB
+    """
+    if backend == "tracemalloc":
+        return _tracemalloc_peak(sort_function, data)
+    if backend == "rusage":
+        return _rusage_peak(sort_function, data)
+    if backend == "poller":
+        return _poller_peak(sort_function, data)
+    raise ValueError(f"Backend de memoria desconocido: {backend}")
+
+
+def measure_performance(sort_function, data, backend=DEFAULT_BACKEND):
+    """
+    Mide el tiempo y la memoria de una función de ordenamiento en dos pasadas.
+
+    Args:
+        sort_function (function): Función de ordenamiento a probar
+        data (list): Lista de datos a ordenar
+        backend (str): Backend de memoria
+
+    Returns:
+        tuple: (tiempo_ejecucion, memoria_usada_kb, lista_ordenada)
+    """
+    execution_time, sorted_data = measure_time(sort_function, data)
+    memory_used_kb = measure_memory(sort_function, data, backend)
+    return execution_time, memory_used_kb, sorted_data
+
+
+# Una función por backend, con la firma measure(sort_function, data) que
+# espera Planificador.run_cells (deben poder serializarse con pickle)
+def measure_tracemalloc(sort_function, data):
+    return measure_performance(sort_function, data, "tracemalloc")
+
+
+def measure_rusage(sort_function, data):
+    return measure_performance(sort_function, data, "rusage")
+
+
+def measure_poller(sort_function, data):
+    return measure_performance(sort_function, data, "poller")
+
+
+MEASURES = {
+    "tracemalloc": measure_tracemalloc,
+    "rusage": measure_rusage,
+    "poller": measure_poller,
+}
+
+
+# Solo la pasada de memoria de cada función de MEASURES, para cuando el
+# tiempo se mide aparte (muestreo adaptativo de Planificador.run_cell)
+def memory_tracemalloc(sort_function, data):
+    return measure_memory(sort_function, data, "tracemalloc")
+
+
+def memory_rusage(sort_function, data):
+    return measure_memory(sort_function, data, "rusage")
+
+
+def memory_poller(sort_function, data):
+    return measure_memory(sort_function, data, "poller")
+
+
+MEMORY_ONLY = {
+    measure_tracemalloc: memory_tracemalloc,
+    measure_rusage: memory_rusage,
+    measure_poller: memory_poller,
+}
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    import random
+    from MergeSort import merge_sort
+
+    random.seed(0)
+    datos = [random.randint(0, 10**5) for _ in range(100000)]
+    for name, measure in MEASURES.items():
+        execution_time, memory_kb, _ = measure(merge_sort, datos)
+        print(f"{name:12}: {execution_time:.3f} s, {memory_kb:.1f} KB")
@@ -1,19 +1,42 @@
-def merge_sort(arr):
-    if len(arr) > 1:
+from Autoajuste import tuned
+from Claves import sort_by_key
+from TimSort import CUTOFF, insertion_sort
+
+def merge_sort(arr, mode="recursive", cutoff=None, key=None, reverse=False):
+    # mode: "recursive" (versión original con slices), "buffer" (un único
+    # buffer de tamaño n) o "half" (buffer de tamaño n/2). Los tres modos son
+    # estables, también con key=/reverse= (ver Claves.py). Las listas de
+    # cutoff elementos o menos se ordenan con el insertion sort binario de
+    # TimSort en lugar de seguir dividiendo; cutoff=1 divide hasta el final y
+    # None usa el perfil de Autoajuste.py o TimSort.CUTOFF.
+    if key is not None or reverse:
+        return sort_by_key(merge_sort, arr, key, reverse, mode=mode, cutoff=cutoff)
+    if mode == "buffer":
+        return merge_sort_buffer(arr, cutoff)
+    if mode == "half":
+        return merge_sort_half_buffer(arr, cutoff)
+    if mode != "recursive":
+        raise ValueError(f"Modo desconocido: {mode}")
+    if cutoff is None:
+        cutoff = tuned("merge_sort", arr).get("cutoff", CUTOFF)
+    if 1 < len(arr) <= cutoff:
+        insertion_sort(arr)
+    elif len(arr) > 1:
         # Dividir el arreglo en dos mitades
         mid = len(arr) // 2
         left_half = arr[:mid]
         right_half = arr[mid:]
 
         # Llamada recursiva para cada mitad
-        merge_sort(left_half)
-        merge_sort(right_half)
+        merge_sort(left_half, cutoff=cutoff)
+        merge_sort(right_half, cutoff=cutoff)
 
         # Fusionar las mitades ordenadas
         i = j = k = 0
 
         while i < len(left_half) and j < len(right_half):
-            if left_half[i] < right_half[j]:
+            # <= toma el de la izquierda en los empates: fusión estable
+            if left_half[i] <= right_half[j]:
                 arr[k] = left_half[i]
                 i += 1
             else:
@@ -32,6 +55,144 @@ def merge_sort(arr):
             arr[k] = right_half[j]
             j += 1
             k += 1
+    return arr
+
+def _sort_blocks(arr, n, width):
+    # Ordena en el lugar cada bloque de `width` elementos (el último puede ser
+    # más corto); son los tramos iniciales de las versiones de abajo hacia arriba
+    if width > 1:
+        for lo in range(0, n, width):
+            insertion_sort(arr, lo, min(lo + width, n) - 1)
+
+def merge_sort_buffer(arr, cutoff=None):
+    """
+    Merge Sort de abajo hacia arriba con un único buffer auxiliar de tamaño n.
+
+    En cada pasada se fusionan pares de tramos de src en dst y luego se
+    intercambian los papeles (ping-pong), así no se crean sublistas en cada
+    nivel como en la versión recursiva. Si el último de la izquierda es <= que
+    el primero de la derecha, el par ya está ordenado y solo se copia. Los
+    tramos iniciales (de cutoff elementos) se ordenan con insertion sort.
+
+    Args:
+        arr (list): Lista a ordenar (se modifica en el lugar)
+        cutoff (int): Tamaño de los tramos iniciales; None = perfil o TimSort.CUTOFF
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+    if cutoff is None:
+        cutoff = tuned("merge_sort_buffer", arr).get("cutoff", CUTOFF)
+    width = max(cutoff, 1)
+    passes = 0
+    while width << passes < n:
+        passes += 1
+    # Con un número impar de pasadas el resultado acabaría en el buffer; los
+    # tramos iniciales se duplican (una pasada menos) para que termine en arr
+    if passes % 2 == 1:
+        width *= 2
+    _sort_blocks(arr, n, width)
+    src = arr
+    dst = arr[:]  # Única reserva de memoria auxiliar
+    
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid >= hi or src[mid - 1] <= src[mid]:
+                for k in range(lo, hi):
+                    dst[k] = src[k]
+                continue
+            
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if src[j] < src[i]:
+                    dst[k] = src[j]
+                    j += 1
+                else:
+                    dst[k] = src[i]
+                    i += 1
+                k += 1
+            
+            # Copiar lo que quede de cualquiera de las dos mitades (elemento a
+            # elemento para no crear sublistas temporales)
+            while i < mid:
+                dst[k] = src[i]
+                i += 1
+                k += 1
+            while j < hi:
+                dst[k] = src[j]
+                j += 1
+                k += 1
+        src, dst = dst, src
+        width *= 2
+    return arr
+
+def merge_sort_half_buffer(arr, cutoff=None):
+    """
+    Merge Sort de abajo hacia arriba con un buffer auxiliar de tamaño n/2.
+
+    Solo se copia al buffer el más corto de los dos tramos y la fusión se hace
+    sobre arr: de izquierda a derecha si el corto es el izquierdo, de derecha a
+    izquierda si es el derecho. Los pares ya ordenados no se tocan. Los tramos
+    iniciales (de cutoff elementos) se ordenan con insertion sort.
+
+    Args:
+        arr (list): Lista a ordenar (se modifica en el lugar)
+        cutoff (int): Tamaño de los tramos iniciales; None = perfil o TimSort.CUTOFF
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+    if cutoff is None:
+        cutoff = tuned("merge_sort_half_buffer", arr).get("cutoff", CUTOFF)
+    buf = [None] * ((n + 1) // 2)  # Única reserva de memoria auxiliar
+    width = max(cutoff, 1)
+    _sort_blocks(arr, n, width)
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid >= hi or arr[mid - 1] <= arr[mid]:
+                continue
+            
+            len1, len2 = mid - lo, hi - mid
+            if len1 <= len2:
+                # Copiar la izquierda y fusionar hacia adelante
+                for t in range(len1):
+                    buf[t] = arr[lo + t]
+                i, j, k = 0, mid, lo
+                while i < len1 and j < hi:
+                    if arr[j] < buf[i]:
+                        arr[k] = arr[j]
+                        j += 1
+                    else:
+                        arr[k] = buf[i]
+                        i += 1
+                    k += 1
+                while i < len1:
+                    arr[k] = buf[i]
+                    i += 1
+                    k += 1
+            else:
+                # Copiar la derecha y fusionar hacia atrás
+                for t in range(len2):
+                    buf[t] = arr[mid + t]
+                i, j, k = mid - 1, len2 - 1, hi - 1
+                while i >= lo and j >= 0:
+                    if buf[j] < arr[i]:
+                        arr[k] = arr[i]
+                        i -= 1
+                    else:
+                        arr[k] = buf[j]
+                        j -= 1
+                    k -= 1
+                while j >= 0:
+                    arr[k] = buf[j]
+                    j -= 1
+                    k -= 1
+        width *= 2
+    return arr
 
 # Ejemplo de uso
 if __name__ == "__main__":
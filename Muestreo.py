@@ -0,0 +1,129 @@
+import math
+import time
+import timeit
+
+# Duración mínima de una muestra: muy por encima de la resolución del reloj
+MIN_SAMPLE_TIME = max(0.01, 1000 * time.get_clock_info("perf_counter").resolution)
+
+# Valor z para un intervalo de confianza del 95 %
+Z_95 = 1.959964
+
+# Segundos por celda por defecto
+DEFAULT_BUDGET = 10.0
+
+
+def autorange(sort_function, data, min_sample_time=MIN_SAMPLE_TIME):
+    """
+    Elige cuántas ejecuciones agrupar en una muestra, como timeit.autorange.
+
+    Prueba 1, 2, 5, 10, 20, 50, ... ejecuciones seguidas hasta que el lote dura
+    al menos min_sample_time. Las copias de los datos se preparan antes de
+    cronometrar para que el tiempo sea solo el de ordenar.
+
+    Returns:
+        tuple: (ejecuciones por muestra, tiempo por ejecución del último lote)
+    """
+    number = 1
+    while True:
+        for factor in (1, 2, 5):
+            loops = number * factor
+            elapsed = time_batch(sort_function, data, loops)
+            if elapsed >= min_sample_time:
+                return loops, elapsed / loops
+        number *= 10
+
+
+def time_batch(sort_function, data, loops):
+    # Tiempo total de `loops` ejecuciones, cada una sobre su propia copia
+    copies = [data.copy() for _ in range(loops)]
+    start_time = timeit.default_timer()
+    for copy in copies:
+        sort_function(copy)
+    return timeit.default_timer() - start_time
+
+
+def median_ci(samples, z=Z_95):
+    """
+    Mediana e intervalo de confianza por estadísticos de orden (sin suponer
+    normalidad): los rangos n/2 ± z·√n/2 de la muestra ordenada.
+
+    Returns:
+        tuple: (mediana, extremo inferior, extremo superior)
+    """
+    ordered = sorted(samples)
+    n = len(ordered)
+    mid = n // 2
+    median = ordered[mid] if n % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+    half = z * math.sqrt(n) / 2
+    low = max(0, math.floor(n / 2 - half) - 1)
+    high = min(n - 1, math.ceil(n / 2 + half))
+    return median, ordered[low], ordered[high]
+
+
+def adaptive_sample(sort_function, data, rel_ci=0.02, budget=DEFAULT_BUDGET, min_samples=5,
+                    max_samples=200, min_sample_time=MIN_SAMPLE_TIME):
+    """
+    Repite la medición hasta que la mediana es lo bastante precisa.
+
+    Se detiene cuando la semiamplitud relativa del IC 95 % de la mediana baja
+    de rel_ci (con al menos min_samples muestras), cuando se agota el
+    presupuesto de tiempo de la celda o al llegar a max_samples. Una celda de
+    80 s con budget=10 se mide una sola vez; una de 20 µs agrupa cientos de
+    ejecuciones por muestra y toma tantas muestras como haga falta.
+
+    Args:
+        sort_function (function): Función de ordenamiento
+        data (list | numpy.ndarray): Datos de entrada (no se modifican)
+        rel_ci (float): Semiamplitud relativa objetivo del intervalo
+        budget (float): Segundos máximos dedicados a la celda
+        min_samples (int): Muestras mínimas antes de evaluar el intervalo
+        max_samples (int): Muestras máximas
+        min_sample_time (float): Duración mínima de cada muestra (ver autorange)
+
+    Returns:
+        dict: {'times', 'loops', 'samples', 'median', 'ci_low', 'ci_high',
+               'ci_rel', 'stop'}
+    """
+    start = timeit.default_timer()
+    loops, first = autorange(sort_function, data, min_sample_time)
+    times = [first]
+    stop = "max_samples"
+    while len(times) < max_samples:
+        if timeit.default_timer() - start >= budget:
+            stop = "budget"
+            break
+        if len(times) >= min_samples:
+            median, low, high = median_ci(times)
+            if median > 0 and (high - low) / 2 / median <= rel_ci:
+                stop = "ci"
+                break
+        times.append(time_batch(sort_function, data, loops) / loops)
+
+    median, low, high = median_ci(times)
+    return {
+        'times': times,
+        'loops': loops,
+        'samples': len(times),
+        'median': median,
+        'ci_low': low,
+        'ci_high': high,
+        'ci_rel': (high - low) / 2 / median if median > 0 else 0.0,
+        'stop': stop,
+    }
+
+
+# Ejemplo de uso: los rangos de median_ci frente a los exactos de la
+# binomial(n, 1/2) para muestras pequeñas
+if __name__ == "__main__":
+    def coverage(n, low, high):
+        # P(ordered[low] <= mediana real <= ordered[high]) con rangos desde 0
+        return sum(math.comb(n, k) for k in range(low + 1, high + 1)) / 2 ** n
+
+    for n in range(6, 41):
+        _, low, high = median_ci(list(range(n)))
+        # Rangos exactos: el intervalo simétrico más estrecho con cobertura >= 95 %
+        j = max(j for j in range(1, n // 2 + 1) if coverage(n, j - 1, n - j) >= 0.95)
+        if coverage(n, low, high) < 0.95 or abs(low - (j - 1)) > 1 or abs(high - (n - j)) > 1:
+            raise AssertionError(f"n={n}: rangos ({low}, {high}), exactos ({j - 1}, {n - j})")
+        print(f"n={n:2}: rangos ({low:2}, {high:2}), exactos ({j - 1:2}, {n - j:2}), "
+              f"cobertura {coverage(n, low, high):.4f}")
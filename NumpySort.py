@@ -0,0 +1,372 @@
+import numpy as np
+
+from BubbleSort import bubble_sort
+from InsertionSort import insertion_sort
+from MergeSort import merge_sort
+from QuickSort import quick_sort
+from HeapSort import heap_sort
+from TimSort import tim_sort
+from RadixSort import radix_sort, radix_sort_np, counting_sort, counting_sort_np
+
+# Tipos de datos soportados por el backend de arreglos
+SUPPORTED_DTYPES = (np.int32, np.int64, np.float64)
+
+# Tamaño de bloque que se ordena con la red de transposición antes de fusionar
+BLOCK_SIZE = 32
+
+
+def to_array(data, dtype=np.int64):
+    """
+    Convierte una lista de Python en un numpy.ndarray contiguo del tipo indicado.
+
+    Args:
+        data (list): Lista de elementos a convertir
+        dtype: Uno de SUPPORTED_DTYPES (int32, int64 o float64)
+
+    Returns:
+        numpy.ndarray: Arreglo con los mismos elementos
+    """
+    if np.dtype(dtype) not in [np.dtype(t) for t in SUPPORTED_DTYPES]:
+        raise ValueError(f"Tipo no soportado: {dtype}")
+    return np.ascontiguousarray(data, dtype=dtype)
+
+
+def _sort_blocks(arr, block):
+    """Ordena cada bloque de tamaño `block` con una red de transposición par-impar.
+
+    Todos los bloques avanzan a la vez: cada pasada es un np.minimum/np.maximum
+    sobre una matriz (bloques x block), sin bucles por elemento.
+    """
+    n = len(arr)
+    full = n - n % block
+    for lo, hi, width in ((0, full, block), (full, n, n - full)):
+        if hi - lo < 2:
+            continue
+        m = arr[lo:hi].reshape(-1, width)
+        for p in range(width):
+            start = p % 2
+            left = m[:, start:width - 1:2]
+            right = m[:, start + 1:width:2]
+            low = np.minimum(left, right)
+            high = np.maximum(left, right)
+            m[:, start:width - 1:2] = low
+            m[:, start + 1:width:2] = high
+        arr[lo:hi] = m.ravel()
+
+
+def merge_into(left, right, out):
+    """Fusiona dos arreglos ordenados en out (len(out) == len(left) + len(right)).
+
+    La posición final de cada elemento es su índice dentro de su mitad más el
+    número de elementos de la otra mitad que deben ir antes (searchsorted).
+    'left' para la izquierda y 'right' para la derecha mantiene la estabilidad.
+    """
+    if not len(left) or not len(right) or left[-1] <= right[0]:
+        out[:len(left)] = left
+        out[len(left):] = right
+        return
+    pos_left = np.arange(len(left)) + np.searchsorted(right, left, side='left')
+    pos_right = np.arange(len(right)) + np.searchsorted(left, right, side='right')
+    out[pos_left] = left
+    out[pos_right] = right
+
+
+def _merge(src, dst, lo, mid, hi):
+    """Fusiona src[lo:mid] y src[mid:hi] en dst[lo:hi] de forma vectorizada."""
+    merge_into(src[lo:mid], src[mid:hi], dst[lo:hi])
+
+
+def _merge_runs(arr, runs):
+    """Fusiona por pares una lista de tramos ordenados (lo, hi) consecutivos."""
+    n = len(arr)
+    src = arr
+    dst = np.empty_like(arr)
+    while len(runs) > 1:
+        merged = []
+        for k in range(0, len(runs), 2):
+            if k + 1 < len(runs):
+                lo, mid = runs[k]
+                hi = runs[k + 1][1]
+                _merge(src, dst, lo, mid, hi)
+                merged.append((lo, hi))
+            else:
+                lo, hi = runs[k]
+                dst[lo:hi] = src[lo:hi]
+                merged.append((lo, hi))
+        runs = merged
+        src, dst = dst, src
+    if src is not arr:
+        arr[:n] = src
+    return arr
+
+
+def merge_sort_np(arr):
+    """
+    Merge Sort de abajo hacia arriba sobre un ndarray.
+
+    Ordena bloques de BLOCK_SIZE con una red vectorizada y luego fusiona
+    pares de tramos con _merge, alternando entre el arreglo y un único buffer.
+
+    Args:
+        arr (numpy.ndarray): Arreglo a ordenar (se modifica en el lugar)
+
+    Returns:
+        numpy.ndarray: El mismo arreglo ordenado
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+    _sort_blocks(arr, BLOCK_SIZE)
+    runs = [(lo, min(lo + BLOCK_SIZE, n)) for lo in range(0, n, BLOCK_SIZE)]
+    return _merge_runs(arr, runs)
+
+
+def tim_sort_np(arr, min_run=BLOCK_SIZE):
+    """
+    Tim Sort sobre un ndarray: detecta tramos naturales de forma vectorizada.
+
+    Los tramos estrictamente descendentes de al menos min_run elementos se
+    invierten; si los tramos ascendentes resultantes son en promedio más
+    cortos que min_run se usan bloques fijos como en merge_sort_np.
+
+    Args:
+        arr (numpy.ndarray): Arreglo a ordenar (se modifica en el lugar)
+        min_run (int): Longitud mínima de un tramo
+
+    Returns:
+        numpy.ndarray: El mismo arreglo ordenado
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+
+    # Invertir tramos estrictamente descendentes largos
+    desc = np.flatnonzero(arr[1:] < arr[:-1])
+    if desc.size:
+        breaks = np.flatnonzero(np.diff(desc) != 1)
+        starts = desc[np.r_[0, breaks + 1]]
+        ends = desc[np.r_[breaks, desc.size - 1]]
+        for s, e in zip(starts.tolist(), ends.tolist()):
+            if e - s + 2 >= min_run:
+                arr[s:e + 2] = arr[s:e + 2][::-1].copy()
+
+    # Límites de los tramos ascendentes
+    cuts = (np.flatnonzero(arr[1:] < arr[:-1]) + 1).tolist()
+    if len(cuts) + 1 > n // min_run:
+        _sort_blocks(arr, min_run)
+        runs = [(lo, min(lo + min_run, n)) for lo in range(0, n, min_run)]
+        return _merge_runs(arr, runs)
+
+    # Agrupar tramos cortos consecutivos y ordenarlos con la red
+    bounds = [0] + cuts + [n]
+    runs = []
+    lo = 0
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        if b - a >= min_run:
+            if a > lo:
+                _sort_blocks(arr[lo:a], a - lo)
+                runs.append((lo, a))
+            runs.append((a, b))
+            lo = b
+        elif b - lo >= min_run:
+            _sort_blocks(arr[lo:b], b - lo)
+            runs.append((lo, b))
+            lo = b
+    if lo < n:
+        _sort_blocks(arr[lo:n], n - lo)
+        runs.append((lo, n))
+    return _merge_runs(arr, runs)
+
+
+def quick_sort_np(arr, cutoff=BLOCK_SIZE):
+    """
+    Quick Sort iterativo sobre un ndarray con partición por máscaras booleanas.
+
+    Cada segmento se divide en (< pivote, == pivote, > pivote) con tres
+    máscaras y un único np.concatenate; los segmentos de tamaño <= cutoff
+    se terminan con la red de transposición. El pivote es la ninther de Tukey
+    (mediana de tres medianas de tres); como en IntroSort, los segmentos que
+    pasan de 2·log2(n) particiones se terminan con heap_sort_np, así que las
+    entradas adversas (organ pipe) siguen siendo O(n log n).
+
+    Args:
+        arr (numpy.ndarray): Arreglo a ordenar (se modifica en el lugar)
+        cutoff (int): Tamaño por debajo del cual no se sigue particionando
+
+    Returns:
+        numpy.ndarray: El mismo arreglo ordenado
+    """
+    stack = [(0, len(arr), 2 * (len(arr).bit_length() - 1))]
+    while stack:
+        lo, hi, depth = stack.pop()
+        if hi - lo <= cutoff:
+            if hi - lo > 1:
+                _sort_blocks(arr[lo:hi], hi - lo)
+            continue
+        seg = arr[lo:hi]
+        if depth == 0:
+            heap_sort_np(seg)
+            continue
+        # Pivote: ninther de nueve muestras repartidas por el segmento
+        samples = seg[np.linspace(0, hi - lo - 1, 9).astype(np.intp)].reshape(3, 3)
+        pivot = np.median(np.median(samples, axis=1))
+        less = seg < pivot
+        greater = seg > pivot
+        n_less = int(np.count_nonzero(less))
+        n_greater = int(np.count_nonzero(greater))
+        arr[lo:hi] = np.concatenate((seg[less], seg[~(less | greater)], seg[greater]))
+        stack.append((lo, lo + n_less, depth - 1))
+        stack.append((hi - n_greater, hi, depth - 1))
+    return arr
+
+
+def _heapify_levels(arr, n):
+    """Construye un max-heap procesando cada nivel del árbol de forma vectorizada.
+
+    Los subárboles de nodos de un mismo nivel son disjuntos, así que todos
+    pueden hundirse a la vez.
+    """
+    last_parent = n // 2 - 1
+    if last_parent < 0:
+        return
+    depth = (last_parent + 1).bit_length() - 1
+    for level in range(depth, -1, -1):
+        first = 2 ** level - 1
+        last = min(2 ** (level + 1) - 2, last_parent)
+        idx = np.arange(first, last + 1)
+        while idx.size:
+            left = 2 * idx + 1
+            keep = left < n
+            idx = idx[keep]
+            left = left[keep]
+            right = left + 1
+            child = left.copy()
+            has_right = right < n
+            better = np.zeros(idx.size, dtype=bool)
+            better[has_right] = arr[right[has_right]] > arr[left[has_right]]
+            child[better] = right[better]
+            swap = arr[child] > arr[idx]
+            idx = idx[swap]
+            child = child[swap]
+            tmp = arr[idx].copy()
+            arr[idx] = arr[child]
+            arr[child] = tmp
+            idx = child
+
+
+def heap_sort_np(arr):
+    """
+    Heap Sort sobre un ndarray.
+
+    La construcción del heap se hace por niveles de forma vectorizada; la
+    extracción es secuencial (cada hundimiento depende del anterior) y lee
+    escalares de NumPy uno a uno, así que en conjunto es más lenta que
+    heap_sort sobre una lista. Por eso está en SCALAR_NUMPY_ALGORITHMS y no se
+    compara con su versión de listas.
+
+    Args:
+        arr (numpy.ndarray): Arreglo a ordenar (se modifica en el lugar)
+
+    Returns:
+        numpy.ndarray: El mismo arreglo ordenado
+    """
+    n = len(arr)
+    _heapify_levels(arr, n)
+    for end in range(n - 1, 0, -1):
+        arr[0], arr[end] = arr[end], arr[0]
+        # Hundir la nueva raíz moviendo un hueco en lugar de intercambiar
+        item = arr[0]
+        i = 0
+        child = 1
+        while child < end:
+            if child + 1 < end and arr[child + 1] > arr[child]:
+                child += 1
+            if arr[child] <= item:
+                break
+            arr[i] = arr[child]
+            i = child
+            child = 2 * i + 1
+        arr[i] = item
+    return arr
+
+
+def insertion_sort_np(arr):
+    """
+    Insertion Sort binario sobre un ndarray.
+
+    La posición se busca con np.searchsorted y el desplazamiento es una sola
+    copia de slice en lugar de un bucle elemento a elemento.
+
+    Args:
+        arr (numpy.ndarray): Arreglo a ordenar (se modifica en el lugar)
+
+    Returns:
+        numpy.ndarray: El mismo arreglo ordenado
+    """
+    for i in range(1, len(arr)):
+        key = arr[i]
+        if arr[i - 1] <= key:
+            continue
+        pos = int(np.searchsorted(arr[:i], key, side='right'))
+        arr[pos + 1:i + 1] = arr[pos:i]
+        arr[pos] = key
+    return arr
+
+
+def bubble_sort_np(arr):
+    """
+    Bubble Sort en su forma de transposición par-impar sobre un ndarray.
+
+    Cada pasada compara e intercambia todos los pares (par, impar) o
+    (impar, par) a la vez; termina cuando dos pasadas seguidas no intercambian.
+
+    Args:
+        arr (numpy.ndarray): Arreglo a ordenar (se modifica en el lugar)
+
+    Returns:
+        numpy.ndarray: El mismo arreglo ordenado
+    """
+    n = len(arr)
+    quiet = 0
+    for p in range(n):
+        start = p % 2
+        left = arr[start:n - 1:2]
+        right = arr[start + 1:n:2]
+        mask = left > right
+        if mask.any():
+            tmp = left[mask]
+            left[mask] = right[mask]
+            right[mask] = tmp
+            quiet = 0
+        else:
+            quiet += 1
+            if quiet == 2:
+                break
+    return arr
+
+
+# Equivalente de cada algoritmo de listas en el backend de ndarray
+NUMPY_ALGORITHMS = {
+    bubble_sort: bubble_sort_np,
+    insertion_sort: insertion_sort_np,
+    merge_sort: merge_sort_np,
+    quick_sort: quick_sort_np,
+    heap_sort: heap_sort_np,
+    tim_sort: tim_sort_np,
+    radix_sort: radix_sort_np,
+    counting_sort: counting_sort_np,
+}
+
+# Versiones de NUMPY_ALGORITHMS con un bucle escalar por elemento: funcionan
+# sobre ndarray pero no son una versión vectorizada, y run_benchmark no las
+# incluye en el backend "ndarray"
+SCALAR_NUMPY_ALGORITHMS = {heap_sort_np}
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    datos = to_array([38, 27, 43, 3, 9, 82, 10, 3, 27], dtype=np.int32)
+    print("Arreglo original:", datos)
+
+    merge_sort_np(datos)
+    print("Arreglo ordenado:", datos)
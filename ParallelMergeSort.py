@@ -0,0 +1,247 @@
+import os
+import timeit
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_EXCEPTION
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from NumpySort import NUMPY_ALGORITHMS, merge_into
+
+
+def _attach(name, dtype, n):
+    """Abre un bloque de memoria compartida y devuelve (shm, vista ndarray)."""
+    shm = SharedMemory(name=name)
+    return shm, np.ndarray((n,), dtype=dtype, buffer=shm.buf)
+
+
+def _sort_chunk(name, dtype, n, lo, hi, algo):
+    # Tarea de un proceso: ordena view[lo:hi] directamente en la memoria compartida
+    shm, view = _attach(name, dtype, n)
+    try:
+        chunk = view[lo:hi]
+        if algo is None:
+            chunk.sort(kind="stable")  # Respaldo nativo de NumPy
+        elif algo in NUMPY_ALGORITHMS.values():
+            algo(chunk)
+        else:
+            # Algoritmos de listas: la copia es local al proceso, no viaja por pickle
+            data = chunk.tolist()
+            algo(data)
+            chunk[:] = data
+        del chunk
+    finally:
+        del view
+        shm.close()
+
+
+def _merge_part(src_name, dst_name, dtype, n, a_lo, a_hi, b_lo, b_hi, out_lo):
+    # Tarea de un proceso: fusiona src[a_lo:a_hi] y src[b_lo:b_hi] en dst[out_lo:...]
+    src_shm, src = _attach(src_name, dtype, n)
+    dst_shm, dst = _attach(dst_name, dtype, n)
+    try:
+        out_hi = out_lo + (a_hi - a_lo) + (b_hi - b_lo)
+        merge_into(src[a_lo:a_hi], src[b_lo:b_hi], dst[out_lo:out_hi])
+    finally:
+        del src, dst
+        src_shm.close()
+        dst_shm.close()
+
+
+def co_rank(k, left, right):
+    """
+    Cuántos elementos de `left` hay entre los k primeros de la fusión estable.
+
+    Permite partir una sola fusión grande en trozos independientes (merge path):
+    el trozo [k0, k1) de la salida sale de left[i0:i1] y right[k0-i0:k1-i1].
+
+    Args:
+        k (int): Posición en la salida
+        left (numpy.ndarray): Tramo ordenado izquierdo
+        right (numpy.ndarray): Tramo ordenado derecho
+
+    Returns:
+        int: i tal que los k primeros son left[:i] y right[:k - i]
+    """
+    lo = max(0, k - len(right))
+    hi = min(k, len(left))
+    while lo < hi:
+        i = (lo + hi) // 2
+        j = k - i
+        # i es demasiado pequeño si left[i] debe ir antes que right[j - 1]
+        if j > 0 and left[i] <= right[j - 1]:
+            lo = i + 1
+        else:
+            hi = i
+    return lo
+
+
+def _run_all(pool, tasks):
+    # Lanza las tareas y espera a todas; re-lanza el primer error
+    futures = [pool.submit(*task) for task in tasks]
+    done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+    for future in done:
+        future.result()
+    wait(futures)
+
+
+def parallel_merge_sort(arr, workers=None, chunk_algorithm=None, pool=None):
+    """
+    Merge Sort paralelo sobre memoria compartida.
+
+    Los datos se copian una sola vez a un bloque de multiprocessing.shared_memory.
+    Cada proceso ordena su trozo en el lugar y después se fusiona por rondas
+    entre ese bloque y un segundo bloque del mismo tamaño; cada fusión se parte
+    en trozos con co_rank para que todos los procesos trabajen también en las
+    últimas rondas. Solo viajan por pickle nombres de bloques e índices.
+
+    Tiene la misma firma básica que el resto de algoritmos, así que puede
+    registrarse en el diccionario `algorithms` de Probar.py/Probar2.py.
+
+    Args:
+        arr (list | numpy.ndarray): Datos a ordenar (se modifican en el lugar)
+        workers (int): Número de procesos (por defecto os.cpu_count())
+        chunk_algorithm (function): Algoritmo del repo para cada trozo
+            (p. ej. tim_sort o merge_sort_np); None usa el sort nativo de NumPy
+        pool (ProcessPoolExecutor): Pool a reutilizar; si es None se crea uno
+
+    Returns:
+        list | numpy.ndarray: El mismo objeto arr, ordenado
+    """
+    workers = workers or os.cpu_count()
+    data = np.asarray(arr)
+    n = len(data)
+    if n < 2:
+        return arr
+
+    dtype = data.dtype
+    shm_a = SharedMemory(create=True, size=data.nbytes)
+    shm_b = SharedMemory(create=True, size=data.nbytes)
+    own_pool = pool is None
+    if own_pool:
+        pool = ProcessPoolExecutor(max_workers=workers)
+    views = left = right = result = None
+    try:
+        views = {
+            shm_a.name: np.ndarray((n,), dtype=dtype, buffer=shm_a.buf),
+            shm_b.name: np.ndarray((n,), dtype=dtype, buffer=shm_b.buf),
+        }
+        views[shm_a.name][:] = data
+
+        # Fase 1: cada proceso ordena un trozo contiguo
+        bounds = np.linspace(0, n, workers + 1).astype(int).tolist()
+        runs = [(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:]) if lo < hi]
+        _run_all(pool, [(_sort_chunk, shm_a.name, dtype, n, lo, hi, chunk_algorithm)
+                        for lo, hi in runs])
+
+        # Fase 2: rondas de fusión por pares, alternando entre los dos bloques
+        src, dst = shm_a.name, shm_b.name
+        while len(runs) > 1:
+            tasks = []
+            merged = []
+            pairs = len(runs) // 2
+            parts = max(1, workers // pairs)
+            for k in range(0, len(runs) - 1, 2):
+                lo, mid = runs[k]
+                hi = runs[k + 1][1]
+                left = views[src][lo:mid]
+                right = views[src][mid:hi]
+                cuts = [(hi - lo) * p // parts for p in range(parts + 1)]
+                ranks = [co_rank(c, left, right) for c in cuts]
+                for p in range(parts):
+                    k0, k1 = cuts[p], cuts[p + 1]
+                    i0, i1 = ranks[p], ranks[p + 1]
+                    tasks.append((_merge_part, src, dst, dtype, n,
+                                  lo + i0, lo + i1, mid + k0 - i0, mid + k1 - i1, lo + k0))
+                merged.append((lo, hi))
+            if len(runs) % 2:
+                lo, hi = runs[-1]
+                views[dst][lo:hi] = views[src][lo:hi]
+                merged.append((lo, hi))
+            _run_all(pool, tasks)
+            runs = merged
+            src, dst = dst, src
+
+        result = views[src]
+        if isinstance(arr, np.ndarray):
+            arr[:] = result
+        else:
+            arr[:] = result.tolist()
+    finally:
+        # Las vistas deben soltarse antes de cerrar los bloques
+        views = left = right = result = None
+        if own_pool:
+            pool.shutdown()
+        for shm in (shm_a, shm_b):
+            shm.close()
+            shm.unlink()
+    return arr
+
+
+def scaling_report(data, worker_counts=(1, 2, 4, 8), chunk_algorithm=None, repetitions=3):
+    """
+    Mide parallel_merge_sort con distintos números de procesos.
+
+    La aceleración es relativa a la primera entrada de worker_counts
+    (normalmente 1 proceso) del mismo algoritmo, incluido el costo de copiar a
+    memoria compartida; la eficiencia es aceleración / (procesos / base).
+
+    Args:
+        data (list | numpy.ndarray): Datos de entrada (no se modifican)
+        worker_counts (tuple): Números de procesos a probar; el primero es la base
+        chunk_algorithm (function): Ver parallel_merge_sort
+        repetitions (int): Se toma el mejor tiempo de estas repeticiones
+
+    Returns:
+        dict: {procesos: {'avg_time', 'speedup', 'efficiency'}}
+    """
+    report = {}
+    base = None
+    for workers in worker_counts:
+        times = []
+        # Un pool por número de procesos, creado fuera de la medición
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for _ in range(repetitions):
+                copy = np.array(data)
+                start_time = timeit.default_timer()
+                parallel_merge_sort(copy, workers, chunk_algorithm, pool)
+                times.append(timeit.default_timer() - start_time)
+        best = min(times)
+        if base is None:
+            base = best
+        speedup = base / best
+        report[workers] = {
+            'avg_time': best,
+            'speedup': speedup,
+            'efficiency': speedup * worker_counts[0] / workers,
+        }
+    return report
+
+
+def run_scaling_benchmark(list_types, sizes, worker_counts=(1, 2, 4, 8), chunk_algorithm=None):
+    """
+    Ejecuta scaling_report sobre la matriz de tipos de lista y tamaños.
+
+    Returns:
+        dict: results[algo][list_type][size] como el de run_benchmark, con un
+              "algoritmo" por número de procesos y las claves extra
+              'speedup' y 'efficiency'
+    """
+    results = {}
+    for list_type, generator in list_types.items():
+        for size in sizes:
+            print(f"Ejecutando Parallel Merge Sort con lista {list_type} de tamaño {size}...")
+            report = scaling_report(generator(size), worker_counts, chunk_algorithm)
+            for workers, metrics in report.items():
+                algo_name = f"Parallel Merge Sort ({workers} procesos)"
+                results.setdefault(algo_name, {}).setdefault(list_type, {})[size] = metrics
+    return results
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    from Probar2 import generate_random_list
+
+    datos = generate_random_list(10**6)
+    for workers, metrics in scaling_report(datos).items():
+        print(f"{workers} procesos: {metrics['avg_time']:.4f} s, "
+              f"aceleración {metrics['speedup']:.2f}, eficiencia {metrics['efficiency']:.2f}")
@@ -0,0 +1,336 @@
+import inspect
+import math
+import multiprocessing
+import os
+import random
+import timeit
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+
+from Autoajuste import profile_hash, tuned
+from Contadores import count_operations
+from Generadores import InputGenerator
+from Memoria import MEMORY_ONLY
+from Muestreo import DEFAULT_BUDGET, adaptive_sample
+from NumpySort import to_array
+from Presupuesto import ChildCrash, predict_runtime, run_with_watchdog
+from Resultados import algorithm_hash
+from TimSort import CUTOFF
+
+# Algoritmos O(n²): sus celdas son las más largas y se lanzan primero
+QUADRATIC = {
+    "bubble_sort", "optimized_bubble_sort", "insertion_sort",
+    "bubble_sort_np", "insertion_sort_np",
+}
+
+
+def estimate_cost(algo_func, size):
+    """
+    Estimación relativa del costo de una celda, solo para ordenar la cola.
+
+    Args:
+        algo_func (function): Función de ordenamiento
+        size (int): Tamaño de la lista
+
+    Returns:
+        float: n² para los algoritmos cuadráticos, n·log2(n) para el resto
+    """
+    if algo_func.__name__ in QUADRATIC:
+        return float(size) ** 2
+    return size * math.log2(max(size, 2))
+
+
+def _pin_worker(counter):
+    """Inicializador del pool: fija cada proceso a un núcleo distinto."""
+    if not hasattr(os, "sched_setaffinity"):
+        return  # No disponible en macOS ni Windows
+    cpus = sorted(os.sched_getaffinity(0))
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+
+
+def cell_algorithm(cell, data=None):
+    """
+    Función que ejecuta una celda: algo_func con los parámetros del perfil de
+    Autoajuste.py para data y el cutoff de la celda, si lo tiene, pasados
+    explícitamente (los que el algoritmo acepta).
+
+    Así los parámetros se resuelven una sola vez con los datos sin envolver y
+    la ejecución instrumentada de Contadores usa los mismos que las medidas.
+
+    Returns:
+        function: algo_func o un functools.partial serializable
+    """
+    func = cell["algo_func"]
+    accepted = inspect.signature(func).parameters
+    params = {}
+    if data is not None and len(data):
+        params = {name: value for name, value in tuned(func.__name__, data).items() if name in accepted}
+    if cell.get("cutoff") is not None and "cutoff" in accepted:
+        params["cutoff"] = cell["cutoff"]
+    return partial(func, **params) if params else func
+
+
+def cell_cutoff(cell, algo_func):
+    """
+    Cutoff con el que se ejecuta una celda: el que cell_algorithm pasa
+    explícitamente o, si no pasa ninguno, el valor por defecto del parámetro
+    (TimSort.CUTOFF si es None).
+
+    Returns:
+        int: Cutoff efectivo, o None si el algoritmo no acepta cutoff
+    """
+    parameter = inspect.signature(cell["algo_func"]).parameters.get("cutoff")
+    if parameter is None:
+        return None
+    keywords = getattr(algo_func, "keywords", {})
+    if "cutoff" in keywords:
+        return keywords["cutoff"]
+    return CUTOFF if parameter.default is None else parameter.default
+
+
+def run_cell(cell, measure, repetitions, adaptive=None, count_ops=False):
+    """
+    Ejecuta todas las repeticiones de una celda (algoritmo, tipo, tamaño).
+
+    Args:
+        cell (dict): algo_name, algo_func, list_type, generator, size, backend,
+                     dtype y seed (la misma semilla da los mismos datos a todos
+                     los algoritmos); generator puede ser una función
+                     generator(size) o un Generadores.InputGenerator. Con
+                     "cutoff" opcional, el tamaño de tramo a partir del cual
+                     el algoritmo pasa a insertion sort. El cutoff efectivo
+                     (ver cell_cutoff) se añade siempre a las métricas
+        measure (function): Función que devuelve (tiempo, memoria, resultado)
+        repetitions (int): Número de repeticiones (sin muestreo adaptativo)
+        adaptive (dict): Si se indica, los tiempos salen de
+                         Muestreo.adaptive_sample(**adaptive) y la memoria de
+                         una sola pasada de memoria (Memoria.MEMORY_ONLY, o
+                         `measure` si no está ahí), cuyo tiempo se descuenta
+                         del presupuesto de la celda
+        count_ops (bool): Añadir los recuentos de Contadores.count_operations
+                          (una ejecución instrumentada aparte, solo backend "list")
+
+    Returns:
+        tuple: (cell, tiempos, memorias, métricas extra)
+    """
+    algo_name, list_type, size = cell["algo_name"], cell["list_type"], cell["size"]
+    random.seed(cell["seed"])
+    generator = cell["generator"]
+    if isinstance(generator, InputGenerator):
+        data = generator(size, cell["seed"], cell["dtype"], as_array=cell["backend"] == "ndarray")
+    else:
+        data = generator(size)
+    if cell["backend"] == "ndarray":
+        data = to_array(data, cell["dtype"])
+
+    algo_func = cell_algorithm(cell, data)
+    times = []
+    memories = []
+    extra = {}
+    if adaptive is None:
+        for _ in range(repetitions):
+            print(f"Ejecutando {algo_name} con lista {list_type} de tamaño {size}...")
+            time, memory, _ = measure(algo_func, data)
+            times.append(time)
+            memories.append(memory)
+    else:
+        print(f"Ejecutando {algo_name} con lista {list_type} de tamaño {size} (adaptativo)...")
+        start = timeit.default_timer()
+        if measure in MEMORY_ONLY:
+            memories.append(MEMORY_ONLY[measure](algo_func, data))
+        else:
+            memories.append(measure(algo_func, data)[1])
+        # La pasada de memoria también cuenta para el presupuesto de la celda
+        options = dict(adaptive)
+        options["budget"] = max(0.0, options.get("budget", DEFAULT_BUDGET) - (timeit.default_timer() - start))
+        sample = adaptive_sample(algo_func, data, **options)
+        times = sample["times"]
+        extra = {
+            'samples': sample['samples'],
+            'loops': sample['loops'],
+            'median_time': sample['median'],
+            'ci_rel': sample['ci_rel'],
+            'stop': sample['stop'],
+        }
+    if count_ops and cell["backend"] == "list":
+        extra.update(count_operations(algo_func, data))
+    cutoff = cell_cutoff(cell, algo_func)
+    if cutoff is not None:
+        extra['cutoff'] = cutoff
+    return cell, times, memories, extra
+
+
+def _measured_series(results, algo_name, list_type, size):
+    # Tamaños menores ya medidos (no extrapolados) de una serie y su tiempo medio
+    sizes, times = [], []
+    for n, metrics in results[algo_name][list_type].items():
+        if (n < size and metrics is not None and not metrics.get('extrapolated')
+                and not metrics.get('timed_out') and not metrics.get('failed')):
+            sizes.append(n)
+            times.append(metrics['avg_time'])
+    return sizes, times
+
+
+def _placeholder(results, algo_name, **values):
+    # Métricas de una celda no medida: mismas claves que las medidas, con NaN
+    template = {}
+    for type_data in results[algo_name].values():
+        for metrics in type_data.values():
+            if (metrics is not None and not metrics.get('extrapolated') and not metrics.get('timed_out')
+                    and not metrics.get('failed')):
+                template = metrics
+    metrics = {key: float("nan") for key, value in template.items() if isinstance(value, float)}
+    metrics.update(values)
+    return metrics
+
+
+def _run_budgeted(pending, results, collect, measure, repetitions, adaptive, count_ops, workers,
+                  cell_budget, sweep_budget):
+    """
+    Ejecuta las celdas por tamaños crecientes con presupuesto de tiempo.
+
+    Antes de cada celda se predice su duración con los tamaños menores ya
+    medidos de la misma serie (Presupuesto.predict_runtime). Si no cabe en el
+    presupuesto de la celda o en lo que queda del barrido (descontando lo
+    previsto para las celdas anteriores de la misma ola), se marca como
+    "extrapolated" con la predicción y su barra de error. Las que se lanzan
+    corren vigiladas y se terminan si pasan del límite de la celda o del final
+    del barrido; las que ya no llegan a lanzarse quedan como "timed_out". Si
+    el proceso de una celda muere sin responder (segfault, OOM kill) la celda
+    queda como "failed" con su código de salida.
+    """
+    start = timeit.default_timer()
+    deadline = start + sweep_budget if sweep_budget is not None else None
+    # Con muestreo adaptativo: una pasada de memoria y al menos min_samples muestras
+    runs_per_cell = repetitions if adaptive is None else 1 + adaptive.get("min_samples", 5)
+    for size in sorted({cell["size"] for cell in pending}):
+        wave = [cell for cell in pending if cell["size"] == size]
+        wave.sort(key=lambda c: estimate_cost(c["algo_func"], c["size"]), reverse=True)
+        remaining = math.inf
+        if deadline is not None:
+            remaining = deadline - timeit.default_timer()
+        planned = 0.0  # Segundos previstos para las celdas ya aceptadas de la ola
+
+        to_run = []
+        for cell in wave:
+            name, list_type = cell["algo_name"], cell["list_type"]
+            limit = min(cell_budget if cell_budget is not None else math.inf,
+                        remaining - planned / workers)
+            sizes, times = _measured_series(results, name, list_type, size)
+            if sizes:
+                quadratic = cell["algo_func"].__name__ in QUADRATIC
+                predicted, error = predict_runtime(sizes, times, size, quadratic)
+                if predicted * runs_per_cell > limit:
+                    print(f"Extrapolando {name} con lista {list_type} de tamaño {size}: "
+                          f"{predicted:.3f} ± {error:.3f} s por ejecución")
+                    results[name][list_type][size] = _placeholder(
+                        results, name, avg_time=predicted, std_time=error,
+                        predicted_time=predicted, prediction_error=error, extrapolated=True)
+                    continue
+                planned += predicted * runs_per_cell
+            if limit <= 0:
+                results[name][list_type][size] = _placeholder(results, name, timed_out=True)
+                continue
+            to_run.append(cell)
+
+        jobs = [(cell, measure, repetitions, adaptive, count_ops) for cell in to_run]
+        for cell, output in zip(to_run, run_with_watchdog(jobs, run_cell, workers, cell_budget, deadline)):
+            if isinstance(output, ChildCrash):
+                print(f"Error en {cell['algo_name']} con lista {cell['list_type']} "
+                      f"de tamaño {size}: el proceso terminó con código {output.exitcode}")
+                results[cell["algo_name"]][cell["list_type"]][size] = _placeholder(
+                    results, cell["algo_name"], failed=True, exitcode=output.exitcode)
+            elif output is None:
+                print(f"Cancelado {cell['algo_name']} con lista {cell['list_type']} "
+                      f"de tamaño {size}: no cupo en el presupuesto de tiempo")
+                results[cell["algo_name"]][cell["list_type"]][size] = _placeholder(
+                    results, cell["algo_name"], timed_out=True)
+            else:
+                _, times, memories, extra = output
+                collect(cell, times, memories, extra)
+
+
+def run_cells(cells, measure, summarize, repetitions=10, workers=1, store=None, adaptive=None,
+              cell_budget=None, sweep_budget=None, count_ops=False):
+    """
+    Ejecuta la matriz de celdas del benchmark, en serie o en un pool de procesos.
+
+    Las celdas se lanzan de la más costosa a la más barata (estimate_cost) para
+    que las largas no queden al final con el resto de núcleos ociosos.
+
+    Args:
+        cells (list): Celdas en el formato de run_cell
+        measure (function): Función de medición (debe poder serializarse con pickle)
+        summarize (function): Convierte (tiempos, memorias) en el dict de métricas
+        repetitions (int): Repeticiones por celda
+        workers (int): Procesos a usar; 1 ejecuta todo en el proceso actual
+        store (Resultados.ResultStore): Si se indica, las celdas ya guardadas no
+                                        se vuelven a medir y las nuevas se guardan
+        adaptive (dict): Opciones de Muestreo.adaptive_sample; None = siempre
+                         `repetitions` repeticiones
+        cell_budget (float): Segundos máximos por celda (ver _run_budgeted)
+        sweep_budget (float): Segundos máximos para todo el barrido
+        count_ops (bool): Añadir comparaciones, lecturas, escrituras,
+                          intercambios y profundidad a las métricas
+
+    Returns:
+        dict: results[algo][list_type][size] en el mismo orden que `cells`
+    """
+    results = {}
+    for cell in cells:
+        results.setdefault(cell["algo_name"], {}).setdefault(cell["list_type"], {})[cell["size"]] = None
+
+    keys = {}
+    pending = []
+    if store is not None:
+        # El código de medición y de resumen también forma parte de la clave
+        harness = (f"measure={algorithm_hash(measure)}|summarize={algorithm_hash(summarize)}"
+                   f"|rep={repetitions}|adaptive={sorted((adaptive or {}).items())}|ops={count_ops}")
+        # Con un perfil de Autoajuste.py los parámetros por defecto cambian
+        if profile_hash():
+            harness += f"|profile={profile_hash()}"
+    for cell in cells:
+        if store is not None:
+            generator = getattr(cell["generator"], "__name__", repr(cell["generator"]))
+            config = f"{harness}|{cell['backend']}|{cell['dtype']}|{generator}"
+            if cell.get("cutoff") is not None:
+                config += f"|cutoff={cell['cutoff']}"
+            keys[id(cell)] = store.cell_key(cell, config)
+            cached = store.get(keys[id(cell)][0])
+            if cached is not None:
+                results[cell["algo_name"]][cell["list_type"]][cell["size"]] = cached
+                continue
+        pending.append(cell)
+
+    def collect(cell, times, memories, extra):
+        metrics = summarize(times, memories)
+        metrics.update(extra)
+        results[cell["algo_name"]][cell["list_type"]][cell["size"]] = metrics
+        if store is not None:
+            store.put(*keys[id(cell)], metrics)
+
+    if cell_budget is not None or sweep_budget is not None:
+        _run_budgeted(pending, results, collect, measure, repetitions, adaptive, count_ops,
+                      workers, cell_budget, sweep_budget)
+        return results
+
+    queue = sorted(pending, key=lambda c: estimate_cost(c["algo_func"], c["size"]), reverse=True)
+
+    if workers == 1:
+        for cell in queue:
+            collect(*run_cell(cell, measure, repetitions, adaptive, count_ops))
+        return results
+
+    counter = multiprocessing.Value("i", 0)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_pin_worker,
+                             initargs=(counter,)) as pool:
+        futures = {pool.submit(run_cell, cell, measure, repetitions, adaptive, count_ops): cell
+                   for cell in queue}
+        for future in as_completed(futures):
+            # La celda devuelta es una copia; se usa la original para la clave
+            _, times, memories, extra = future.result()
+            collect(futures[future], times, memories, extra)
+    return results
@@ -0,0 +1,159 @@
+import math
+import multiprocessing
+import timeit
+from multiprocessing.connection import wait
+
+# Error relativo que se asume cuando hay muy pocos puntos para estimarlo
+DEFAULT_REL_ERROR = 0.5
+
+
+def predict_runtime(sizes, times, target_size, quadratic=False):
+    """
+    Predice el tiempo de una ejecución a partir de los tamaños ya medidos.
+
+    Con dos o más puntos ajusta una ley de potencias t = c·n^b por mínimos
+    cuadrados en escala log-log; la barra de error es el intervalo de
+    predicción (1 σ) de esa recta en el punto extrapolado. Con un solo punto
+    escala según la complejidad esperada (n² o n·log n).
+
+    Args:
+        sizes (list): Tamaños medidos (menores que target_size)
+        times (list): Tiempo medio por ejecución para cada tamaño
+        target_size (int): Tamaño a predecir
+        quadratic (bool): Complejidad esperada si solo hay un punto
+
+    Returns:
+        tuple: (tiempo predicho, error absoluto)
+    """
+    points = [(n, t) for n, t in zip(sizes, times) if n > 0 and t > 0]
+    if not points:
+        raise ValueError("Se necesita al menos un tamaño medido")
+
+    if len(points) == 1:
+        n, t = points[0]
+        if quadratic:
+            predicted = t * (target_size / n) ** 2
+        else:
+            predicted = t * (target_size * math.log2(max(target_size, 2))) / (n * math.log2(max(n, 2)))
+        return predicted, predicted * DEFAULT_REL_ERROR
+
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(t) for _, t in points]
+    k = len(points)
+    mean_x = sum(xs) / k
+    mean_y = sum(ys) / k
+    sxx = sum((x - mean_x) ** 2 for x in xs)
+    if sxx == 0:
+        predicted = math.exp(mean_y)
+        return predicted, predicted * DEFAULT_REL_ERROR
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sxx
+    intercept = mean_y - slope * mean_x
+    x0 = math.log(target_size)
+    predicted = math.exp(intercept + slope * x0)
+
+    if k == 2:
+        return predicted, predicted * DEFAULT_REL_ERROR
+    residual = sum((y - (intercept + slope * x)) ** 2 for x, y in zip(xs, ys)) / (k - 2)
+    spread = math.sqrt(residual * (1 + 1 / k + (x0 - mean_x) ** 2 / sxx))
+    return predicted, predicted * (math.exp(spread) - 1)
+
+
+class ChildCrash:
+    """Resultado de un job cuyo hijo murió sin responder (segfault, OOM kill...)."""
+
+    __slots__ = ("exitcode",)
+
+    def __init__(self, exitcode):
+        self.exitcode = exitcode
+
+    def __repr__(self):
+        return f"ChildCrash(exitcode={self.exitcode})"
+
+
+def _child(conn, target, args):
+    # Proceso vigilado: envía (True, resultado) o (False, excepción)
+    try:
+        conn.send((True, target(*args)))
+    except BaseException as error:
+        conn.send((False, error))
+    finally:
+        conn.close()
+
+
+def run_with_watchdog(jobs, target, workers=1, timeout=None, deadline=None):
+    """
+    Ejecuta target(*job) para cada job en procesos hijos vigilados.
+
+    El proceso actual hace de vigilante: como mucho `workers` hijos a la vez y,
+    si uno pasa de `timeout` segundos, se termina (terminate + join) sin
+    afectar al resto. Con `deadline` ningún hijo pasa de ese instante y los
+    jobs que no llegaron a lanzarse antes no se lanzan. Los errores de un hijo
+    se vuelven a lanzar aquí.
+
+    Args:
+        jobs (list): Tuplas de argumentos para target
+        target (function): Función a ejecutar (debe poder serializarse)
+        workers (int): Hijos simultáneos
+        timeout (float): Segundos máximos por job; None = sin límite
+        deadline (float): Instante (timeit.default_timer) límite para todos
+                          los jobs; None = sin límite
+
+    Returns:
+        list: Resultado de cada job, None si se canceló o no se lanzó por
+              tiempo, o un ChildCrash si el hijo murió sin responder
+    """
+    results = [None] * len(jobs)
+    queue = list(range(len(jobs)))
+    running = {}
+    try:
+        _watch(jobs, target, workers, timeout, deadline, results, queue, running)
+    finally:
+        # Ante un error, no dejar hijos huérfanos
+        for conn, (_, process, _) in running.items():
+            process.terminate()
+            process.join()
+            conn.close()
+    return results
+
+
+def _watch(jobs, target, workers, timeout, sweep_deadline, results, queue, running):
+    # Bucle del vigilante de run_with_watchdog
+    while queue or running:
+        if sweep_deadline is not None and timeit.default_timer() >= sweep_deadline:
+            queue.clear()  # Sin tiempo para lanzar más: se quedan en None
+        while queue and len(running) < workers:
+            index = queue.pop(0)
+            parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+            process = multiprocessing.Process(target=_child, args=(child_conn, target, jobs[index]))
+            process.start()
+            child_conn.close()
+            deadline = timeit.default_timer() + timeout if timeout is not None else None
+            if sweep_deadline is not None:
+                deadline = sweep_deadline if deadline is None else min(deadline, sweep_deadline)
+            running[parent_conn] = (index, process, deadline)
+        if not running:
+            break
+
+        deadlines = [d for _, _, d in running.values() if d is not None]
+        wait_time = max(0.0, min(deadlines) - timeit.default_timer()) if deadlines else None
+        for conn in wait(list(running), timeout=wait_time):
+            index, process, _ = running.pop(conn)
+            try:
+                ok, value = conn.recv()
+            except EOFError:
+                ok, value = None, None  # El hijo murió sin responder
+            conn.close()
+            process.join()
+            if ok is None:
+                value = ChildCrash(process.exitcode)
+            elif not ok:
+                raise value
+            results[index] = value
+
+        now = timeit.default_timer()
+        for conn, (index, process, deadline) in list(running.items()):
+            if deadline is not None and now >= deadline:
+                process.terminate()
+                process.join()
+                conn.close()
+                del running[conn]
@@ -4,11 +4,13 @@ from MergeSort import merge_sort
 from QuickSort import quick_sort
 from HeapSort import heap_sort
 from TimSort import tim_sort
+from NumpySort import NUMPY_ALGORITHMS, SCALAR_NUMPY_ALGORITHMS
+from Planificador import run_cells
+from Resultados import ResultStore, DEFAULT_STORE
+from Memoria import MEASURES
+from Generadores import InputGenerator
 
-import timeit
 import random
-import psutil
-import os
 
 def generate_random_list(size):
     return [random.randint(0, 10**5) for _ in range(size)]
@@ -19,132 +21,90 @@ def generate_sorted_list(size):
 def generate_reversed_list(size):
     return list(range(size, 0, -1))
 
-def measure_performanc(sort_function, data):
-    """
-    Mide el tiempo de ejecución y consumo de memoria de una función de ordenamiento
-    
-    Args:
-        sort_function (function): Función de ordenamiento a probar
-        data (list): Lista de datos a ordenar
-        
-    Returns:
-        tuple: (tiempo_ejecucion, memoria_usada, lista_ordenada)
-    """
-    process = psutil.Process(os.getpid())
-    
-    # Medición de memoria antes de ejecutar
-    mem_before = process.memory_info().rss / (1024)  # MB
-    
-    # Medición de tiempo
-    start_time = timeit.default_timer()
+# Medición por defecto: tiempo limpio y luego pico de RSS muestreado en otra
+# pasada (el equivalente a memory_profiler, ver Memoria.py)
+measure_performance = MEASURES["poller"]
+
+def summarize(times, memories):
+    """Descarta el mínimo y el máximo y promedia el resto"""
+    # Eliminar outliers (mínimo y máximo), solo si hay suficientes datos
+    times_sorted = sorted(times)
+    memories_sorted = sorted(memories)
+    if len(times_sorted) > 2:
+        times_sorted = times_sorted[1:-1]
+    if len(memories_sorted) > 2:
+        memories_sorted = memories_sorted[1:-1]
     
-    # Ejecutar el algoritmo
-    sorted_data = sort_function(data.copy())
-    
-    # Medición de tiempo
-    end_time = timeit.default_timer()
-    execution_time = end_time - start_time
-    
-    # Medición de memoria después de ejecutar
-    mem_after = process.memory_info().rss / (1024)  # MB
-    memory_used = mem_after - mem_before
-    
-    return execution_time, memory_used, sorted_data
-
-from memory_profiler import memory_usage
-# ...existing code...
-
-def measure_performan(sort_function, data):
-    """
-    Mide el tiempo de ejecución y consumo de memoria de una función de ordenamiento
-    """
-    # Medición de tiempo
-    start_time = timeit.default_timer()
-
-    # Medición de memoria: obtiene el pico de uso durante la función
-    mem_usage, sorted_data = memory_usage(
-        (sort_function, (data.copy(),)), retval=True, max_usage=True, interval=0.01
-    )
-
-    end_time = timeit.default_timer()
-    execution_time = end_time - start_time
-
-    # mem_usage ya está en MB
-    memory_used = mem_usage  # MB
+    # Calcular promedio
+    avg_time = sum(times_sorted) / len(times_sorted)
+    avg_memory = sum(memories_sorted) / len(memories_sorted)
+     
+    return {
+        'avg_time': avg_time,
+        'avg_memory': avg_memory
+    }
 
-    return execution_time, memory_used, sorted_data
-# ...existing code...
+def run_benchmark(backends=("list",), dtype="int64", workers=1, seed=0, store=None,
+                  adaptive=None, cell_budget=None, sweep_budget=None, count_ops=False,
+                  shapes=("random", "sorted", "reversed"), memory_backend="poller",
+                  cutoff=None):
+    """Ejecuta las pruebas de rendimiento para diferentes tamaños y tipos de listas
 
-def measure_performance(sort_function, data):
-    """
-    Mide el tiempo de ejecución y consumo de memoria de una función de ordenamiento
+    Args:
+        backends (tuple): "list" (listas de Python) y/o "ndarray" (NumpySort)
+        dtype (str): Tipo de los arreglos del backend "ndarray"
+        workers (int): Procesos en paralelo (ver Planificador.run_cells)
+        seed (int): Semilla de los generadores de listas
+        store (Resultados.ResultStore): Almacén para no repetir celdas ya medidas
+        adaptive (dict): Opciones de Muestreo.adaptive_sample (p. ej.
+                         {"rel_ci": 0.02, "budget": 10}); con muestreo
+                         adaptativo la memoria se mide una sola vez
+        cell_budget (float): Segundos máximos por celda; las que se prevé que
+                             no quepan se extrapolan en lugar de ejecutarse
+        sweep_budget (float): Segundos máximos para todo el barrido
+        count_ops (bool): Añadir los recuentos de operaciones (Contadores.py)
+        shapes (tuple): Formas de entrada de Generadores.GENERATORS
+        memory_backend (str): "tracemalloc", "rusage" o "poller" (ver Memoria.py)
+        cutoff (int): Tramo a partir del cual los algoritmos híbridos pasan a
+                      insertion sort; None = perfil de Autoajuste.py o TimSort.CUTOFF.
+                      El cutoff efectivo se guarda en cada celda
     """
-    def wrapper(data):
-        start_time = timeit.default_timer()
-        result = sort_function(data)
-        end_time = timeit.default_timer()
-        return end_time - start_time, result
-
-    # memory_usage ejecuta wrapper y devuelve el pico de memoria y el resultado
-    mem_usage, (execution_time, sorted_data) = memory_usage(
-        (wrapper, (data.copy(),)), retval=True, max_usage=True, interval=0.01
-    )
-
-    # mem_usage ya está en MB
-    memory_used = mem_usage  # MB
-
-    return execution_time, memory_used, sorted_data
-
-def run_benchmark():
-    """Ejecuta las pruebas de rendimiento para diferentes tamaños y tipos de listas"""
     sizes = [100, 1000, 10000, 100000]  
-    list_types = {
-        "random": generate_random_list,
-        "sorted": generate_sorted_list,
-        "reversed": generate_reversed_list
-    }
+    # Entradas vectorizadas, sembradas y cacheadas en disco (ver Generadores.py)
+    list_types = {shape: InputGenerator(shape) for shape in shapes}
     
     algorithms = {
         "Merge Sort": merge_sort,
     }
     
-    results = {}
+    # Cada backend aparece como un algoritmo más para compararlos lado a lado
+    entries = []
+    for backend in backends:
+        for algo_name, algo_func in algorithms.items():
+            if backend == "list":
+                entries.append((algo_name, algo_func, backend))
+            elif NUMPY_ALGORITHMS[algo_func] not in SCALAR_NUMPY_ALGORITHMS:
+                # Las versiones escalares no se comparan con las de listas
+                entries.append((f"{algo_name} ({backend})", NUMPY_ALGORITHMS[algo_func], backend))
     
-    for algo_name, algo_func in algorithms.items():
-        results[algo_name] = {}
-        for list_type, generator in list_types.items():
-            results[algo_name][list_type] = {}
-            for size in sizes:
-                # Generar datos
-                data = generator(size)
-                
-                times = []
-                memories = []
-                
-                # Ejecutar 10 veces para obtener un promedio
-                for _ in range(10):
-                    print(f"Ejecutando {algo_name} con lista {list_type} de tamaño {size}...")
-                    time, memory, _ = measure_performance(algo_func, data)
-                    times.append(time)
-                    memories.append(memory)
-                
-                # Eliminar outliers (mínimo y máximo)
-                times_sorted = sorted(times)
-                memories_sorted = sorted(memories)
-                
-                # Calcular promedio y desviación estándar
-                avg_time = sum(times_sorted[1:-1]) / (len(times_sorted)-2)
-                avg_memory = sum(memories_sorted[1:-1]) / (len(memories_sorted)-2)
-                 
-                results[algo_name][list_type][size] = {
-                    'avg_time': avg_time,
-                    'avg_memory': avg_memory
-                }
+    # Una celda por (algoritmo, tipo de lista, tamaño); cada una se ejecuta 10 veces
+    cells = [
+        {"algo_name": algo_name, "algo_func": algo_func, "list_type": list_type,
+         "generator": generator, "size": size, "backend": backend, "dtype": dtype,
+         "seed": seed, "cutoff": cutoff}
+        for algo_name, algo_func, backend in entries
+        for list_type, generator in list_types.items()
+        for size in sizes
+    ]
     
-    return results
+    return run_cells(cells, MEASURES[memory_backend], summarize, repetitions=10 if adaptive is None else 1,
+                     workers=workers, store=store, adaptive=adaptive,
+                     cell_budget=cell_budget, sweep_budget=sweep_budget,
+                     count_ops=count_ops)
 
 if __name__ == "__main__":
-    benchmark_results = run_benchmark()
+    # Las celdas ya medidas con el mismo código se leen del almacén
+    benchmark_results = run_benchmark(store=ResultStore(DEFAULT_STORE))
     
     for algo, algo_data in benchmark_results.items():
         print(f"\nResultados para {algo}:")
@@ -2,12 +2,19 @@ from BubbleSort import bubble_sort
 from InsertionSort import insertion_sort
 from MergeSort import merge_sort
 from QuickSort import quick_sort
+from QuickSortmedio import quick_sortmedio
+from QuickSortult import quick_sortult
+from QuickSortdual import quick_sortdual
 from HeapSort import heap_sort
 from TimSort import tim_sort
+from RadixSort import radix_sort, counting_sort
+from NumpySort import NUMPY_ALGORITHMS, SCALAR_NUMPY_ALGORITHMS
+from Planificador import run_cells
+from Resultados import ResultStore, DEFAULT_STORE
+from Memoria import MEASURES
+from Generadores import InputGenerator
 
-import timeit
 import random
-import tracemalloc  # Módulo más preciso para medir memoria en Python
 import numpy as np  # Para cálculos estadísticos
 
 def generate_random_list(size):
@@ -19,89 +26,106 @@ def generate_sorted_list(size):
 def generate_reversed_list(size):
     return list(range(size, 0, -1))
 
-def measure_performance(sort_function, data):
-    """
-    Versión mejorada para medir memoria usando tracemalloc
-    
-    Args:
-        sort_function (function): Función de ordenamiento a probar
-        data (list): Lista de datos a ordenar
-        
-    Returns:
-        tuple: (tiempo_ejecucion, memoria_usada_kb, lista_ordenada)
-    """
-    # Iniciar el trazado de memoria
-    tracemalloc.start()
-        
-    # Medir tiempo de ejecución
-    start_time = timeit.default_timer()
-    sorted_data = sort_function(data.copy())
-    end_time = timeit.default_timer()
-    
-    current, peak = tracemalloc.get_traced_memory()   
-    
-    # Detener el trazado
-    tracemalloc.stop()
-    memory_used_kb = peak / 1024
+# Medición por defecto: tiempo sin instrumentar y pico de tracemalloc en una
+# pasada aparte (ver Memoria.py), así tracemalloc no infla los tiempos
+measure_performance = MEASURES["tracemalloc"]
+
+# Algoritmos por defecto de run_benchmark
+ALGORITHMS = {
+    "Insertion Sort": insertion_sort,
+    "Radix Sort": radix_sort,
+    "Counting Sort": counting_sort,
+}
+
+# Variantes de quicksort, para comparar sus recuentos con count_ops=True
+QUICK_SORTS = {
+    "Quick Sort": quick_sort,
+    "Quick Sort (pivote medio)": quick_sortmedio,
+    "Quick Sort (pivote último)": quick_sortult,
+    "Quick Sort (doble pivote)": quick_sortdual,
+}
+
+def summarize(times, memories):
+    """Calcula media y desviación estándar descartando el mínimo y el máximo"""
+    # Eliminar outliers (mínimo y máximo)
+    if len(times) > 2:  # Solo si hay suficientes datos
+        times_sorted = sorted(times)
+        memories_sorted = sorted(memories)
+        times_filtered = times_sorted[1:-1]
+        memories_filtered = memories_sorted[1:-1]
+    else:
+        times_filtered = times
+        memories_filtered = memories
     
-    execution_time = end_time - start_time
+    # Calcular estadísticas
+    avg_time = np.mean(times_filtered)
+    std_time = np.std(times_filtered)
+    avg_memory = np.mean(memories_filtered)
+    std_memory = np.std(memories_filtered)
     
-    return execution_time, memory_used_kb, sorted_data
+    return {
+        'avg_time': avg_time,
+        'std_time': std_time,
+        'avg_memory_kb': avg_memory,
+        'std_memory_kb': std_memory
+    }
 
-def run_benchmark():
+def run_benchmark(backends=("list",), dtype="int64", workers=1, seed=0, store=None,
+                  adaptive=None, cell_budget=None, sweep_budget=None, count_ops=False,
+                  shapes=("random", "sorted", "reversed"), memory_backend="tracemalloc",
+                  cutoff=None, algorithms=None):
+    """
+    Args:
+        backends (tuple): "list" (listas de Python) y/o "ndarray" (NumpySort)
+        dtype (str): Tipo de los arreglos del backend "ndarray"
+        workers (int): Procesos en paralelo (ver Planificador.run_cells)
+        seed (int): Semilla de los generadores de listas
+        store (Resultados.ResultStore): Almacén para no repetir celdas ya medidas
+        adaptive (dict): Opciones de Muestreo.adaptive_sample (p. ej.
+                         {"rel_ci": 0.02, "budget": 10}); con muestreo
+                         adaptativo la memoria se mide una sola vez
+        cell_budget (float): Segundos máximos por celda; las que se prevé que
+                             no quepan se extrapolan en lugar de ejecutarse
+        sweep_budget (float): Segundos máximos para todo el barrido
+        count_ops (bool): Añadir los recuentos de operaciones (Contadores.py)
+        shapes (tuple): Formas de entrada de Generadores.GENERATORS
+        memory_backend (str): "tracemalloc", "rusage" o "poller" (ver Memoria.py)
+        cutoff (int): Tramo a partir del cual los algoritmos híbridos pasan a
+                      insertion sort; None = perfil de Autoajuste.py o TimSort.CUTOFF.
+                      El cutoff efectivo se guarda en cada celda
+        algorithms (dict): {nombre: función}; None = ALGORITHMS. Los que no
+                           tienen versión vectorizada en NumpySort (o la tienen
+                           en SCALAR_NUMPY_ALGORITHMS) solo usan el backend "list"
+    """
     sizes = [100, 1000, 10000] # Tamaños a probar
-    list_types = {
-        'random': generate_random_list,
-        'sorted': generate_sorted_list,
-        'reversed': generate_reversed_list
-    }
+    # Entradas vectorizadas, sembradas y cacheadas en disco (ver Generadores.py)
+    list_types = {shape: InputGenerator(shape) for shape in shapes}
     
-    algorithms = {
-        "Insertion Sort": insertion_sort,
-    }
+    algorithms = algorithms or ALGORITHMS
     
-    results = {}
+    # Cada backend aparece como un algoritmo más para compararlos lado a lado
+    entries = []
+    for backend in backends:
+        for algo_name, algo_func in algorithms.items():
+            if backend == "list":
+                entries.append((algo_name, algo_func, backend))
+            elif algo_func in NUMPY_ALGORITHMS and NUMPY_ALGORITHMS[algo_func] not in SCALAR_NUMPY_ALGORITHMS:
+                entries.append((f"{algo_name} ({backend})", NUMPY_ALGORITHMS[algo_func], backend))
     
-    for algo_name, algo_func in algorithms.items():
-        results[algo_name] = {}
-        for list_type, generator in list_types.items():
-            results[algo_name][list_type] = {}
-            for size in sizes:
-                
-                data = generator(size)
-                times = []
-                memories = []
-                
-                for _ in range(10):  # 10 repeticiones como en el estudio
-                    print(f"Ejecutando {algo_name} con lista {list_type} de tamaño {size}...")
-                    time, memory, _ = measure_performance(algo_func, data)
-                    times.append(time)
-                    memories.append(memory)
-                
-                # Eliminar outliers (mínimo y máximo)
-                if len(times) > 2:  # Solo si hay suficientes datos
-                    times_sorted = sorted(times)
-                    memories_sorted = sorted(memories)
-                    times_filtered = times_sorted[1:-1]
-                    memories_filtered = memories_sorted[1:-1]
-                else:
-                    times_filtered = times
-                    memories_filtered = memories
-                
-                # Calcular estadísticas
-                avg_time = np.mean(times_filtered)
-                std_time = np.std(times_filtered)
-                avg_memory = np.mean(memories_filtered)
-                std_memory = np.std(memories_filtered)
-                
-                results[algo_name][list_type][size] = {
-                    'avg_time': avg_time,
-                    'std_time': std_time,
-                    'avg_memory_kb': avg_memory,
-                    'std_memory_kb': std_memory
-                }
+    cells = [
+        {"algo_name": algo_name, "algo_func": algo_func, "list_type": list_type,
+         "generator": generator, "size": size, "backend": backend, "dtype": dtype,
+         "seed": seed, "cutoff": cutoff}
+        for algo_name, algo_func, backend in entries
+        for list_type, generator in list_types.items()
+        for size in sizes
+    ]
     
-    return results
+    # 10 repeticiones como en el estudio
+    return run_cells(cells, MEASURES[memory_backend], summarize, repetitions=10 if adaptive is None else 1,
+                     workers=workers, store=store, adaptive=adaptive,
+                     cell_budget=cell_budget, sweep_budget=sweep_budget,
+                     count_ops=count_ops)
 
 def print_results(results):
     """Función para mostrar los resultados de forma legible"""
@@ -117,11 +141,27 @@ def print_results(results):
             print(f"{'-'*40}")
             
             for size, metrics in type_data.items():
-                print(f"{size:<10} | {metrics['avg_time']:.6f} ± {metrics['std_time']:.6f} | "
-                      f"{metrics['avg_memory_kb']:.6f} ± {metrics['std_memory_kb']:.2f}")
+                line = (f"{size:<10} | {metrics['avg_time']:.6f} ± {metrics['std_time']:.6f} | "
+                        f"{metrics['avg_memory_kb']:.6f} ± {metrics['std_memory_kb']:.2f}")
+                if metrics.get('extrapolated'):
+                    line += " | extrapolado"
+                elif metrics.get('timed_out'):
+                    line += " | cancelado por tiempo"
+                elif metrics.get('failed'):
+                    line += f" | error (código de salida {metrics['exitcode']})"
+                if 'samples' in metrics:
+                    # Muestreo adaptativo: muestras tomadas y ejecuciones por muestra
+                    line += f" | {metrics['samples']} muestras x {metrics['loops']}"
+                if 'comparisons' in metrics:
+                    line += f" | {metrics['comparisons']} comparaciones ({metrics['comparisons_per_nlogn']:.2f}·n log n)"
+                if 'swaps' in metrics:
+                    # Solo los algoritmos de Contadores.SWAP_ALGORITHMS
+                    line += f", {metrics['swaps']} intercambios"
+                print(line)
 
 if __name__ == "__main__":
     print("Iniciando pruebas de rendimiento...")
-    benchmark_results = run_benchmark()
+    # Las celdas ya medidas con el mismo código se leen del almacén
+    benchmark_results = run_benchmark(store=ResultStore(DEFAULT_STORE))
     print("\nPruebas completadas. Resultados:")
     print_results(benchmark_results)
\ No newline at end of file
@@ -9,44 +9,33 @@
         # Ordenar recursivamente los elementos antes y después de la partición
         quick_sort(arr, low, pi - 1)
         quick_sort(arr, pi + 1, high)"""
-import random
+from Autoajuste import tuned
+from Claves import sort_by_key
+from IntroSort import intro_sort, partition as _partition
+from TimSort import CUTOFF
 
-def quick_sort(arr, low=None, high=None):
+def quick_sort(arr, low=None, high=None, three_way=False, cutoff=None,
+               final_pass=None, key=None, reverse=False):
+    # Estrategia de pivote aleatorio sobre el motor iterativo de IntroSort;
+    # key=/reverse= ordenan la lista completa (ver Claves.py)
+    if key is not None or reverse:
+        return sort_by_key(quick_sort, arr, key, reverse, three_way=three_way,
+                           cutoff=cutoff, final_pass=final_pass)
     if low is None or high is None:
         low = 0
         high = len(arr) - 1
-    if low < high:
-        pi = partition(arr, low, high)
-        quick_sort(arr, low, pi - 1)
-        quick_sort(arr, pi + 1, high)
+    if cutoff is None or final_pass is None:
+        # Parámetros del perfil de Autoajuste.py (por defecto CUTOFF, sin pasada final)
+        profile = tuned("quick_sort", arr, high - low + 1)
+        cutoff = profile.get("cutoff", CUTOFF) if cutoff is None else cutoff
+        final_pass = profile.get("final_pass", False) if final_pass is None else final_pass
+    intro_sort(arr, low, high, pivot="random", three_way=three_way,
+               cutoff=cutoff, final_pass=final_pass)
     return arr  # <-- Agrega esto para que retorne la lista ordenada
 
-# ...tu función partition aquí...
-
 def partition(arr, low, high):
     # Elegir un pivote aleatorio y ponerlo al final
-    pivot_idx = random.randint(low, high)
-    
-    arr[pivot_idx], arr[high] = arr[high], arr[pivot_idx]
-    pivot = arr[high]
-    i = low - 1
-    
-    for j in range(low, high):
-        # Si el elemento actual es menor o igual al pivote
-        if arr[j] <= pivot:
-            # Incrementamos el índice del elemento más pequeño
-            i += 1
-            # Intercambiamos arr[i] y arr[j]
-            arr[i], arr[j] = arr[j], arr[i]
-    
-    # Intercambiamos el pivote con el elemento en i+1
-    arr[i + 1], arr[high] = arr[high], arr[i + 1]
-    return i + 1
-
-    
-    # Intercambiamos el pivote con el elemento en i+1
-    arr[i + 1], arr[high] = arr[high], arr[i + 1]
-    return i + 1
+    return _partition(arr, low, high, "random")
 
 
 # Ejemplo de uso
@@ -0,0 +1,130 @@
+from Autoajuste import tuned
+from Claves import sort_by_key
+from HeapSort import heap_sort
+from TimSort import CUTOFF, insertion_sort
+
+# Por debajo de este tamaño no hay muestra de 5 elementos separados
+MIN_SAMPLE = 7
+
+
+def _sample_pivots(arr, lo, hi):
+    # Ordena una muestra de 5 elementos equiespaciados y lleva el 2.º y el
+    # 4.º (los pivotes, p <= q) a los extremos del tramo
+    seventh = (hi - lo + 1) // 7
+    e3 = (lo + hi) // 2
+    idx = [e3 - 2 * seventh, e3 - seventh, e3, e3 + seventh, e3 + 2 * seventh]
+    sample = [arr[i] for i in idx]
+    insertion_sort(sample)
+    for i, value in zip(idx, sample):
+        arr[i] = value
+    e2, e4 = idx[1], idx[3]
+    arr[lo], arr[e2] = arr[e2], arr[lo]
+    arr[hi], arr[e4] = arr[e4], arr[hi]
+
+
+def dual_pivot_partition(arr, lo, hi):
+    """
+    Partición de doble pivote (Yaroslavskiy) de arr[lo..hi] en una sola pasada.
+
+    Con los pivotes p = arr[lo] <= q = arr[hi] deja arr[lo..lt-1] < p,
+    arr[lt] = p, arr[lt+1..gt-1] entre p y q, arr[gt] = q y
+    arr[gt+1..hi] > q. Cada elemento se mira una vez y solo se mueve si no
+    está ya en su región, así hace menos intercambios que la partición de
+    Lomuto de un pivote.
+
+    Returns:
+        tuple: (lt, gt), las posiciones finales de los pivotes
+    """
+    p, q = arr[lo], arr[hi]
+    lt, k, gt = lo + 1, lo + 1, hi - 1
+    while k <= gt:
+        x = arr[k]
+        if x < p:
+            arr[k], arr[lt] = arr[lt], x
+            lt += 1
+        elif q < x:
+            # Buscar desde la derecha un elemento que no sea mayor que q
+            while q < arr[gt] and k < gt:
+                gt -= 1
+            arr[k], arr[gt] = arr[gt], x
+            gt -= 1
+            x = arr[k]
+            if x < p:
+                arr[k], arr[lt] = arr[lt], x
+                lt += 1
+        k += 1
+    lt -= 1
+    gt += 1
+    arr[lo], arr[lt] = arr[lt], p
+    arr[hi], arr[gt] = arr[gt], q
+    return lt, gt
+
+
+def quick_sortdual(arr, low=0, high=None, cutoff=None, key=None, reverse=False):
+    """
+    Quicksort de doble pivote (Yaroslavskiy, como Arrays.sort de Java 7).
+
+    Los pivotes son el 2.º y el 4.º de una muestra ordenada de 5 elementos
+    equiespaciados; cada partición deja tres regiones en una sola pasada.
+    Como IntroSort, es iterativo con pila explícita, pasa a heap_sort si la
+    profundidad supera 2·log2(n) y termina los tramos de cutoff elementos o
+    menos (o de menos de MIN_SAMPLE) con el insertion sort binario de TimSort.
+
+    Args:
+        arr (list): Lista a ordenar (se modifica en el lugar)
+        low (int): Primer índice a ordenar
+        high (int): Último índice a ordenar (inclusivo); None = len(arr) - 1
+        cutoff (int): Tamaño máximo de tramo para insertion sort; None = el del
+            perfil de Autoajuste.py o TimSort.CUTOFF
+        key (function): Función clave (ver Claves.py)
+        reverse (bool): Orden descendente
+
+    Returns:
+        list: La misma lista, ordenada
+    """
+    if key is not None or reverse:
+        return sort_by_key(quick_sortdual, arr, key, reverse, cutoff=cutoff)
+    if high is None:
+        high = len(arr) - 1
+    if high <= low:
+        return arr
+    if cutoff is None:
+        cutoff = tuned("quick_sortdual", arr, high - low + 1).get("cutoff", CUTOFF)
+    cutoff = max(cutoff, MIN_SAMPLE - 1)
+
+    max_depth = 2 * ((high - low + 1).bit_length() - 1)
+    stack = [(low, high, max_depth)]
+    while stack:
+        lo, hi, depth = stack.pop()
+        if hi - lo < cutoff:
+            if lo < hi:
+                insertion_sort(arr, lo, hi)
+            continue
+        if depth == 0:
+            heap_sort(arr, lo, hi)
+            continue
+        _sample_pivots(arr, lo, hi)
+        lt, gt = dual_pivot_partition(arr, lo, hi)
+        stack.append((gt + 1, hi, depth - 1))
+        # Si los pivotes son iguales, la región central es toda igual a ellos
+        if arr[lt] < arr[gt]:
+            stack.append((lt + 1, gt - 1, depth - 1))
+        stack.append((lo, lt - 1, depth - 1))
+    return arr
+
+
+# Ejemplo de uso: intercambios y comparaciones frente a las otras variantes
+# en todos los tipos de lista
+if __name__ == "__main__":
+    from Generadores import GENERATORS
+    from Probar2 import QUICK_SORTS, run_benchmark
+
+    datos = [10, 7, 8, 9, 1, 5, 7, 7, 3, 12, 0, 4]
+    print("Arreglo ordenado:", quick_sortdual(datos))
+
+    results = run_benchmark(algorithms=QUICK_SORTS, count_ops=True, shapes=tuple(GENERATORS))
+    print(f"\n{'Algoritmo':28} {'Tipo de lista':14} {'n':>7} {'intercambios':>13} {'comparaciones':>14}")
+    for algo, algo_data in results.items():
+        for list_type, type_data in algo_data.items():
+            for size, metrics in type_data.items():
+                print(f"{algo:28} {list_type:14} {size:>7} {metrics['swaps']:>13} {metrics['comparisons']:>14}")
@@ -1,35 +1,29 @@
-def quick_sortmedio(arr, low=0, high=None):
+from Autoajuste import tuned
+from Claves import sort_by_key
+from IntroSort import intro_sort, partition as _partition
+from TimSort import CUTOFF
+
+def quick_sortmedio(arr, low=0, high=None, three_way=False, cutoff=None,
+                    final_pass=None, key=None, reverse=False):
+    # Estrategia de pivote central sobre el motor iterativo de IntroSort;
+    # key=/reverse= ordenan la lista completa (ver Claves.py)
+    if key is not None or reverse:
+        return sort_by_key(quick_sortmedio, arr, key, reverse, three_way=three_way,
+                           cutoff=cutoff, final_pass=final_pass)
     if high is None:
         high = len(arr) - 1
     
-    if low < high:
-        # pi es el índice de partición, arr[pi] está en su lugar correcto
-        pi = partition(arr, low, high)
-        
-        # Ordenar recursivamente los elementos antes y después de la partición
-        quick_sortmedio(arr, low, pi - 1)
-        quick_sortmedio(arr, pi + 1, high)
+    if cutoff is None or final_pass is None:
+        # Parámetros del perfil de Autoajuste.py (por defecto CUTOFF, sin pasada final)
+        profile = tuned("quick_sortmedio", arr, high - low + 1)
+        cutoff = profile.get("cutoff", CUTOFF) if cutoff is None else cutoff
+        final_pass = profile.get("final_pass", False) if final_pass is None else final_pass
+    return intro_sort(arr, low, high, pivot="middle", three_way=three_way,
+                      cutoff=cutoff, final_pass=final_pass)
 
 def partition(arr, low, high):
     # Seleccionamos el pivote como el elemento del medio
-    mid = (low + high) // 2
-    arr[mid], arr[high] = arr[high], arr[mid]  # Mover el pivote al final
-    pivot = arr[high]
-    
-    # Índice del elemento más pequeño
-    i = low - 1
-    
-    for j in range(low, high):
-        # Si el elemento actual es menor o igual al pivote
-        if arr[j] <= pivot:
-            # Incrementamos el índice del elemento más pequeño
-            i += 1
-            # Intercambiamos arr[i] y arr[j]
-            arr[i], arr[j] = arr[j], arr[i]
-    
-    # Intercambiamos el pivote con el elemento en i+1
-    arr[i + 1], arr[high] = arr[high], arr[i + 1]
-    return i + 1
+    return _partition(arr, low, high, "middle")
 
 # Ejemplo de uso
 if __name__ == "__main__":
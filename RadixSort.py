@@ -0,0 +1,248 @@
+import struct
+from itertools import repeat
+
+import numpy as np
+
+# Ordenamientos por distribución (sin comparaciones) para claves enteras y
+# reales. Los reales se transforman a enteros sin signo que conservan el orden
+# (truco IEEE-754): si el bit de signo está activo se invierten todos los
+# bits, si no, solo se activa el bit de signo.
+
+# Bits por dígito en cada pasada de LSD (256 cubetas)
+DIGIT_BITS = 8
+
+# Rango máximo de claves (max - min + 1) para usar counting sort; por encima
+# (o si el rango supera COUNTING_RANGE_FACTOR·n) se usa radix sort
+COUNTING_MAX_RANGE = 1 << 20
+COUNTING_RANGE_FACTOR = 4
+
+_SIGN = 1 << 63
+_MASK64 = (1 << 64) - 1
+
+
+def _float_key(x):
+    # Entero de 64 bits sin signo con el mismo orden que el real x; -0.0 y 0.0
+    # son iguales y deben tener la misma clave
+    if x == 0.0:
+        x = 0.0
+    bits = struct.unpack("<Q", struct.pack("<d", x))[0]
+    return bits ^ _MASK64 if bits & _SIGN else bits | _SIGN
+
+
+def _keys(arr):
+    # Claves enteras no negativas con el mismo orden que los valores
+    if all(type(x) is int for x in arr):
+        low = min(arr)
+        return [x - low for x in arr]
+    return [_float_key(float(x)) for x in arr]
+
+
+def radix_sort(arr, bits=DIGIT_BITS, key=None, reverse=False):
+    """
+    Radix Sort LSD (dígito menos significativo primero) para listas.
+
+    Cada pasada es un counting sort estable del dígito actual: histograma,
+    suma de prefijos y reparto de atrás hacia delante. Las claves son los
+    enteros desplazados por el mínimo (así los negativos también sirven) o la
+    transformación IEEE-754 de los reales. Las pasadas en las que todas las
+    claves tienen el mismo dígito se saltan.
+
+    Con key= las claves salen de key(x), calculada una vez por elemento, y los
+    elementos pueden ser cualquier cosa; con reverse= se ordena por el
+    complemento de la clave, así el orden descendente también es estable.
+
+    Args:
+        arr (list): Lista de enteros o reales (se modifica en el lugar)
+        bits (int): Bits por dígito (2**bits cubetas)
+        key (function): Función que devuelve la clave entera o real
+        reverse (bool): Orden descendente
+    """
+    n = len(arr)
+    if n < 2:
+        return
+    if bits < 1:
+        raise ValueError("bits debe ser al menos 1")
+    keys = _keys([key(x) for x in arr] if key is not None else arr)
+    if reverse:
+        top = max(keys)
+        keys = [top - k for k in keys]
+    values = arr[:]
+    radix = 1 << bits
+    mask = radix - 1
+    total_bits = max(keys).bit_length()
+    for shift in range(0, total_bits, bits):
+        # Histograma del dígito
+        count = [0] * radix
+        digits = [(k >> shift) & mask for k in keys]
+        for d in digits:
+            count[d] += 1
+        if max(count) == n:
+            continue
+        # Suma de prefijos: posición final (exclusiva) de cada cubeta
+        total = 0
+        for d in range(radix):
+            total += count[d]
+            count[d] = total
+        # Reparto estable de atrás hacia delante
+        new_keys = [0] * n
+        new_values = [None] * n
+        for i in range(n - 1, -1, -1):
+            d = digits[i]
+            count[d] -= 1
+            new_keys[count[d]] = keys[i]
+            new_values[count[d]] = values[i]
+        keys, values = new_keys, new_values
+    arr[:] = values
+
+
+def counting_sort(arr, max_range=COUNTING_MAX_RANGE, key=None, reverse=False):
+    """
+    Counting Sort para listas de enteros con un rango de claves pequeño.
+
+    Cuenta cuántas veces aparece cada valor y reescribe la lista en orden:
+    O(n + k) con k = max - min + 1. Si k supera max_range o
+    COUNTING_RANGE_FACTOR·n (el recorrido de las k cubetas dominaría), o si
+    hay reales, se usa radix_sort.
+
+    Como reescribe valores en lugar de moverlos, con key= los registros se
+    ordenan con radix_sort (también estable).
+
+    Args:
+        arr (list): Lista de enteros (se modifica en el lugar)
+        max_range (int): Rango máximo de claves
+        key (function): Función que devuelve la clave entera o real
+        reverse (bool): Orden descendente
+    """
+    if len(arr) < 2:
+        return
+    if key is not None:
+        return radix_sort(arr, key=key, reverse=reverse)
+    if reverse:
+        # Valores sin clave: los iguales son indistinguibles
+        counting_sort(arr, max_range)
+        arr.reverse()
+        return
+    if not all(type(x) is int for x in arr):
+        return radix_sort(arr)
+    low, high = min(arr), max(arr)
+    if high - low + 1 > min(max_range, COUNTING_RANGE_FACTOR * len(arr)):
+        return radix_sort(arr)
+    count = [0] * (high - low + 1)
+    for x in arr:
+        count[x - low] += 1
+    pos = 0
+    for offset, c in enumerate(count):
+        if c:
+            arr[pos:pos + c] = repeat(low + offset, c)
+            pos += c
+
+
+def _keys_np(arr):
+    # Claves uint64 con el mismo orden que arr, desplazadas para empezar en 0
+    if arr.dtype.kind == "f":
+        values = arr.astype(np.float64)
+        values[values == 0.0] = 0.0  # -0.0 y 0.0: misma clave
+        bits = values.view(np.uint64)
+        keys = np.where(bits >> np.uint64(63), ~bits, bits | np.uint64(_SIGN))
+    else:
+        keys = arr.astype(np.int64).view(np.uint64) ^ np.uint64(_SIGN)
+    return keys - keys.min()
+
+
+def radix_sort_np(arr, bits=DIGIT_BITS):
+    """
+    Radix Sort LSD vectorizado para numpy.ndarray (int32, int64 o float64).
+
+    Cada pasada calcula el dígito de todas las claves a la vez, su histograma
+    con np.bincount (si una cubeta contiene todo, la pasada se salta) y el
+    reparto estable con np.argsort(kind="stable") sobre el dígito como uint8
+    o uint16, que NumPy resuelve con un counting sort por cubetas. Solo se
+    mueve una permutación; los valores se reordenan una vez al final.
+
+    Args:
+        arr (numpy.ndarray): Arreglo a ordenar (se modifica en el lugar)
+        bits (int): Bits por dígito, de 1 a 16
+
+    Returns:
+        numpy.ndarray: El mismo arreglo ordenado
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+    if not 1 <= bits <= 16:
+        raise ValueError("bits debe estar entre 1 y 16")
+    keys = _keys_np(arr)
+    digit_type = np.uint8 if bits <= 8 else np.uint16
+    mask = np.uint64((1 << bits) - 1)
+    total_bits = int(keys.max()).bit_length()
+    perm = None
+    for shift in range(0, total_bits, bits):
+        digits = ((keys >> np.uint64(shift)) & mask).astype(digit_type)
+        if np.bincount(digits, minlength=1 << bits).max() == n:
+            continue
+        order = np.argsort(digits, kind="stable")
+        keys = keys[order]
+        perm = order if perm is None else perm[order]
+    if perm is not None:
+        arr[:] = arr[perm]
+    return arr
+
+
+def counting_sort_np(arr, max_range=COUNTING_MAX_RANGE):
+    """
+    Counting Sort vectorizado: np.bincount de las claves y np.repeat de los
+    valores. Para reales o rangos grandes (ver counting_sort) usa radix_sort_np.
+
+    Args:
+        arr (numpy.ndarray): Arreglo a ordenar (se modifica en el lugar)
+        max_range (int): Rango máximo de claves
+
+    Returns:
+        numpy.ndarray: El mismo arreglo ordenado
+    """
+    if len(arr) < 2:
+        return arr
+    if arr.dtype.kind == "f":
+        return radix_sort_np(arr)
+    low, high = int(arr.min()), int(arr.max())
+    if high - low + 1 > min(max_range, COUNTING_RANGE_FACTOR * len(arr)):
+        return radix_sort_np(arr)
+    count = np.bincount((arr - low).astype(np.intp), minlength=high - low + 1)
+    arr[:] = np.repeat(np.arange(low, high + 1, dtype=arr.dtype), count)
+    return arr
+
+
+# Ejemplo de uso: dónde supera radix a tim_sort y merge_sort según n y el
+# rango de claves
+if __name__ == "__main__":
+    from Generadores import InputGenerator
+    from MergeSort import merge_sort
+    from Planificador import run_cells
+    from Probar2 import measure_performance, summarize
+    from TimSort import tim_sort
+
+    algorithms = {
+        "Tim Sort": tim_sort,
+        "Merge Sort": merge_sort,
+        "Radix Sort": radix_sort,
+        "Counting Sort": counting_sort,
+        "Radix Sort (ndarray)": radix_sort_np,
+        "Counting Sort (ndarray)": counting_sort_np,
+    }
+    key_ranges = [10, 1000, 10**5, 10**7]
+    cells = [
+        {"algo_name": algo_name, "algo_func": algo_func, "list_type": f"rango {k}",
+         "generator": InputGenerator("few_unique", k=k), "size": size,
+         "backend": "ndarray" if algo_name.endswith("(ndarray)") else "list",
+         "dtype": "int64", "seed": 0}
+        for algo_name, algo_func in algorithms.items()
+        for k in key_ranges
+        for size in [1000, 10000, 100000]
+    ]
+    results = run_cells(cells, measure_performance, summarize, repetitions=3)
+    for k in key_ranges:
+        print(f"\nRango de claves {k}:")
+        for algo_name in algorithms:
+            times = "  ".join(f"n={size}: {metrics['avg_time']:.5f} s"
+                              for size, metrics in results[algo_name][f"rango {k}"].items())
+            print(f"  {algo_name:24} {times}")
@@ -0,0 +1,222 @@
+import json
+import math
+import os
+import platform
+import sys
+
+import numpy as np
+
+from Generadores import InputGenerator
+from HeapSort import heap_sort
+from Memoria import measure_time
+from MergeSort import merge_sort
+from Planificador import run_cells
+from QuickSort import quick_sort
+from Resultados import algorithm_hash, machine_id
+from TimSort import tim_sort
+
+# Control de regresiones de rendimiento: ejecuta un subconjunto fijo y rápido
+# del benchmark y compara cada celda con un archivo base. Para cada celda se
+# calcula la razón de medianas (actual / base) con un intervalo de confianza
+# bootstrap y el p-valor de Mann-Whitney; una celda es una regresión si la
+# razón pasa de 1 + umbral, el intervalo entero queda por encima de 1 y el
+# p-valor es menor que ALPHA.
+# Los tiempos se guardan relativos a list.sort (ver measure), no en segundos.
+#
+# Uso: python Regresion.py [--update-baseline] [--threshold 0.25] [--baseline ruta]
+# Código de salida: 0 sin regresiones, 1 con alguna, 2 sin archivo base.
+
+# Base junto al código; es por máquina, como el perfil de Autoajuste.py
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "regresion_base.json")
+
+# Subconjunto fijo: cambiarlo invalida la base (hay que regenerarla)
+ALGORITHMS = {
+    "Merge Sort": merge_sort,
+    "Tim Sort": tim_sort,
+    "Quick Sort": quick_sort,
+    "Heap Sort": heap_sort,
+}
+SHAPES = ("random", "sorted", "nearly_sorted", "few_unique")
+SIZES = (5000, 20000)
+REPETITIONS = 15
+
+# Entre dos ejecuciones del mismo código las razones ya se mueven hasta un
+# 20 % en una máquina compartida, así que el umbral por defecto va por encima
+THRESHOLD = 0.25
+ALPHA = 0.01
+BOOTSTRAP_SAMPLES = 2000
+
+
+def measure(sort_function, data):
+    # Solo la pasada de tiempo, dividida por la de list.sort sobre los mismos
+    # datos medida justo después: así se cancela la deriva de velocidad de la
+    # máquina entre la ejecución base y la actual (CPU compartida, frecuencia)
+    execution_time, sorted_data = measure_time(sort_function, data)
+    reference_time, _ = measure_time(list.sort, data)
+    return execution_time / max(reference_time, 1e-9), 0.0, sorted_data
+
+
+def keep_times(times, memories):
+    # Conserva las muestras: las pruebas necesitan la distribución, no la media
+    return {'times': list(times), 'median_time': float(np.median(times))}
+
+
+def run_subset(repetitions=REPETITIONS, seed=0):
+    """
+    Ejecuta el subconjunto fijo con Planificador.run_cells.
+
+    Returns:
+        dict: results[algo][list_type][size] = {'times', 'median_time'}
+    """
+    cells = [
+        {"algo_name": algo_name, "algo_func": algo_func, "list_type": shape,
+         "generator": InputGenerator(shape), "size": size, "backend": "list",
+         "dtype": "int64", "seed": seed}
+        for algo_name, algo_func in ALGORITHMS.items()
+        for shape in SHAPES
+        for size in SIZES
+    ]
+    return run_cells(cells, measure, keep_times, repetitions=repetitions)
+
+
+def bootstrap_ratio_ci(base, current, samples=BOOTSTRAP_SAMPLES, seed=0):
+    """
+    Intervalo de confianza del 95 % (percentiles) de mediana(current) /
+    mediana(base), remuestreando cada serie con reemplazo.
+
+    Returns:
+        tuple: (razón, límite inferior, límite superior)
+    """
+    rng = np.random.default_rng(seed)
+    base = np.asarray(base, dtype=float)
+    current = np.asarray(current, dtype=float)
+    base_medians = np.median(rng.choice(base, (samples, len(base))), axis=1)
+    current_medians = np.median(rng.choice(current, (samples, len(current))), axis=1)
+    ratios = current_medians / np.maximum(base_medians, 1e-12)
+    low, high = np.percentile(ratios, [2.5, 97.5])
+    return float(np.median(current) / max(np.median(base), 1e-12)), float(low), float(high)
+
+
+def mann_whitney(base, current):
+    """
+    Prueba U de Mann-Whitney de dos colas (aproximación normal con
+    corrección por empates y por continuidad).
+
+    Returns:
+        float: p-valor
+    """
+    n1, n2 = len(base), len(current)
+    values = np.concatenate([np.asarray(base, dtype=float), np.asarray(current, dtype=float)])
+    # Rangos promedio (los empates comparten rango)
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    upper = np.cumsum(counts)
+    ranks = (upper - (counts - 1) / 2)[inverse]
+    u = ranks[:n1].sum() - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    tie_term = ((counts ** 3 - counts).sum()) / (n * (n - 1)) if n > 1 else 0.0
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term))
+    if sigma == 0:
+        return 1.0
+    z = (abs(u - n1 * n2 / 2) - 0.5) / sigma
+    return math.erfc(max(z, 0.0) / math.sqrt(2))
+
+
+def compare(baseline, results, threshold=THRESHOLD):
+    """
+    Compara cada celda de results con la misma celda de la base.
+
+    Returns:
+        list: Filas con algo, list_type, size, ratio, ci_low, ci_high,
+              p_value, verdict ("regresión", "mejora", "igual" o "nueva") y
+              code_changed
+    """
+    rows = []
+    for algo, algo_data in results.items():
+        for list_type, type_data in algo_data.items():
+            for size, metrics in type_data.items():
+                cell = baseline["results"].get(algo, {}).get(list_type, {}).get(str(size))
+                row = {'algo': algo, 'list_type': list_type, 'size': size,
+                       'code_changed': baseline["hashes"].get(algo) != algorithm_hash(ALGORITHMS[algo])}
+                if cell is None:
+                    row.update(ratio=float("nan"), ci_low=float("nan"), ci_high=float("nan"),
+                               p_value=float("nan"), verdict="nueva")
+                    rows.append(row)
+                    continue
+                ratio, low, high = bootstrap_ratio_ci(cell['times'], metrics['times'])
+                p_value = mann_whitney(cell['times'], metrics['times'])
+                significant = p_value < ALPHA
+                if ratio > 1 + threshold and low > 1 and significant:
+                    verdict = "regresión"
+                elif ratio < 1 / (1 + threshold) and high < 1 and significant:
+                    verdict = "mejora"
+                else:
+                    verdict = "igual"
+                row.update(ratio=ratio, ci_low=low, ci_high=high, p_value=p_value, verdict=verdict)
+                rows.append(row)
+    return rows
+
+
+def print_table(rows, threshold=THRESHOLD):
+    """Tabla de razones (actual / base): > 1 es más lento, < 1 más rápido."""
+    print(f"\n{'Algoritmo':12} {'Tipo de lista':14} {'n':>6} {'actual/base':>11} "
+          f"{'IC 95 %':>17} {'p (MW)':>8}  veredicto")
+    print("-" * 86)
+    for r in rows:
+        changed = " (código cambiado)" if r['code_changed'] else ""
+        ci = f"[{r['ci_low']:.3f}, {r['ci_high']:.3f}]"
+        print(f"{r['algo']:12} {r['list_type']:14} {r['size']:>6} {r['ratio']:>11.3f} "
+              f"{ci:>17} {r['p_value']:>8.4f}  {r['verdict']}{changed}")
+    regressions = sum(r['verdict'] == "regresión" for r in rows)
+    improvements = sum(r['verdict'] == "mejora" for r in rows)
+    print(f"\n{regressions} regresiones y {improvements} mejoras con umbral {threshold:.0%}")
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    """Guarda los resultados como nueva base (con la máquina y el hash de cada algoritmo)."""
+    data = {
+        "machine": machine_id(),
+        "python": platform.python_version(),
+        "hashes": {algo: algorithm_hash(func) for algo, func in ALGORITHMS.items()},
+        "results": {algo: {list_type: {str(size): metrics for size, metrics in type_data.items()}
+                           for list_type, type_data in algo_data.items()}
+                    for algo, algo_data in results.items()},
+    }
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp, path)
+
+
+def load_baseline(path=BASELINE_PATH):
+    with open(path) as f:
+        return json.load(f)
+
+
+def main(argv):
+    path = BASELINE_PATH
+    threshold = THRESHOLD
+    update = "--update-baseline" in argv
+    if "--baseline" in argv:
+        path = argv[argv.index("--baseline") + 1]
+    if "--threshold" in argv:
+        threshold = float(argv[argv.index("--threshold") + 1])
+
+    if not update and not os.path.exists(path):
+        print(f"No hay archivo base en {path}; créalo con --update-baseline")
+        return 2
+    results = run_subset()
+    if update:
+        save_baseline(results, path)
+        print(f"Base actualizada en {path}")
+        return 0
+
+    baseline = load_baseline(path)
+    if baseline.get("machine") != machine_id():
+        print("Aviso: la base se midió en otra máquina; las razones no son comparables")
+    rows = compare(baseline, results, threshold)
+    print_table(rows, threshold)
+    return 1 if any(r['verdict'] == "regresión" for r in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,256 @@
+import hashlib
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+# Renderizado por lotes de los gráficos de Graficos.py, sin pantalla.
+# Cada figura se dibuja con matplotlib.figure.Figure (lienzo Agg, sin el
+# estado global de pyplot), así que importar este módulo no cambia el backend
+# ni abre ventanas. Las figuras se reparten entre procesos y las que tienen
+# los mismos datos que la última vez no se vuelven a dibujar.
+
+# Cambiar si cambia el aspecto de alguna figura, para volver a dibujarlas todas
+RENDER_VERSION = 1
+
+# Archivo (dentro del directorio de salida) con el hash de cada figura
+MANIFEST = ".manifest.json"
+
+METRIC_LABELS = {
+    'avg_time': 'Tiempo promedio (s)',
+    'avg_memory_kb': 'Memoria promedio (KB)',
+    'comparisons_per_nlogn': 'Comparaciones / (n log n)',
+}
+ERRORS = {'avg_time': 'std_time', 'avg_memory_kb': 'std_memory_kb'}
+
+
+def tidy_results(results):
+    """
+    Convierte results[algo][list_type][size] en un DataFrame ordenado, con una
+    fila por celda y una columna por métrica.
+
+    Las celdas extrapoladas o canceladas (ver Presupuesto.py) se descartan y
+    'avg_memory' (Probar.py) se renombra a 'avg_memory_kb'.
+
+    Returns:
+        pandas.DataFrame: columnas algo, list_type, size y las métricas
+    """
+    rows = []
+    for algo, algo_data in results.items():
+        for list_type, type_data in algo_data.items():
+            for size, metrics in type_data.items():
+                if (not metrics or metrics.get('extrapolated') or metrics.get('timed_out')
+                        or metrics.get('failed')):
+                    continue
+                row = {'algo': algo, 'list_type': list_type, 'size': int(size)}
+                for key, value in metrics.items():
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        row[key] = float(value)
+                rows.append(row)
+    df = pd.DataFrame(rows)
+    if 'avg_memory' in df and 'avg_memory_kb' not in df:
+        df = df.rename(columns={'avg_memory': 'avg_memory_kb'})
+    return df.sort_values(['algo', 'list_type', 'size'], ignore_index=True) if rows else df
+
+
+def _records(df, columns):
+    # Subconjunto serializable (y hasheable) de las columnas presentes
+    present = [c for c in columns if c in df]
+    return df[present].to_dict("records")
+
+
+def figure_jobs(df):
+    """
+    Lista de figuras a dibujar: (nombre, tipo, título, datos).
+
+    Tipos: "line" (métrica frente al tamaño por tipo de lista), "bar"
+    (algoritmos para un tipo y un tamaño), "heatmap" (algoritmo x tamaño) y
+    "size" (barras agrupadas por tipo de lista para un tamaño).
+    """
+    if df.empty:
+        return []
+    base = ['algo', 'list_type', 'size']
+    metrics = [m for m in METRIC_LABELS if m in df]
+    jobs = []
+    for list_type, part in df.groupby('list_type', sort=False):
+        for metric in metrics:
+            columns = base + [metric, ERRORS.get(metric, '')]
+            jobs.append((f"{metric}_{list_type}", "line",
+                         f"{METRIC_LABELS[metric]} - listas {list_type}", _records(part, columns)))
+        jobs.append((f"heatmap_{list_type}", "heatmap",
+                     f"Heatmap de tiempos - listas {list_type}", _records(part, base + ['avg_time'])))
+        for size, cell in part.groupby('size'):
+            jobs.append((f"barras_{list_type}_{size}", "bar",
+                         f"Tiempo y memoria - {list_type} (n={size})",
+                         _records(cell, base + ['avg_time', 'std_time', 'avg_memory_kb', 'std_memory_kb'])))
+    for size, part in df.groupby('size'):
+        jobs.append((f"tamano_{size}", "size", f"Comparación de algoritmos - tamaño {size}",
+                     _records(part, base + ['avg_time', 'std_time', 'avg_memory_kb', 'std_memory_kb'])))
+    return jobs
+
+
+def _job_hash(job, formats):
+    name, kind, title, records = job
+    payload = json.dumps([RENDER_VERSION, kind, title, records, list(formats)], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _draw_line(fig, title, df, metric):
+    ax = fig.add_subplot(1, 1, 1)
+    error = ERRORS.get(metric)
+    for algo, part in df.groupby('algo', sort=False):
+        yerr = part[error] if error in part else None
+        ax.errorbar(part['size'], part[metric], yerr=yerr, label=algo, marker='o', capsize=4)
+    ax.set_xscale('log')
+    if metric == 'avg_time':
+        ax.set_yscale('log')
+    ax.set_xlabel('Tamaño de la lista (elementos)')
+    ax.set_ylabel(METRIC_LABELS[metric])
+    ax.set_title(title)
+    ax.grid(True, ls="--")
+    ax.legend(fontsize=8)
+
+
+def _draw_bar(fig, title, df):
+    panels = [m for m in ('avg_time', 'avg_memory_kb') if m in df]
+    for i, metric in enumerate(panels):
+        ax = fig.add_subplot(1, len(panels), i + 1)
+        error = ERRORS[metric]
+        ax.bar(df['algo'], df[metric], yerr=df[error] if error in df else None, capsize=5,
+               color=[f"C{k}" for k in range(len(df))])
+        ax.set_ylabel(METRIC_LABELS[metric])
+        ax.tick_params(axis='x', rotation=45)
+    fig.suptitle(title)
+
+
+def _draw_heatmap(fig, title, df):
+    table = df.pivot(index='algo', columns='size', values='avg_time')
+    ax = fig.add_subplot(1, 1, 1)
+    values = table.to_numpy(dtype=float)
+    positive = values[values > 0]
+    from matplotlib.colors import LogNorm
+    norm = LogNorm(positive.min(), positive.max()) if positive.size and positive.min() < positive.max() else None
+    image = ax.imshow(values, cmap='viridis', aspect='auto', norm=norm)
+    fig.colorbar(image, ax=ax, label='Tiempo (s)')
+    ax.set_xticks(range(len(table.columns)), [str(c) for c in table.columns])
+    ax.set_yticks(range(len(table.index)), list(table.index))
+    for i in range(values.shape[0]):
+        for j in range(values.shape[1]):
+            if not math.isnan(values[i, j]):
+                ax.text(j, i, f"{values[i, j]:.4f}", ha="center", va="center", color="w", fontsize=8)
+    ax.set_xlabel('Tamaño de la lista')
+    ax.set_ylabel('Algoritmo')
+    ax.set_title(title)
+
+
+def _draw_size(fig, title, df):
+    panels = [m for m in ('avg_time', 'avg_memory_kb') if m in df]
+    list_types = list(dict.fromkeys(df['list_type']))
+    algorithms = list(dict.fromkeys(df['algo']))
+    width = 0.8 / max(len(algorithms), 1)
+    for i, metric in enumerate(panels):
+        ax = fig.add_subplot(1, len(panels), i + 1)
+        error = ERRORS[metric]
+        for j, algo in enumerate(algorithms):
+            part = df[df['algo'] == algo].set_index('list_type').reindex(list_types)
+            x = [k + j * width for k in range(len(list_types))]
+            ax.bar(x, part[metric], width, yerr=part[error] if error in part else None,
+                   capsize=3, label=algo)
+        ax.set_xticks([k + 0.4 - width / 2 for k in range(len(list_types))],
+                      [t.capitalize() for t in list_types])
+        ax.set_ylabel(METRIC_LABELS[metric])
+        ax.grid(True, axis='y', ls="--")
+        ax.legend(fontsize=8)
+    fig.suptitle(title)
+
+
+def _render(job, out_dir, formats):
+    """Dibuja una figura y la guarda en cada formato (se ejecuta en un worker)."""
+    from matplotlib.figure import Figure
+
+    name, kind, title, records = job
+    df = pd.DataFrame(records)
+    fig = Figure(figsize=(14, 8) if kind in ("bar", "size") else (12, 8))
+    if kind == "line":
+        metric = next(m for m in METRIC_LABELS if name.startswith(m + "_"))
+        _draw_line(fig, title, df, metric)
+    elif kind == "bar":
+        _draw_bar(fig, title, df)
+    elif kind == "heatmap":
+        _draw_heatmap(fig, title, df)
+    elif kind == "size":
+        _draw_size(fig, title, df)
+    else:
+        raise ValueError(f"Tipo de figura desconocido: {kind}")
+    # Márgenes fijos: tight_layout mide todo el texto y duplica el tiempo por figura
+    fig.subplots_adjust(left=0.08, right=0.97, bottom=0.15, top=0.9, wspace=0.25)
+    paths = []
+    for fmt in formats:
+        path = os.path.join(out_dir, f"{name}.{fmt}")
+        fig.savefig(path, format=fmt)
+        paths.append(path)
+    return name, paths
+
+
+def render_figures(results, out_dir="figuras", formats=("png",), workers=None, force=False):
+    """
+    Dibuja todas las figuras de unos resultados en archivos, sin pantalla.
+
+    Args:
+        results (dict): results[algo][list_type][size] (run_benchmark o el almacén)
+        out_dir (str): Directorio de salida
+        formats (tuple): Formatos de archivo ("png", "svg", ...)
+        workers (int): Procesos; None = os.cpu_count(), 1 = en este proceso
+        force (bool): Volver a dibujar aunque los datos no hayan cambiado
+
+    Returns:
+        dict: {'rendered': [nombres], 'skipped': [nombres]}
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    manifest = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+    pending, skipped = [], []
+    for job in figure_jobs(tidy_results(results)):
+        name = job[0]
+        digest = _job_hash(job, formats)
+        files_exist = all(os.path.exists(os.path.join(out_dir, f"{name}.{fmt}")) for fmt in formats)
+        if not force and manifest.get(name) == digest and files_exist:
+            skipped.append(name)
+        else:
+            pending.append((job, digest))
+
+    rendered = []
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(pending) < 2:
+        for job, digest in pending:
+            _render(job, out_dir, formats)
+            manifest[job[0]] = digest
+            rendered.append(job[0])
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [(pool.submit(_render, job, out_dir, formats), digest) for job, digest in pending]
+            for future, digest in futures:
+                name, _ = future.result()
+                manifest[name] = digest
+                rendered.append(name)
+
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    return {'rendered': rendered, 'skipped': skipped}
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    import sys
+    from Resultados import DEFAULT_STORE
+    from Graficos import load_results_from_store
+
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else "figuras"
+    summary = render_figures(load_results_from_store(DEFAULT_STORE), out_dir, formats=("png", "svg"))
+    print(f"{len(summary['rendered'])} figuras dibujadas, {len(summary['skipped'])} sin cambios en {out_dir}")
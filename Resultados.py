@@ -0,0 +1,164 @@
+import hashlib
+import inspect
+import json
+import os
+import platform
+import sqlite3
+import time
+import types
+
+# Archivo por defecto del almacén de resultados
+DEFAULT_STORE = "benchmark_results.sqlite"
+
+_REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _in_repo(obj):
+    # True si la función/clase está definida en un archivo de este repositorio
+    try:
+        path = inspect.getsourcefile(obj)
+    except TypeError:
+        return False
+    return path is not None and os.path.dirname(os.path.abspath(path)) == _REPO_DIR
+
+
+def _code_names(code):
+    # Nombres globales usados por un código y por sus funciones anidadas
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def algorithm_hash(func):
+    """
+    Hash del código fuente de un algoritmo y de todo lo que usa del repo.
+
+    Se recorre el grafo de llamadas a partir de las variables globales que usa
+    cada función (por ejemplo quick_sort -> intro_sort -> partition, heap_sort,
+    ...), así que el hash solo cambia cuando cambia código que de verdad se
+    ejecuta. Las constantes simples del módulo (MIN_GALLOP, BLOCK_SIZE, ...)
+    también forman parte del hash.
+
+    Args:
+        func (function): Función de ordenamiento
+
+    Returns:
+        str: Hash SHA-256 en hexadecimal
+    """
+    digest = hashlib.sha256()
+    seen = set()
+    pending = [func]
+    while pending:
+        f = pending.pop()
+        key = (f.__module__, f.__qualname__)
+        if key in seen:
+            continue
+        seen.add(key)
+        digest.update(f"{key}\n".encode())
+        digest.update(inspect.getsource(f).encode())
+        for name in sorted(_code_names(f.__code__)):
+            value = f.__globals__.get(name)
+            if isinstance(value, types.FunctionType) and _in_repo(value):
+                pending.append(value)
+            elif isinstance(value, (int, float, str, bytes, tuple, frozenset)):
+                digest.update(f"{name}={value!r}\n".encode())
+    return digest.hexdigest()
+
+
+def machine_id():
+    """Identificador estable de la máquina (nombre, arquitectura y procesador)."""
+    parts = (platform.node(), platform.machine(), platform.processor(), platform.system())
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:16]
+
+
+class ResultStore:
+    """
+    Almacén SQLite de resultados direccionado por contenido.
+
+    Cada celda se identifica por (algoritmo, hash del código, tipo de lista,
+    tamaño, semilla, versión de Python, máquina, configuración). Si la celda ya
+    está guardada, run_cells no la vuelve a medir; al cambiar el código de un
+    algoritmo cambia su hash y solo sus celdas se miden de nuevo.
+    """
+
+    def __init__(self, path=DEFAULT_STORE):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS results (
+                   key TEXT PRIMARY KEY,
+                   algo TEXT, list_type TEXT, size INTEGER, seed INTEGER,
+                   source_hash TEXT, python TEXT, machine TEXT, config TEXT,
+                   metrics TEXT, created REAL)"""
+        )
+        self.conn.commit()
+        self._hashes = {}
+
+    def cell_key(self, cell, config=""):
+        """
+        Clave de una celda de Planificador.run_cells.
+
+        Args:
+            cell (dict): Celda con al menos algo_name, algo_func, list_type, size y seed
+            config (str): Resto de parámetros que afectan a la medición
+                          (función de medida, repeticiones, backend, ...)
+
+        Returns:
+            tuple: (clave, campos) listos para get/put
+        """
+        func = cell["algo_func"]
+        if func not in self._hashes:
+            self._hashes[func] = algorithm_hash(func)
+        fields = {
+            "algo": cell["algo_name"],
+            "list_type": cell["list_type"],
+            "size": cell["size"],
+            "seed": cell["seed"],
+            "source_hash": self._hashes[func],
+            "python": platform.python_version(),
+            "machine": machine_id(),
+            "config": config,
+        }
+        key = hashlib.sha256(json.dumps(fields, sort_keys=True).encode()).hexdigest()
+        return key, fields
+
+    def get(self, key):
+        # Métricas guardadas para la clave, o None si la celda no se ha medido
+        row = self.conn.execute("SELECT metrics FROM results WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, key, fields, metrics):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, fields["algo"], fields["list_type"], fields["size"], fields["seed"],
+             fields["source_hash"], fields["python"], fields["machine"], fields["config"],
+             json.dumps(metrics), time.time()),
+        )
+        self.conn.commit()
+
+    def load_results(self, machine=None):
+        """
+        Reconstruye results[algo][list_type][size] con la medición más reciente
+        de cada celda.
+
+        Args:
+            machine (str): Filtrar por machine_id(); None = todas las máquinas
+
+        Returns:
+            dict: Resultados en la estructura que usa Graficos.py
+        """
+        query = "SELECT algo, list_type, size, metrics FROM results"
+        params = ()
+        if machine is not None:
+            query += " WHERE machine = ?"
+            params = (machine,)
+        query += " ORDER BY created"
+        results = {}
+        for algo, list_type, size, metrics in self.conn.execute(query, params):
+            results.setdefault(algo, {}).setdefault(list_type, {})[size] = json.loads(metrics)
+        return results
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,211 @@
+import timeit
+from itertools import islice
+
+from HeapSort import heapify, heap_sort, sift_down
+from IntroSort import intro_sort, partition3
+from QuickSort import partition as partition_random
+from QuickSortmedio import partition as partition_middle
+from QuickSortult import partition as partition_last
+from TimSort import CUTOFF, insertion_sort
+
+# Selección parcial (solo los k menores, o el k-ésimo) sobre los mismos
+# núcleos que los algoritmos completos: las particiones de QuickSort*.py
+# para introselect y el heap máximo de HeapSort.py para el top-k en flujo.
+
+# Partición de Lomuto de cada variante de quicksort, según el pivote
+PARTITIONS = {
+    "random": partition_random,
+    "middle": partition_middle,
+    "last": partition_last,
+}
+
+
+def _median_of_medians(arr, lo, hi):
+    """
+    Índice de un pivote que deja al menos ~30 % del tramo a cada lado:
+    mediana de las medianas de grupos de 5 (BFPRT).
+    """
+    if hi - lo < 5:
+        insertion_sort(arr, lo, hi)
+        return (lo + hi) // 2
+    # Ordenar cada grupo y llevar su mediana al principio del tramo
+    m = lo
+    for g in range(lo, hi + 1, 5):
+        end = min(g + 4, hi)
+        insertion_sort(arr, g, end)
+        mid = (g + end) // 2
+        arr[m], arr[mid] = arr[mid], arr[m]
+        m += 1
+    mid = (lo + m - 1) // 2
+    _select(arr, lo, m - 1, mid, None, 0)
+    return mid
+
+
+def _select(arr, lo, hi, k, partition, max_depth):
+    # Introselect: particiones con `partition` hasta max_depth; después (o
+    # con max_depth = 0) pivote por mediana de medianas y partición de tres
+    # vías, que es lineal en el peor caso incluso con muchos duplicados
+    depth = max_depth
+    while hi - lo >= CUTOFF:
+        if depth == 0:
+            p = _median_of_medians(arr, lo, hi)
+            arr[p], arr[hi] = arr[hi], arr[p]
+            lt, gt = partition3(arr, lo, hi, "last")
+            if k < lt:
+                hi = lt - 1
+            elif k > gt:
+                lo = gt + 1
+            else:
+                return
+            continue
+        depth -= 1
+        pi = partition(arr, lo, hi)
+        if k < pi:
+            hi = pi - 1
+        elif k > pi:
+            lo = pi + 1
+        else:
+            return
+    insertion_sort(arr, lo, hi)
+
+
+def nth_element(arr, k, pivot="random"):
+    """
+    Reordena arr para que arr[k] sea el que ocuparía la posición k en la
+    lista ordenada, con arr[:k] <= arr[k] <= arr[k + 1:] (como
+    std::nth_element). O(n) en promedio y en el peor caso.
+
+    Args:
+        arr (list): Lista (se modifica en el lugar)
+        k (int): Posición buscada (0 = mínimo); admite negativos
+        pivot (str): "random", "middle" o "last" (partición de QuickSort,
+            QuickSortmedio o QuickSortult), o "median_of_medians" para usar
+            siempre el pivote determinista
+
+    Returns:
+        El elemento arr[k]
+    """
+    n = len(arr)
+    if k < 0:
+        k += n
+    if not 0 <= k < n:
+        raise IndexError("k fuera de rango")
+    if pivot == "median_of_medians":
+        _select(arr, 0, n - 1, k, None, 0)
+    elif pivot in PARTITIONS:
+        _select(arr, 0, n - 1, k, PARTITIONS[pivot], 2 * (n.bit_length() - 1))
+    else:
+        raise ValueError(f"Estrategia de pivote desconocida: {pivot}")
+    return arr[k]
+
+
+def partial_sort(arr, k, pivot="random"):
+    """
+    Deja en arr[:k] los k menores ya ordenados; el resto queda sin orden.
+
+    Selecciona con nth_element y ordena solo el prefijo con intro_sort:
+    O(n + k log k).
+
+    Returns:
+        list: La misma lista
+    """
+    n = len(arr)
+    k = max(0, min(k, n))
+    if k == 0:
+        return arr
+    if k < n:
+        nth_element(arr, k - 1, pivot)
+    intro_sort(arr, 0, k - 1)
+    return arr
+
+
+def top_k(iterable, k, key=None):
+    """
+    Los k menores de un iterable cualquiera, en orden, con un heap máximo
+    acotado a k elementos (HeapSort): cada elemento nuevo solo entra si es
+    menor que la raíz. Memoria O(k) y tiempo O(n log k), sin materializar
+    el iterable. Con key= se compara key(x); los empates conservan el orden
+    de llegada.
+
+    Args:
+        iterable: Datos (lista, generador, archivo, ...)
+        k (int): Cuántos elementos devolver
+        key (function): Función clave
+
+    Returns:
+        list: Los k menores (o todos si hay menos), ordenados
+    """
+    if k <= 0:
+        return []
+    it = iter(iterable)
+    if key is None:
+        heap = list(islice(it, k))
+        heapify(heap)
+        if len(heap) == k:
+            for x in it:
+                if x < heap[0]:
+                    heap[0] = x
+                    sift_down(heap, k, 0)
+        heap_sort(heap)
+        return heap
+    # Decorado (clave, orden de llegada, elemento): los elementos nunca se comparan
+    heap = [(key(x), i, x) for i, x in enumerate(islice(it, k))]
+    heapify(heap)
+    if len(heap) == k:
+        for i, x in enumerate(it, k):
+            kx = key(x)
+            if kx < heap[0][0]:
+                heap[0] = (kx, i, x)
+                sift_down(heap, k, 0)
+    heap_sort(heap)
+    return [x for _, _, x in heap]
+
+
+def run_selection_benchmark(sizes, fractions=(0.001, 0.01, 0.1, 0.5), repetitions=3, seed=0):
+    """
+    Compara la selección parcial con ordenar todo y recortar, según k/n.
+
+    Métodos: nth_element (solo el k-ésimo), partial_sort (los k menores
+    ordenados), top_k (heap acotado sobre un iterador) y "sort + slice"
+    (intro_sort completo y arr[:k]).
+
+    Returns:
+        dict: results[método][f"k/n={fracción}"][size] = {'avg_time'}
+    """
+    from Generadores import InputGenerator
+
+    methods = {
+        "nth_element": lambda data, k: nth_element(data, k - 1),
+        "partial_sort": lambda data, k: partial_sort(data, k)[:k],
+        "top_k": lambda data, k: top_k(iter(data), k),
+        "sort + slice": lambda data, k: intro_sort(data)[:k],
+    }
+    results = {name: {f"k/n={f}": {} for f in fractions} for name in methods}
+    for size in sizes:
+        data = InputGenerator("random")(size, seed)
+        for fraction in fractions:
+            k = max(1, int(size * fraction))
+            for name, method in methods.items():
+                print(f"Ejecutando {name} con k={k} de {size}...")
+                times = []
+                for _ in range(repetitions):
+                    copy = data[:]
+                    start = timeit.default_timer()
+                    method(copy, k)
+                    times.append(timeit.default_timer() - start)
+                results[name][f"k/n={fraction}"][size] = {'avg_time': sum(times) / repetitions}
+    return results
+
+
+# Ejemplo de uso
+if __name__ == "__main__":
+    datos = [9, 1, 8, 2, 7, 3, 6, 4, 5, 0]
+    print("Mediana:", nth_element(datos[:], len(datos) // 2))
+    print("3 menores:", partial_sort(datos[:], 3)[:3], top_k(iter(datos), 3))
+
+    results = run_selection_benchmark([10000, 100000])
+    for name, method_data in results.items():
+        print(f"\n{name}:")
+        for label, type_data in method_data.items():
+            line = "  ".join(f"n={size}: {m['avg_time']:.5f} s" for size, m in type_data.items())
+            print(f"  {label:12} {line}")
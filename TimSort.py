@@ -1,62 +1,304 @@
-def insertion_sort(arr, left=0, right=None):
+from bisect import bisect_left, bisect_right
+
+from Autoajuste import tuned
+from Claves import sort_by_key
+
+# Umbral inicial para pasar al modo galope durante una fusión
+MIN_GALLOP = 7
+
+# Tamaño de tramo por debajo del cual los algoritmos de divide y vencerás
+# (quick, intro, merge y heap) terminan con insertion_sort, si el perfil de
+# Autoajuste.py no indica otro
+CUTOFF = 16
+
+
+def insertion_sort(arr, left=0, right=None, start=None):
+    # Insertion sort binario sobre arr[left..right] (inclusivo); arr[left..start-1]
+    # ya está ordenado. La posición se busca con bisect y el hueco se abre con
+    # una sola copia de slice. Es el núcleo común para los tramos pequeños de
+    # todos los algoritmos híbridos (ver CUTOFF).
     if right is None:
         right = len(arr) - 1
-    
-    for i in range(left + 1, right + 1):
+    if start is None:
+        start = left + 1
+
+    for i in range(max(start, left + 1), right + 1):
         key = arr[i]
-        j = i - 1
-        while j >= left and arr[j] > key:
-            arr[j + 1] = arr[j]
-            j -= 1
-        arr[j + 1] = key
-
-def merge(arr, l, m, r):
-    len1, len2 = m - l + 1, r - m
-    left, right = arr[l:m+1], arr[m+1:r+1]
-    
-    i = j = 0
-    k = l
-    
-    while i < len1 and j < len2:
-        if left[i] <= right[j]:
-            arr[k] = left[i]
-            i += 1
-        else:
-            arr[k] = right[j]
-            j += 1
-        k += 1
-    
-    while i < len1:
-        arr[k] = left[i]
-        i += 1
-        k += 1
-    
-    while j < len2:
-        arr[k] = right[j]
-        j += 1
-        k += 1
-
-def tim_sort(arr):
-    min_run = 32
+        # bisect_right mantiene la estabilidad: key va después de sus iguales
+        pos = bisect_right(arr, key, left, i)
+        if pos < i:
+            arr[pos + 1:i + 1] = arr[pos:i]
+            arr[pos] = key
+
+def compute_min_run(n):
+    # Toma los 6 bits más altos de n y suma 1 si alguno de los restantes está
+    # encendido, para que n / min_run sea una potencia de 2 o un poco menos
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+def count_run_and_make_ascending(arr, lo, hi):
+    # Longitud del tramo natural que empieza en lo (hi exclusivo). Los tramos
+    # estrictamente descendentes se invierten; exigir "estricto" conserva la
+    # estabilidad
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+
+    if arr[run_hi] < arr[lo]:
+        while run_hi < hi and arr[run_hi] < arr[run_hi - 1]:
+            run_hi += 1
+        arr[lo:run_hi] = arr[lo:run_hi][::-1]
+    else:
+        while run_hi < hi and arr[run_hi] >= arr[run_hi - 1]:
+            run_hi += 1
+    return run_hi - lo
+
+def gallop_left(key, arr, base, length, hint):
+    # Primer i en [0, length] tal que key <= arr[base + i]. Búsqueda
+    # exponencial desde hint y luego binaria dentro del intervalo encontrado
+    last_ofs, ofs = 0, 1
+    if arr[base + hint] < key:
+        max_ofs = length - hint
+        while ofs < max_ofs and arr[base + hint + ofs] < key:
+            last_ofs, ofs = ofs, 2 * ofs + 1
+        ofs = min(ofs, max_ofs)
+        lo, hi = hint + last_ofs + 1, hint + ofs
+    else:
+        max_ofs = hint + 1
+        while ofs < max_ofs and not arr[base + hint - ofs] < key:
+            last_ofs, ofs = ofs, 2 * ofs + 1
+        ofs = min(ofs, max_ofs)
+        lo, hi = hint - ofs + 1, hint - last_ofs
+    return bisect_left(arr, key, base + lo, base + hi) - base
+
+def gallop_right(key, arr, base, length, hint):
+    # Primer i en [0, length] tal que key < arr[base + i]
+    last_ofs, ofs = 0, 1
+    if key < arr[base + hint]:
+        max_ofs = hint + 1
+        while ofs < max_ofs and key < arr[base + hint - ofs]:
+            last_ofs, ofs = ofs, 2 * ofs + 1
+        ofs = min(ofs, max_ofs)
+        lo, hi = hint - ofs + 1, hint - last_ofs
+    else:
+        max_ofs = length - hint
+        while ofs < max_ofs and not key < arr[base + hint + ofs]:
+            last_ofs, ofs = ofs, 2 * ofs + 1
+        ofs = min(ofs, max_ofs)
+        lo, hi = hint + last_ofs + 1, hint + ofs
+    return bisect_right(arr, key, base + lo, base + hi) - base
+
+def _merge_lo(arr, base1, len1, base2, len2, min_gallop):
+    # Fusión de izquierda a derecha copiando solo el tramo izquierdo (el más corto)
+    tmp = arr[base1:base1 + len1]
+    c1, c2, dest = 0, base2, base1
+
+    while len1 and len2:
+        count1 = count2 = 0
+        # Modo uno a uno hasta que un tramo gane min_gallop veces seguidas
+        while len1 and len2 and (count1 | count2) < min_gallop:
+            if arr[c2] < tmp[c1]:
+                arr[dest] = arr[c2]
+                c2 += 1
+                len2 -= 1
+                count2 += 1
+                count1 = 0
+            else:
+                arr[dest] = tmp[c1]
+                c1 += 1
+                len1 -= 1
+                count1 += 1
+                count2 = 0
+            dest += 1
+        if not (len1 and len2):
+            break
+
+        # Modo galope: mover bloques enteros mientras sigan siendo largos
+        min_gallop += 1
+        while len1 and len2:
+            min_gallop -= min_gallop > 1
+            count1 = gallop_right(arr[c2], tmp, c1, len1, 0)
+            if count1:
+                arr[dest:dest + count1] = tmp[c1:c1 + count1]
+                dest += count1
+                c1 += count1
+                len1 -= count1
+                if not len1:
+                    break
+            arr[dest] = arr[c2]
+            dest += 1
+            c2 += 1
+            len2 -= 1
+            if not len2:
+                break
+
+            count2 = gallop_left(tmp[c1], arr, c2, len2, 0)
+            if count2:
+                arr[dest:dest + count2] = arr[c2:c2 + count2]
+                dest += count2
+                c2 += count2
+                len2 -= count2
+                if not len2:
+                    break
+            arr[dest] = tmp[c1]
+            dest += 1
+            c1 += 1
+            len1 -= 1
+            if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                break
+        min_gallop += 1  # Penalización por salir del modo galope
+
+    # Lo que quede del tramo derecho ya está en su sitio
+    arr[dest:dest + len1] = tmp[c1:c1 + len1]
+    return min_gallop
+
+def _merge_hi(arr, base1, len1, base2, len2, min_gallop):
+    # Fusión de derecha a izquierda copiando solo el tramo derecho (el más corto)
+    tmp = arr[base2:base2 + len2]
+    c1, c2, dest = base1 + len1 - 1, len2 - 1, base2 + len2 - 1
+
+    while len1 and len2:
+        count1 = count2 = 0
+        while len1 and len2 and (count1 | count2) < min_gallop:
+            if tmp[c2] < arr[c1]:
+                arr[dest] = arr[c1]
+                c1 -= 1
+                len1 -= 1
+                count1 += 1
+                count2 = 0
+            else:
+                arr[dest] = tmp[c2]
+                c2 -= 1
+                len2 -= 1
+                count2 += 1
+                count1 = 0
+            dest -= 1
+        if not (len1 and len2):
+            break
+
+        min_gallop += 1
+        while len1 and len2:
+            min_gallop -= min_gallop > 1
+            count1 = len1 - gallop_right(tmp[c2], arr, base1, len1, len1 - 1)
+            if count1:
+                arr[dest - count1 + 1:dest + 1] = arr[c1 - count1 + 1:c1 + 1]
+                dest -= count1
+                c1 -= count1
+                len1 -= count1
+                if not len1:
+                    break
+            arr[dest] = tmp[c2]
+            dest -= 1
+            c2 -= 1
+            len2 -= 1
+            if not len2:
+                break
+
+            count2 = len2 - gallop_left(arr[c1], tmp, 0, len2, len2 - 1)
+            if count2:
+                arr[dest - count2 + 1:dest + 1] = tmp[c2 - count2 + 1:c2 + 1]
+                dest -= count2
+                c2 -= count2
+                len2 -= count2
+                if not len2:
+                    break
+            arr[dest] = arr[c1]
+            dest -= 1
+            c1 -= 1
+            len1 -= 1
+            if count1 < MIN_GALLOP and count2 < MIN_GALLOP:
+                break
+        min_gallop += 1
+
+    # Lo que quede del tramo izquierdo ya está en su sitio
+    arr[dest - len2 + 1:dest + 1] = tmp[:len2]
+    return min_gallop
+
+def merge(arr, l, m, r, min_gallop=MIN_GALLOP):
+    # Fusiona arr[l..m] y arr[m+1..r] (ambos ordenados). Devuelve el min_gallop
+    # actualizado para que tim_sort lo arrastre entre fusiones
+    base1, len1 = l, m - l + 1
+    base2, len2 = m + 1, r - m
+    if len1 <= 0 or len2 <= 0:
+        return min_gallop
+
+    # Los elementos del tramo izquierdo menores que el primero del derecho, y
+    # los del derecho mayores que el último del izquierdo, ya están en su sitio
+    k = gallop_right(arr[base2], arr, base1, len1, 0)
+    base1 += k
+    len1 -= k
+    if len1 == 0:
+        return min_gallop
+    len2 = gallop_left(arr[base1 + len1 - 1], arr, base2, len2, len2 - 1)
+    if len2 == 0:
+        return min_gallop
+
+    if len1 <= len2:
+        return _merge_lo(arr, base1, len1, base2, len2, min_gallop)
+    return _merge_hi(arr, base1, len1, base2, len2, min_gallop)
+
+def _merge_at(arr, runs, i, min_gallop):
+    # Fusiona los tramos i e i+1 de la pila
+    base1, len1 = runs[i]
+    len2 = runs[i + 1][1]
+    runs[i] = (base1, len1 + len2)
+    del runs[i + 1]
+    return merge(arr, base1, base1 + len1 - 1, base1 + len1 + len2 - 1, min_gallop)
+
+def _merge_collapse(arr, runs, min_gallop):
+    # Restablece los invariantes de la pila de tramos (A > B + C y B > C,
+    # siendo C el tramo del tope)
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if ((n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or
+                (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1])):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            break
+        min_gallop = _merge_at(arr, runs, n, min_gallop)
+    return min_gallop
+
+def tim_sort(arr, min_run=None, key=None, reverse=False):
+    # Estable; con key=/reverse= las claves se calculan una vez (ver Claves.py).
+    # min_run=None usa el del perfil de Autoajuste.py o compute_min_run(n)
+    if key is not None or reverse:
+        return sort_by_key(tim_sort, arr, key, reverse, min_run=min_run)
     n = len(arr)
-    
-    # Ordenar subarreglos individuales de tamaño min_run
-    for i in range(0, n, min_run):
-        insertion_sort(arr, i, min((i + min_run - 1), n - 1))
-    
-    # Comenzar a fusionar desde min_run
-    size = min_run
-    while size < n:
-        for start in range(0, n, size * 2):
-            mid = min((start + size - 1), (n - 1))
-            end = min((start + size * 2 - 1), (n - 1))
-            merge(arr, start, mid, end)
-        size *= 2
+    if n < 2:
+        return
+    if min_run is None:
+        min_run = tuned("tim_sort", arr).get("min_run") or compute_min_run(n)
+
+    runs = []  # Pila de tramos pendientes (inicio, longitud)
+    min_gallop = MIN_GALLOP
+    lo = 0
+    while lo < n:
+        # Buscar el siguiente tramo natural y extenderlo hasta min_run
+        run_len = count_run_and_make_ascending(arr, lo, n)
+        if run_len < min_run:
+            force = min(min_run, n - lo)
+            insertion_sort(arr, lo, lo + force - 1, lo + run_len)
+            run_len = force
+
+        runs.append((lo, run_len))
+        min_gallop = _merge_collapse(arr, runs, min_gallop)
+        lo += run_len
+
+    # Fusionar lo que quede en la pila
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+            n -= 1
+        min_gallop = _merge_at(arr, runs, n, min_gallop)
 
 # Ejemplo de uso
 if __name__ == "__main__":
     datos = [5, 2, 4, 7, 1, 3, 2, 6, -3, 8, 0, 12, 9, 4, 5]
     print("Arreglo original:", datos)
-    
+
     tim_sort(datos)
-    print("Arreglo ordenado:", datos)
\ No newline at end of file
+    print("Arreglo ordenado:", datos)